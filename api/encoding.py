@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import struct
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+from fastapi import HTTPException, Request, Response
+from numpy.typing import NDArray
+
+from models.engine.result import EnsembleResult, SimulationResult
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+FLOAT64 = "application/x-pyvensim-float64"
+MSGPACK = "application/msgpack"
+_MSGPACK_ALIASES = {MSGPACK, "application/x-msgpack"}
+_JSON_TYPES = {"application/json", "application/*", "*/*"}
+
+
+def available_types() -> list[str]:
+    """Binary result types this server can produce, besides JSON."""
+    types = [FLOAT64]
+    if importlib.util.find_spec("pyarrow") is not None:
+        types.append(ARROW_STREAM)
+    if importlib.util.find_spec("msgpack") is not None:
+        types.append(MSGPACK)
+    return types
+
+
+def negotiate(accept: str | None) -> str | None:
+    """Pick a binary media type from an Accept header, or None for JSON.
+
+    Entries are tried by descending quality; a header naming only types the
+    server cannot produce is answered with 406.
+    """
+    if not accept:
+        return None
+    entries: list[tuple[float, str]] = []
+    for entry in accept.split(","):
+        media_type, *params = (part.strip() for part in entry.split(";"))
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            entries.append((quality, media_type.lower()))
+
+    available = available_types()
+    for _, media_type in sorted(entries, key=lambda entry: -entry[0]):
+        if media_type in _JSON_TYPES:
+            return None
+        if media_type in _MSGPACK_ALIASES:
+            media_type = MSGPACK
+        if media_type in available:
+            return media_type
+    raise HTTPException(
+        status_code=406,
+        detail=f"Results are available as application/json or {available}",
+    )
+
+
+def requested_type(request: Request) -> str | None:
+    return negotiate(request.headers.get("accept"))
+
+
+def encode_results(
+    media_type: str, session_id: str, results: Mapping[Any, Any]
+) -> Response:
+    """Encode results as ``media_type``, chosen earlier by ``negotiate``.
+
+    Sensitivity results (an ``EnsembleResult``) keep their members keyed by
+    the same strings as in the JSON response.
+    """
+    keys: list[str] | None = None
+    if isinstance(results, EnsembleResult):
+        keys = [str(key) for key in results.member_keys]
+    elif not isinstance(results, SimulationResult):
+        results = SimulationResult.from_history(results)
+    data: NDArray[np.floating[Any]] = results.data
+    columns = results.columns
+
+    if media_type == FLOAT64:
+        body = _encode_float64(session_id, data, columns, keys)
+    elif media_type == ARROW_STREAM:
+        body = _encode_arrow(session_id, data, columns, keys)
+    else:
+        body = _encode_msgpack(session_id, data, columns, keys)
+    return Response(content=body, media_type=media_type)
+
+
+def _encode_float64(
+    session_id: str,
+    data: NDArray[np.floating[Any]],
+    columns: list[str],
+    keys: list[str] | None,
+) -> bytes:
+    # <uint32 header length><JSON header, space-padded><float64 values>; the
+    # padding puts the values at an 8-byte offset for np.frombuffer.
+    header: dict[str, Any] = {
+        "session_id": session_id,
+        "columns": columns,
+        "shape": list(data.shape),
+        "dtype": "<f8",
+    }
+    if keys is not None:
+        header["keys"] = keys
+    encoded = json.dumps(header).encode()
+    encoded += b" " * (-(len(encoded) + 4) % 8)
+    values = np.ascontiguousarray(data, dtype="<f8")
+    return struct.pack("<I", len(encoded)) + encoded + values.tobytes()
+
+
+def _encode_arrow(
+    session_id: str,
+    data: NDArray[np.floating[Any]],
+    columns: list[str],
+    keys: list[str] | None,
+) -> bytes:
+    import pyarrow as pa
+
+    if keys is None:
+        arrays = {name: data[i] for i, name in enumerate(columns)}
+    else:
+        # Ensembles are sent long: one row per member and time.
+        num_times = data.shape[2]
+        arrays = {"member": np.repeat(np.array(keys, dtype=object), num_times)}
+        arrays.update(
+            (name, data[:, i, :].reshape(-1)) for i, name in enumerate(columns)
+        )
+    table = pa.table(arrays).replace_schema_metadata({"session_id": session_id})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return bytes(sink.getvalue())
+
+
+def _encode_msgpack(
+    session_id: str,
+    data: NDArray[np.floating[Any]],
+    columns: list[str],
+    keys: list[str] | None,
+) -> bytes:
+    import msgpack
+
+    # Same layout as the JSON response.
+    if keys is None:
+        results: Any = dict(zip(columns, data.tolist()))
+    else:
+        results = {
+            key: dict(zip(columns, member))
+            for key, member in zip(keys, data.tolist())
+        }
+    payload = {"session_id": session_id, "results": results}
+    return bytes(msgpack.packb(payload, use_bin_type=True))
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import ast
+import os
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
+# Compiled expressions kept per process; clients create many scenarios that
+# share the same rate expressions.
+CACHE_SIZE_ENV = "PYVENSIM_EXPRESSION_CACHE_SIZE"
+
 
 class ExpressionError(Exception):
     """Raised when an expression is invalid or unsafe."""
@@ -112,7 +118,38 @@ def _walk(node: ast.AST, allowed_names: set[str]) -> None:
 def compile_rate_function(
     expression: str, params: list[str]
 ) -> Callable[..., float]:
-    """Validate and compile an expression string into a callable with proper signature."""
+    """Validate and compile an expression string into a callable with proper signature.
+
+    Repeated ``(expression, params)`` pairs return the function compiled the
+    first time; rate functions are pure, so scenarios can share them.
+    """
+    return _compile_cached(expression, tuple(params))
+
+
+def expression_cache_info() -> dict[str, Any]:
+    """Size and hit rate of the compiled-expression cache."""
+    info = _compile_cached.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
+def clear_expression_cache() -> None:
+    _compile_cached.cache_clear()
+
+
+@lru_cache(maxsize=int(os.environ.get(CACHE_SIZE_ENV, 4096)))
+def _compile_cached(expression: str, params: tuple[str, ...]) -> Callable[..., float]:
+    # Invalid expressions raise, and lru_cache does not keep failures.
+    return _compile(expression, list(params))
+
+
+def _compile(expression: str, params: list[str]) -> Callable[..., float]:
     validate_expression(expression, params)
     param_str = ", ".join(params)
     func_code = f"def _rate_func({param_str}):\n    return {expression}"
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from typing import Any
+
+from api.session import SessionData
+from api.worker import run_session_task
+
+# A job is a sequence of parts, each one ``Scenario`` method call run in the
+# simulation pool. Progress is the fraction of finished parts, and a
+# cancelled job stops before its next part.
+JobPart = tuple[str, dict[str, Any]]
+JobFinish = Callable[[list[tuple[Any, Any]]], dict[str, Any]]
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at its depth limit."""
+
+
+class Job:
+    """A submitted computation, its status and, once finished, its result."""
+
+    def __init__(
+        self,
+        kind: str,
+        session_id: str,
+        session: SessionData,
+        parts: list[JobPart],
+        finish: JobFinish,
+    ) -> None:
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.session_id = session_id
+        self.status = "queued"
+        self.progress = 0.0
+        self.error: str | None = None
+        self.result: dict[str, Any] | None = None
+        self.submitted_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._session = session
+        self._parts = parts
+        self._finish = finish
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "session_id": self.session_id,
+            "status": self.status,
+            "progress": self.progress,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """Runs at most ``max_running`` jobs and holds at most ``max_queued`` more.
+
+    Only the newest ``max_finished`` finished jobs are kept for polling.
+    """
+
+    def __init__(
+        self, max_running: int = 2, max_queued: int = 64, max_finished: int = 256
+    ) -> None:
+        self.max_running = max_running
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._waiting: deque[Job] = deque()
+        self._running = 0
+
+    def submit(
+        self,
+        kind: str,
+        session_id: str,
+        session: SessionData,
+        parts: list[JobPart],
+        finish: JobFinish,
+    ) -> Job:
+        """Queue a job; must be called from the event loop that will run it."""
+        if len(self._waiting) >= self.max_queued:
+            raise QueueFullError(f"Job queue is full ({self.max_queued} waiting)")
+        job = Job(kind, session_id, session, parts, finish)
+        self._jobs[job.job_id] = job
+        self._waiting.append(job)
+        self._start_waiting()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Job | None:
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return job
+        if job.status == "queued":
+            self._waiting.remove(job)
+            job.finished_at = time.time()
+        elif job._task is not None:
+            # A part already running in a worker finishes; its output is dropped.
+            job._task.cancel()
+        job.status = "cancelled"
+        return job
+
+    def _start_waiting(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._waiting and self._running < self.max_running:
+            job = self._waiting.popleft()
+            self._running += 1
+            job._task = loop.create_task(self._run(job))
+
+    async def _run(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        outputs: list[tuple[Any, Any]] = []
+        try:
+            for method, kwargs in job._parts:
+                outputs.append(await run_session_task(job._session, method, **kwargs))
+                job.progress = len(outputs) / len(job._parts)
+            job.result = job._finish(outputs)
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:  # reported through the job status
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            self._running -= 1
+            self._forget_finished()
+            self._start_waiting()
+
+    def _forget_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(len(finished) - self.max_finished, 0)]:
+            del self._jobs[job_id]
+
+
+def split_parts(values: list[Any], num_parts: int = 10) -> list[list[Any]]:
+    """Split sweep values into up to ``num_parts`` contiguous, non-empty parts."""
+    size = max(-(-len(values) // num_parts), 1)
+    return [values[i : i + size] for i in range(0, len(values), size)]
+
+
+queue = JobQueue(
+    max_running=int(os.environ.get("PYVENSIM_API_MAX_JOBS", 2)),
+    max_queued=int(os.environ.get("PYVENSIM_API_MAX_QUEUED_JOBS", 64)),
+)
@@ -1,12 +1,36 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from api.routes import scenarios, sensitivity, shocks
+from api.expression import expression_cache_info
+from api.routes import (
+    assimilation,
+    calibration,
+    jobs,
+    scenarios,
+    sensitivity,
+    shocks,
+)
+from api.session import store
+from api.worker import configure_pool, configured_workers, shutdown_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Workers are sized once at startup from PYVENSIM_API_WORKERS.
+    configure_pool(configured_workers())
+    yield
+    shutdown_pool()
+
 
 app = FastAPI(
     title="pyvensim API",
     description="REST API for the pyvensim system dynamics simulation library",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -22,8 +46,20 @@ app.include_router(
     sensitivity.router, prefix="/scenarios", tags=["sensitivity"]
 )
 app.include_router(shocks.router, prefix="/scenarios", tags=["shocks"])
+app.include_router(
+    assimilation.router, prefix="/scenarios", tags=["assimilation"]
+)
+app.include_router(
+    calibration.router, prefix="/scenarios", tags=["calibration"]
+)
+app.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
 
 
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@app.get("/metrics")
+def metrics() -> dict[str, dict[str, Any]]:
+    return {"sessions": store.metrics(), "expressions": expression_cache_info()}
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException
+
+from api.schemas import AssimilationRequest, AssimilationResponse
+from api.session import store
+from models.calibration.assimilation import EnsembleKalmanFilter
+
+router = APIRouter()
+
+
+@router.post("/{session_id}/assimilate", response_model=AssimilationResponse)
+def assimilate(
+    session_id: str, request: AssimilationRequest
+) -> AssimilationResponse:
+    """Correct the session's ensemble with a batch of observations."""
+    session = store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    try:
+        if session.assimilation is None or request.reset:
+            session.assimilation = EnsembleKalmanFilter(
+                session.scenario,
+                num_members=request.num_members,
+                dt=request.dt,
+                observation_noise=request.observation_noise,
+                initial_spread=request.initial_spread,
+                seed=request.seed,
+            )
+        analyses = [
+            session.assimilation.assimilate(observation.time, observation.values)
+            for observation in sorted(request.observations, key=lambda o: o.time)
+        ]
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    return AssimilationResponse(session_id=session_id, analyses=analyses)
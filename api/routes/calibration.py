@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from fastapi import APIRouter, HTTPException
+
+from api.routes.jobs import submit_job
+from api.schemas import CalibrationRequest, CalibrationResponse, JobResponse
+from api.session import SessionData, store
+from api.worker import run_session_task
+
+router = APIRouter()
+
+
+@router.post("/{session_id}/calibrate", response_model=CalibrationResponse)
+async def calibrate(
+    session_id: str, request: CalibrationRequest
+) -> CalibrationResponse:
+    """Fit the scenario's auxiliaries to observed data."""
+    session = store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    try:
+        params, _ = await run_session_task(
+            session, "calibrate", **_calibration_kwargs(request)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    parameters = _apply_parameters(session, params)
+    store.save(session_id, session)
+    return CalibrationResponse(session_id=session_id, parameters=parameters)
+
+
+@router.post(
+    "/{session_id}/calibrate/jobs", response_model=JobResponse, status_code=202
+)
+async def submit_calibration(
+    session_id: str, request: CalibrationRequest
+) -> JobResponse:
+    """Queue a calibration as a background job."""
+    try:
+        kwargs = _calibration_kwargs(request)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    def finish(outputs: list[tuple[Any, Any]]) -> dict[str, Any]:
+        params, _ = outputs[0]
+        session = store.get(session_id)
+        parameters: dict[str, float] = {}
+        if session is not None:
+            parameters = _apply_parameters(session, params)
+            store.save(session_id, session)
+        return CalibrationResponse(
+            session_id=session_id, parameters=parameters
+        ).model_dump()
+
+    return submit_job(session_id, "calibrate", [("calibrate", kwargs)], finish)
+
+
+def _calibration_kwargs(request: CalibrationRequest) -> dict[str, Any]:
+    data = pd.DataFrame(
+        {name: np.array(values, dtype=float) for name, values in request.data.items()}
+    )
+    return {
+        "data": data,
+        "method": request.method,
+        "simulation_time": request.simulation_time,
+        "dt": request.dt,
+        "bounds": request.bounds,
+        "time_column": request.time_column,
+        "weights": request.weights,
+        "time_origin": request.time_origin,
+    }
+
+
+def _apply_parameters(session: SessionData, params: Any) -> dict[str, float]:
+    # Calibration fits one value per auxiliary, as Calibrator does in-process.
+    fitted = {
+        aux.name: float(value)
+        for aux, value in zip(session.scenario.auxiliaries, params)
+    }
+    for aux in session.scenario.auxiliaries:
+        aux.values = fitted[aux.name]
+    if session.definition is not None:
+        for aux_schema in session.definition.auxiliaries:
+            aux_schema.values = fitted.get(aux_schema.name, aux_schema.values)
+    return fitted
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException
+
+from api.jobs import JobFinish, JobPart, QueueFullError, queue
+from api.schemas import JobResponse, JobResultResponse
+from api.session import store
+
+router = APIRouter()
+
+
+def submit_job(
+    session_id: str, kind: str, parts: list[JobPart], finish: JobFinish
+) -> JobResponse:
+    """Queue a job for a session, answering 404 or 429 like the routes do."""
+    session = store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    try:
+        job = queue.submit(kind, session_id, session, parts, finish)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e)) from e
+    return JobResponse(**job.describe())
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: str) -> JobResponse:
+    """Report a job's status and progress."""
+    job = queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(**job.describe())
+
+
+@router.get("/{job_id}/result", response_model=JobResultResponse)
+def get_job_result(job_id: str) -> JobResultResponse:
+    """Fetch the result of a finished job."""
+    job = queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "failed":
+        raise HTTPException(status_code=422, detail=f"Job failed: {job.error}")
+    if job.result is None:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return JobResultResponse(job_id=job_id, result=job.result)
+
+
+@router.delete("/{job_id}", response_model=JobResponse)
+async def cancel_job(job_id: str) -> JobResponse:
+    """Cancel a queued or running job."""
+    job = queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(**job.describe())
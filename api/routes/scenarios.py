@@ -1,21 +1,26 @@
 from __future__ import annotations
 
-from typing import Any
+import json
+from collections.abc import Iterator
+from typing import Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
-from api.expression import ExpressionError, compile_rate_function
+from api.encoding import encode_results, requested_type
+from api.expression import ExpressionError
 from api.schemas import (
     CreateScenarioRequest,
     CreateScenarioResponse,
     ResultsResponse,
     RunRequest,
     RunResponse,
+    RunStreamRequest,
     SessionListResponse,
 )
-from api.session import store
-from models.core.auxiliary import Auxiliary
-from models.scenario.scenario import Scenario
+from api.session import SessionData, store
+from api.worker import build_scenario, run_session_task
+from models.engine.result import SimulationResult
 
 router = APIRouter()
 
@@ -29,36 +34,12 @@ def list_scenarios() -> SessionListResponse:
 @router.post("/", response_model=CreateScenarioResponse, status_code=201)
 def create_scenario(request: CreateScenarioRequest) -> CreateScenarioResponse:
     """Create a scenario from a full model definition."""
-    auxiliaries: list[Auxiliary] = []
-    for aux_schema in request.auxiliaries:
-        auxiliaries.append(Auxiliary(aux_schema.name, aux_schema.values))
-
-    rates: dict[str, dict[str, Any]] = {}
-    for rate_name, rate_schema in request.rates.items():
-        try:
-            rate_fn = compile_rate_function(
-                rate_schema.expression, rate_schema.params
-            )
-        except ExpressionError as e:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Invalid expression for rate '{rate_name}': {e}",
-            ) from e
-
-        rates[rate_name] = {
-            "rate_function": rate_fn,
-            "source": rate_schema.source,
-            "destination": rate_schema.destination,
-        }
-
-    scenario = Scenario(
-        name=request.name,
-        initial_values=dict(request.initial_values),
-        rates=rates,
-        auxiliaries=auxiliaries,
-    )
+    try:
+        scenario = build_scenario(request)
+    except ExpressionError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
 
-    session_id = store.create(scenario)
+    session_id = store.create(scenario, definition=request)
 
     return CreateScenarioResponse(
         session_id=session_id,
@@ -68,38 +49,95 @@ def create_scenario(request: CreateScenarioRequest) -> CreateScenarioResponse:
 
 
 @router.post("/{session_id}/run", response_model=RunResponse)
-def run_scenario(session_id: str, request: RunRequest) -> RunResponse:
+async def run_scenario(
+    session_id: str, request: RunRequest, http_request: Request
+) -> RunResponse | Response:
     """Run the simulation for the given scenario."""
+    media_type = requested_type(http_request)
     session = store.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Reset auxiliary timesteps before each run
-    for aux in session.scenario.auxiliaries:
-        aux.current_time_step = 0
-
     try:
-        results = session.scenario.run(request.simulation_time, request.dt)
+        results, _ = await run_session_task(
+            session,
+            "run",
+            simulation_time=request.simulation_time,
+            dt=request.dt,
+        )
     except (ValueError, ZeroDivisionError, OverflowError) as e:
         raise HTTPException(
             status_code=422, detail=f"Simulation error: {e}"
         ) from e
 
-    session.results = results
+    session.results = session.scenario.results = results
+    store.save(session_id, session)
+    if media_type is not None:
+        return encode_results(media_type, session_id, results)
     return RunResponse(session_id=session_id, results=results)
 
 
+@router.post("/{session_id}/run/stream")
+def stream_scenario(
+    session_id: str, request: RunStreamRequest, http_request: Request
+) -> StreamingResponse:
+    """Stream the run in chunks as NDJSON, or as SSE for text/event-stream.
+
+    NDJSON lines are ``{"event": ..., "data": ...}`` objects, like SSE events,
+    and both end with an ``end`` event.
+    """
+    session = store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    return StreamingResponse(
+        _stream_frames(session, request, sse),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+    )
+
+
 @router.get("/{session_id}/results", response_model=ResultsResponse)
-def get_results(session_id: str) -> ResultsResponse:
-    """Retrieve cached results from the last run."""
+def get_results(
+    session_id: str,
+    http_request: Request,
+    variables: list[str] | None = Query(default=None),
+    start: float | None = None,
+    stop: float | None = None,
+    stride: int = Query(default=1, ge=1),
+    max_points: int | None = Query(default=None, ge=3),
+    downsample: Literal["minmax", "lttb"] = "minmax",
+) -> ResultsResponse | Response:
+    """Retrieve cached results, optionally windowed and downsampled.
+
+    ``max_points`` caps the steps kept per variable after the window and
+    stride are applied.
+    """
+    media_type = requested_type(http_request)
     session = store.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    results = session.results
+    if results is None and media_type is not None:
+        # A binary body has no way to say "no results", unlike the JSON one.
+        raise HTTPException(status_code=404, detail="Session has no results yet")
+    if results is not None:
+        if not isinstance(results, SimulationResult):
+            results = SimulationResult.from_history(results)
+        try:
+            results = results.select(variables, start, stop, stride)
+        except KeyError as e:
+            raise HTTPException(status_code=422, detail=e.args[0]) from e
+        if max_points is not None:
+            results = results.downsample(max_points, downsample)
+        if media_type is not None:
+            return encode_results(media_type, session_id, results)
+
     return ResultsResponse(
         session_id=session_id,
-        has_results=session.results is not None,
-        results=session.results,
+        has_results=results is not None,
+        results=results,
     )
 
 
@@ -108,3 +146,33 @@ def delete_scenario(session_id: str) -> None:
     """Delete a session."""
     if not store.delete(session_id):
         raise HTTPException(status_code=404, detail="Session not found")
+
+
+def _stream_frames(
+    session: SessionData, request: RunStreamRequest, sse: bool
+) -> Iterator[str]:
+    # Starlette iterates this generator in its threadpool, one chunk at a time,
+    # so only the chunk being encoded is held in memory. Streamed runs are not
+    # stored as the session's results.
+    scenario = (
+        session.scenario
+        if session.definition is None
+        else build_scenario(session.definition)
+    )
+    simulation = scenario.construct_simulation()
+    chunks = simulation.run_chunks(
+        request.simulation_time, request.dt, request.chunk_size
+    )
+    try:
+        for chunk in chunks:
+            yield _frame("chunk", chunk, sse)
+    except (ValueError, ZeroDivisionError, OverflowError) as e:
+        yield _frame("error", {"error": f"Simulation error: {e}"}, sse)
+        return
+    yield _frame("end", {}, sse)
+
+
+def _frame(event: str, payload: dict[str, object], sse: bool) -> str:
+    if sse:
+        return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+    return json.dumps({"event": event, "data": payload}) + "\n"
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from typing import Any
 
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from api.encoding import encode_results, requested_type
+from api.jobs import JobFinish, split_parts
+from api.routes.jobs import submit_job
 from api.schemas import (
+    JobResponse,
+    MorrisResponse,
+    SensitivityMorrisRequest,
     SensitivityMultivariateRequest,
     SensitivityResponse,
     SensitivityUnivariateRequest,
 )
 from api.session import store
+from api.worker import run_session_task
 
 router = APIRouter()
 
@@ -16,46 +25,178 @@ router = APIRouter()
     "/{session_id}/sensitivity/univariate",
     response_model=SensitivityResponse,
 )
-def run_sensitivity_univariate(
-    session_id: str, request: SensitivityUnivariateRequest
-) -> SensitivityResponse:
+async def run_sensitivity_univariate(
+    session_id: str, request: SensitivityUnivariateRequest, http_request: Request
+) -> SensitivityResponse | Response:
     """Run univariate sensitivity analysis."""
+    media_type = requested_type(http_request)
     session = store.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    raw_results = session.scenario.run_sensitivity_analysis_univariate(
-        component_name=request.component_name,
-        parameter=request.parameter,
-        range_values=request.range_values,
-        until=request.simulation_time,
-        dt=request.dt,
+    raw_results, _ = await run_session_task(
+        session,
+        "run_sensitivity_analysis_univariate",
+        **_univariate_kwargs(request, request.range_values),
     )
 
+    if media_type is not None:
+        return encode_results(media_type, session_id, raw_results)
     results = {str(k): v for k, v in raw_results.items()}
     return SensitivityResponse(session_id=session_id, results=results)
 
 
+@router.post(
+    "/{session_id}/sensitivity/univariate/jobs",
+    response_model=JobResponse,
+    status_code=202,
+)
+async def submit_sensitivity_univariate(
+    session_id: str, request: SensitivityUnivariateRequest
+) -> JobResponse:
+    """Queue univariate sensitivity analysis as a background job."""
+    parts = [
+        ("run_sensitivity_analysis_univariate", _univariate_kwargs(request, values))
+        for values in split_parts(request.range_values)
+    ]
+    return submit_job(
+        session_id, "sensitivity_univariate", parts, _sweep_finish(session_id)
+    )
+
+
 @router.post(
     "/{session_id}/sensitivity/multivariate",
     response_model=SensitivityResponse,
 )
-def run_sensitivity_multivariate(
-    session_id: str, request: SensitivityMultivariateRequest
-) -> SensitivityResponse:
+async def run_sensitivity_multivariate(
+    session_id: str, request: SensitivityMultivariateRequest, http_request: Request
+) -> SensitivityResponse | Response:
     """Run multivariate sensitivity analysis."""
+    media_type = requested_type(http_request)
     session = store.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
     combinations = [tuple(c) for c in request.combinations]
 
-    raw_results = session.scenario.run_sensitivity_analysis_multivariate(
-        parameters=request.parameters,
-        param_combinations=combinations,
-        until=request.simulation_time,
-        dt=request.dt,
+    raw_results, _ = await run_session_task(
+        session,
+        "run_sensitivity_analysis_multivariate",
+        **_multivariate_kwargs(request, combinations),
     )
 
+    if media_type is not None:
+        return encode_results(media_type, session_id, raw_results)
     results = {str(k): v for k, v in raw_results.items()}
     return SensitivityResponse(session_id=session_id, results=results)
+
+
+@router.post(
+    "/{session_id}/sensitivity/multivariate/jobs",
+    response_model=JobResponse,
+    status_code=202,
+)
+async def submit_sensitivity_multivariate(
+    session_id: str, request: SensitivityMultivariateRequest
+) -> JobResponse:
+    """Queue multivariate sensitivity analysis as a background job."""
+    combinations = [tuple(c) for c in request.combinations]
+    method = "run_sensitivity_analysis_multivariate"
+    parts = [
+        (method, _multivariate_kwargs(request, chunk))
+        for chunk in split_parts(combinations)
+    ]
+    return submit_job(
+        session_id, "sensitivity_multivariate", parts, _sweep_finish(session_id)
+    )
+
+
+@router.post(
+    "/{session_id}/sensitivity/morris",
+    response_model=MorrisResponse,
+)
+async def run_sensitivity_morris(
+    session_id: str, request: SensitivityMorrisRequest
+) -> MorrisResponse:
+    """Run Morris elementary-effects screening."""
+    session = store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    try:
+        results, _ = await run_session_task(
+            session, "run_sensitivity_analysis_morris", **_morris_kwargs(request)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    return MorrisResponse(session_id=session_id, results=results)
+
+
+@router.post(
+    "/{session_id}/sensitivity/morris/jobs",
+    response_model=JobResponse,
+    status_code=202,
+)
+async def submit_sensitivity_morris(
+    session_id: str, request: SensitivityMorrisRequest
+) -> JobResponse:
+    """Queue Morris screening as a background job."""
+
+    def finish(outputs: list[tuple[Any, Any]]) -> dict[str, Any]:
+        results, _ = outputs[0]
+        return MorrisResponse(session_id=session_id, results=results).model_dump()
+
+    parts = [("run_sensitivity_analysis_morris", _morris_kwargs(request))]
+    return submit_job(session_id, "sensitivity_morris", parts, finish)
+
+
+def _univariate_kwargs(
+    request: SensitivityUnivariateRequest, range_values: list[float]
+) -> dict[str, Any]:
+    return {
+        "component_name": request.component_name,
+        "parameter": request.parameter,
+        "range_values": range_values,
+        "until": request.simulation_time,
+        "dt": request.dt,
+    }
+
+
+def _multivariate_kwargs(
+    request: SensitivityMultivariateRequest, combinations: list[tuple[Any, ...]]
+) -> dict[str, Any]:
+    return {
+        "parameters": request.parameters,
+        "param_combinations": combinations,
+        "until": request.simulation_time,
+        "dt": request.dt,
+    }
+
+
+def _morris_kwargs(request: SensitivityMorrisRequest) -> dict[str, Any]:
+    return {
+        "parameters": [
+            {"component": p.component, "name": p.name} for p in request.parameters
+        ],
+        "bounds": [(p.lower, p.upper) for p in request.parameters],
+        "outputs": request.outputs,
+        "reduction": request.reduction,
+        "num_trajectories": request.num_trajectories,
+        "num_levels": request.num_levels,
+        "until": request.simulation_time,
+        "dt": request.dt,
+        "seed": request.seed,
+        "max_workers": request.max_workers,
+    }
+
+
+def _sweep_finish(session_id: str) -> JobFinish:
+    # Each part swept a slice of the values; their members are merged in order.
+    def finish(outputs: list[tuple[Any, Any]]) -> dict[str, Any]:
+        results = {
+            str(k): v for ensemble, _ in outputs for k, v in ensemble.items()
+        }
+        return SensitivityResponse(session_id=session_id, results=results).model_dump()
+
+    return finish
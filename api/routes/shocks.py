@@ -1,20 +1,53 @@
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import APIRouter, HTTPException
 
-from api.schemas import ShockRequest, ShockResponse
+from api.routes.jobs import submit_job
+from api.schemas import JobResponse, ShockRequest, ShockResponse
 from api.session import store
+from api.worker import run_session_task
 
 router = APIRouter()
 
 
 @router.post("/{session_id}/shocks", response_model=ShockResponse)
-def apply_shock(session_id: str, request: ShockRequest) -> ShockResponse:
+async def apply_shock(session_id: str, request: ShockRequest) -> ShockResponse:
     """Apply a shock over a period and return results."""
     session = store.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    try:
+        _, results = await run_session_task(
+            session, "apply_shock_over_period", **_shock_kwargs(request)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    session.results = session.scenario.results = results
+    store.save(session_id, session)
+    return ShockResponse(session_id=session_id, results=results)
+
+
+@router.post("/{session_id}/shocks/jobs", response_model=JobResponse, status_code=202)
+async def submit_shock(session_id: str, request: ShockRequest) -> JobResponse:
+    """Queue a shock run as a background job."""
+
+    def finish(outputs: list[tuple[Any, Any]]) -> dict[str, Any]:
+        _, results = outputs[0]
+        session = store.get(session_id)
+        if session is not None:
+            session.results = session.scenario.results = results
+            store.save(session_id, session)
+        return ShockResponse(session_id=session_id, results=results).model_dump()
+
+    parts = [("apply_shock_over_period", _shock_kwargs(request))]
+    return submit_job(session_id, "shocks", parts, finish)
+
+
+def _shock_kwargs(request: ShockRequest) -> dict[str, Any]:
     components = {
         name: {
             "component_type": shock.component_type,
@@ -24,15 +57,8 @@ def apply_shock(session_id: str, request: ShockRequest) -> ShockResponse:
         }
         for name, shock in request.components.items()
     }
-
-    try:
-        session.scenario.apply_shock_over_period(
-            components, until=request.simulation_time, dt=request.dt
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-
-    session.results = session.scenario.results
-    return ShockResponse(
-        session_id=session_id, results=session.scenario.results
-    )
+    return {
+        "components": components,
+        "until": request.simulation_time,
+        "dt": request.dt,
+    }
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import os
+from typing import Any
+
 from pydantic import BaseModel, Field
 
+# Upper bound on the runs one request may execute in parallel.
+MAX_PARALLEL_RUNS = os.cpu_count() or 1
+
 
 class AuxiliarySchema(BaseModel):
     """An auxiliary variable: constant, time-series list, or null."""
@@ -37,6 +43,12 @@ class RunRequest(BaseModel):
     dt: float = Field(gt=0, default=1.0)
 
 
+class RunStreamRequest(RunRequest):
+    """Parameters for a run streamed in chunks of ``chunk_size`` steps."""
+
+    chunk_size: int = Field(gt=0, default=256)
+
+
 class SensitivityUnivariateRequest(BaseModel):
     """Request for univariate sensitivity analysis."""
 
@@ -56,6 +68,29 @@ class SensitivityMultivariateRequest(BaseModel):
     dt: float = Field(gt=0, default=1.0)
 
 
+class MorrisParameterSchema(BaseModel):
+    """A parameter screened by the Morris method and its sampling range."""
+
+    component: str
+    name: str
+    lower: float
+    upper: float
+
+
+class SensitivityMorrisRequest(BaseModel):
+    """Request for Morris elementary-effects screening."""
+
+    parameters: list[MorrisParameterSchema]
+    outputs: list[str]
+    reduction: str = "mean"
+    num_trajectories: int = Field(gt=0, default=10)
+    num_levels: int = Field(gt=1, default=4)
+    seed: int | None = None
+    max_workers: int = Field(gt=0, le=MAX_PARALLEL_RUNS, default=1)
+    simulation_time: float = Field(gt=0, default=100)
+    dt: float = Field(gt=0, default=1.0)
+
+
 class ShockComponentSchema(BaseModel):
     """A single shock component definition."""
 
@@ -73,6 +108,45 @@ class ShockRequest(BaseModel):
     dt: float = Field(gt=0, default=1.0)
 
 
+class ObservationSchema(BaseModel):
+    """Observed stock values at one simulation time."""
+
+    time: float = Field(ge=0)
+    values: dict[str, float]
+
+
+class AssimilationRequest(BaseModel):
+    """A batch of observations for the session's ensemble Kalman filter.
+
+    The filter is created on the first batch (or when ``reset`` is set) with
+    the given ensemble settings and reused for later batches.
+    """
+
+    observations: list[ObservationSchema]
+    num_members: int = Field(gt=1, default=50)
+    observation_noise: float | dict[str, float] = 1.0
+    initial_spread: float = Field(ge=0, default=0.1)
+    seed: int | None = None
+    dt: float = Field(gt=0, default=1.0)
+    reset: bool = False
+
+
+class CalibrationRequest(BaseModel):
+    """Observed stock series to fit the scenario's auxiliaries to.
+
+    ``data`` maps column names to values; missing observations are null.
+    """
+
+    data: dict[str, list[float | None]]
+    method: str = "least_squares"
+    simulation_time: float = Field(gt=0, default=91)
+    dt: float = Field(gt=0, default=1.0)
+    bounds: list[tuple[float, float]] | None = None
+    time_column: str | None = None
+    weights: dict[str, float] | None = None
+    time_origin: float = 0
+
+
 # ── Response Models ──
 
 
@@ -98,11 +172,49 @@ class SensitivityResponse(BaseModel):
     results: dict[str, dict[str, list[float]]]
 
 
+class MorrisResponse(BaseModel):
+    session_id: str
+    results: dict[str, dict[str, dict[str, float]]]
+
+
 class ShockResponse(BaseModel):
     session_id: str
     results: dict[str, list[float]] | None = None
 
 
+class CalibrationResponse(BaseModel):
+    session_id: str
+    parameters: dict[str, float]
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    kind: str
+    session_id: str
+    status: str
+    progress: float
+    error: str | None = None
+    submitted_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+
+
+class JobResultResponse(BaseModel):
+    job_id: str
+    result: dict[str, Any]
+
+
+class AnalysisSchema(BaseModel):
+    time: float
+    mean: dict[str, float]
+    std: dict[str, float]
+
+
+class AssimilationResponse(BaseModel):
+    session_id: str
+    analyses: list[AnalysisSchema]
+
+
 class SessionListResponse(BaseModel):
     sessions: list[dict[str, str]]
 
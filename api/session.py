@@ -1,44 +1,238 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
 import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any
 
+import numpy as np
+
+from api.schemas import CreateScenarioRequest
+from models.calibration.assimilation import EnsembleKalmanFilter
 from models.scenario.scenario import Scenario
 
+# Rough cost of a session without results: scenario objects and definition.
+SESSION_OVERHEAD_BYTES = 4096
+
+
+def estimate_result_bytes(results: Mapping[str, Any] | None) -> int:
+    """Approximate memory held by cached results."""
+    if results is None:
+        return 0
+    data = getattr(results, "data", None)
+    if isinstance(data, np.ndarray):
+        return int(data.nbytes)
+    return sum(8 * len(series) for series in results.values())
+
 
 class SessionData:
-    """Holds a scenario and its cached results."""
+    """Holds a scenario, its definition, cached results and assimilation filter.
+
+    The definition is what simulation workers receive to rebuild the scenario.
+    Assigning ``results`` re-estimates their size and lets the owning store
+    enforce its memory budget.
+    """
 
     def __init__(
         self,
         scenario: Scenario,
-        results: dict[str, list[float]] | None = None,
+        results: Mapping[str, list[float]] | None = None,
+        definition: CreateScenarioRequest | None = None,
+        on_resize: Callable[[], None] | None = None,
     ) -> None:
         self.scenario = scenario
+        self.definition = definition
+        self.assimilation: EnsembleKalmanFilter | None = None
+        self.last_access = time.monotonic()
+        self.result_bytes = 0
+        self._on_resize = on_resize
         self.results = results
 
+    @property
+    def results(self) -> Mapping[str, list[float]] | None:
+        return self._results
+
+    @results.setter
+    def results(self, results: Mapping[str, list[float]] | None) -> None:
+        self._results = results
+        self.result_bytes = estimate_result_bytes(results)
+        if self._on_resize is not None:
+            self._on_resize()
+
+    @property
+    def nbytes(self) -> int:
+        aux_values = sum(
+            len(aux.values) if isinstance(aux.values, list) else 1
+            for aux in self.scenario.auxiliaries
+        )
+        return SESSION_OVERHEAD_BYTES + 8 * aux_values + self.result_bytes
+
+
+class SessionBackend(ABC):
+    """Where the API keeps sessions.
+
+    Routes that change a session's results or definition call ``save`` so
+    that backends shared between server processes see the change.
+    """
+
+    @abstractmethod
+    def create(
+        self, scenario: Scenario, definition: CreateScenarioRequest | None = None
+    ) -> str: ...
+
+    @abstractmethod
+    def get(self, session_id: str) -> SessionData | None: ...
+
+    @abstractmethod
+    def save(self, session_id: str, session: SessionData) -> None: ...
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool: ...
+
+    @abstractmethod
+    def list_sessions(self) -> list[dict[str, str]]: ...
 
-class SessionStore:
-    """In-memory session store keyed by UUID."""
+    @abstractmethod
+    def metrics(self) -> dict[str, Any]: ...
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, SessionData] = {}
 
-    def create(self, scenario: Scenario) -> str:
-        session_id = uuid.uuid4().hex
-        self._sessions[session_id] = SessionData(scenario=scenario)
+class SessionStore(SessionBackend):
+    """In-memory session store keyed by UUID.
+
+    Sessions idle for longer than ``ttl`` seconds expire. When the estimated
+    resident size exceeds ``max_bytes``, cached results are dropped from the
+    least recently used sessions first, then whole sessions. ``None`` turns
+    either limit off. Routes run in a threadpool, so every method holds a
+    lock; it is re-entrant because assigning results re-checks the budget.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.RLock()
+        # Least recently used first.
+        self._sessions: OrderedDict[str, SessionData] = OrderedDict()
+        self.evicted_results = 0
+        self.evicted_sessions = 0
+        self.expired_sessions = 0
+
+    def create(
+        self, scenario: Scenario, definition: CreateScenarioRequest | None = None
+    ) -> str:
+        with self._lock:
+            self._expire()
+            session_id = uuid.uuid4().hex
+            session = SessionData(
+                scenario=scenario,
+                definition=definition,
+                on_resize=self._enforce_budget,
+            )
+            session.last_access = self._clock()
+            self._sessions[session_id] = session
+            self._enforce_budget()
         return session_id
 
     def get(self, session_id: str) -> SessionData | None:
-        return self._sessions.get(session_id)
+        with self._lock:
+            self._expire()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_access = self._clock()
+                self._sessions.move_to_end(session_id)
+        return session
+
+    def save(self, session_id: str, session: SessionData) -> None:
+        # Sessions are held by reference; assigning results already
+        # re-checked the budget.
+        pass
 
     def delete(self, session_id: str) -> bool:
-        return self._sessions.pop(session_id, None) is not None
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
 
     def list_sessions(self) -> list[dict[str, str]]:
-        return [
-            {"session_id": sid, "name": data.scenario.name}
-            for sid, data in self._sessions.items()
-        ]
+        with self._lock:
+            self._expire()
+            return [
+                {"session_id": sid, "name": data.scenario.name}
+                for sid, data in self._sessions.items()
+            ]
+
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(session.nbytes for session in self._sessions.values())
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            self._expire()
+            return {
+                "sessions": len(self._sessions),
+                "sessions_with_results": sum(
+                    session.results is not None
+                    for session in self._sessions.values()
+                ),
+                "resident_bytes": self.resident_bytes(),
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "evicted_results": self.evicted_results,
+                "evicted_sessions": self.evicted_sessions,
+                "expired_sessions": self.expired_sessions,
+            }
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+        with self._lock:
+            cutoff = self._clock() - self.ttl
+            while self._sessions:
+                session_id, session = next(iter(self._sessions.items()))
+                if session.last_access > cutoff:
+                    break
+                del self._sessions[session_id]
+                self.expired_sessions += 1
+
+    def _enforce_budget(self) -> None:
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            resident = self.resident_bytes()
+            for session in list(self._sessions.values()):
+                if resident <= self.max_bytes:
+                    return
+                if session.results is not None:
+                    resident -= session.result_bytes
+                    # Cleared directly: the setter would re-enter this method.
+                    session._results = None
+                    session.result_bytes = 0
+                    self.evicted_results += 1
+            while resident > self.max_bytes and len(self._sessions) > 1:
+                _, session = self._sessions.popitem(last=False)
+                resident -= session.nbytes
+                self.evicted_sessions += 1
+
+
+def _default_store() -> SessionBackend:
+    # A database file lets several server processes share sessions.
+    ttl = float(os.environ.get("PYVENSIM_SESSION_TTL", 3600))
+    database = os.environ.get("PYVENSIM_SESSION_DB")
+    if database:
+        from api.session_db import SqliteSessionStore
+
+        return SqliteSessionStore(database, ttl=ttl)
+    return SessionStore(
+        ttl=ttl,
+        max_bytes=int(os.environ.get("PYVENSIM_SESSION_MAX_BYTES", 1 << 30)),
+    )
 
 
-store = SessionStore()
+store = _default_store()
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from api.schemas import CreateScenarioRequest
+from api.session import SessionBackend, SessionData
+from models.calibration.assimilation import EnsembleKalmanFilter
+from models.engine.result import SimulationResult
+from models.scenario.scenario import Scenario
+
+# Fraction of the TTL after which a read refreshes ``last_access``.
+TOUCH_FRACTION = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    definition TEXT NOT NULL,
+    columns TEXT,
+    results BLOB,
+    version INTEGER NOT NULL DEFAULT 0,
+    last_access REAL NOT NULL
+)
+"""
+
+
+def pack_results(
+    results: Mapping[str, Any] | None,
+) -> tuple[str | None, bytes | None]:
+    """Column names as JSON and the (S, T) values as little-endian float64."""
+    if results is None:
+        return None, None
+    if not isinstance(results, SimulationResult):
+        results = SimulationResult.from_history(results)
+    values = np.ascontiguousarray(results.data, dtype="<f8")
+    return json.dumps(results.columns), values.tobytes()
+
+
+def unpack_results(
+    columns: str | None, blob: bytes | None
+) -> SimulationResult | None:
+    if columns is None or blob is None:
+        return None
+    names = json.loads(columns)
+    data = np.frombuffer(blob, dtype="<f8").reshape(len(names), -1)
+    # frombuffer views are read-only; results are edited in place elsewhere.
+    return SimulationResult(data.copy(), names)
+
+
+class SqliteSessionStore(SessionBackend):
+    """Session store in a SQLite file shared by several server processes.
+
+    Definitions are stored as JSON, expression source included, and results
+    as raw float64 blobs. Each process keeps up to ``cache_size`` compiled
+    sessions and rebuilds one only when another process has saved a newer
+    version. Assimilation filters stay in the process that created them,
+    apart from the cache so that neither eviction nor a rebuild drops them.
+    Reads refresh a session's ``last_access`` at most once per tenth of the
+    TTL, so a session may expire that much early; without a TTL they leave
+    it alone.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: float | None = None,
+        cache_size: int = 64,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.cache_size = cache_size
+        # Wall-clock time, so that processes agree on when sessions expire.
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        # session_id -> (version, session), least recently used first.
+        self._cache: OrderedDict[str, tuple[int, SessionData]] = OrderedDict()
+        # Filters of sessions that are not cached right now.
+        self._filters: dict[str, EnsembleKalmanFilter] = {}
+        self.expired_sessions = 0
+        self.rebuilt_sessions = 0
+
+    def create(
+        self, scenario: Scenario, definition: CreateScenarioRequest | None = None
+    ) -> str:
+        if definition is None:
+            raise ValueError("Shared sessions need the scenario definition")
+        session_id = uuid.uuid4().hex
+        with self._lock, self._connect() as db:
+            self._expire(db)
+            db.execute(
+                "INSERT INTO sessions (session_id, name, definition, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    session_id,
+                    scenario.name,
+                    definition.model_dump_json(),
+                    self._clock(),
+                ),
+            )
+            self._remember(
+                session_id, 0, SessionData(scenario=scenario, definition=definition)
+            )
+        return session_id
+
+    def get(self, session_id: str) -> SessionData | None:
+        with self._lock, self._connect() as db:
+            self._expire(db)
+            row = db.execute(
+                "SELECT version, last_access FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                self._forget(session_id)
+                return None
+            version, last_access = row
+            now = self._clock()
+            if self.ttl is not None and now - last_access >= TOUCH_FRACTION * self.ttl:
+                db.execute(
+                    "UPDATE sessions SET last_access = ? WHERE session_id = ?",
+                    (now, session_id),
+                )
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(session_id)
+                return cached[1]
+            return self._load(db, session_id)
+
+    def save(self, session_id: str, session: SessionData) -> None:
+        if session.definition is None:
+            raise ValueError("Shared sessions need the scenario definition")
+        columns, blob = pack_results(session.results)
+        with self._lock, self._connect() as db:
+            updated = db.execute(
+                "UPDATE sessions SET name = ?, definition = ?, columns = ?,"
+                " results = ?, version = version + 1, last_access = ?"
+                " WHERE session_id = ?",
+                (
+                    session.scenario.name,
+                    session.definition.model_dump_json(),
+                    columns,
+                    blob,
+                    self._clock(),
+                    session_id,
+                ),
+            )
+            if updated.rowcount == 0:
+                # Deleted or expired meanwhile; nothing to keep.
+                self._forget(session_id)
+                return
+            (version,) = db.execute(
+                "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            self._remember(session_id, version, session)
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock, self._connect() as db:
+            self._forget(session_id)
+            deleted = db.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+            return deleted.rowcount > 0
+
+    def list_sessions(self) -> list[dict[str, str]]:
+        with self._lock, self._connect() as db:
+            self._expire(db)
+            rows = db.execute(
+                "SELECT session_id, name FROM sessions ORDER BY last_access"
+            ).fetchall()
+        return [{"session_id": sid, "name": name} for sid, name in rows]
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock, self._connect() as db:
+            self._expire(db)
+            sessions, with_results, stored = db.execute(
+                "SELECT COUNT(*), COUNT(results), COALESCE(SUM(LENGTH(results)), 0)"
+                " FROM sessions"
+            ).fetchone()
+        return {
+            "sessions": sessions,
+            "sessions_with_results": with_results,
+            "stored_result_bytes": stored,
+            "cached_sessions": len(self._cache),
+            "rebuilt_sessions": self.rebuilt_sessions,
+            "ttl": self.ttl,
+            "expired_sessions": self.expired_sessions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._cache.clear()
+            self._filters.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened on first use so that each server process gets its own.
+        if self._connection is None:
+            connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _load(self, db: sqlite3.Connection, session_id: str) -> SessionData:
+        from api.worker import build_scenario
+
+        version, definition, columns, blob = db.execute(
+            "SELECT version, definition, columns, results FROM sessions"
+            " WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        request = CreateScenarioRequest.model_validate_json(definition)
+        session = SessionData(
+            scenario=build_scenario(request),
+            results=unpack_results(columns, blob),
+            definition=request,
+        )
+        session.scenario.results = session.results
+        self.rebuilt_sessions += 1
+        self._remember(session_id, version, session)
+        return session
+
+    def _remember(self, session_id: str, version: int, session: SessionData) -> None:
+        previous = self._cache.get(session_id)
+        if previous is not None and previous[1] is not session:
+            self._keep_filter(session_id, previous[1])
+        if session.assimilation is None:
+            session.assimilation = self._filters.pop(session_id, None)
+        self._cache[session_id] = (version, session)
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.cache_size:
+            evicted_id, (_, evicted) = self._cache.popitem(last=False)
+            self._keep_filter(evicted_id, evicted)
+
+    def _keep_filter(self, session_id: str, session: SessionData) -> None:
+        if session.assimilation is not None:
+            self._filters[session_id] = session.assimilation
+
+    def _forget(self, session_id: str) -> None:
+        self._cache.pop(session_id, None)
+        self._filters.pop(session_id, None)
+
+    def _expire(self, db: sqlite3.Connection) -> None:
+        if self.ttl is None:
+            return
+        cutoff = self._clock() - self.ttl
+        expired = [
+            sid
+            for (sid,) in db.execute(
+                "SELECT session_id FROM sessions WHERE last_access <= ?", (cutoff,)
+            )
+        ]
+        if not expired:
+            return
+        db.executemany(
+            "DELETE FROM sessions WHERE session_id = ?", [(sid,) for sid in expired]
+        )
+        for sid in expired:
+            self._forget(sid)
+        self.expired_sessions += len(expired)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from api.expression import ExpressionError, compile_rate_function
+from api.schemas import CreateScenarioRequest
+from models.core.auxiliary import Auxiliary
+from models.scenario.scenario import Scenario
+
+if TYPE_CHECKING:
+    from api.session import SessionData
+
+# Number of simulation worker processes; unset means one per CPU.
+WORKERS_ENV = "PYVENSIM_API_WORKERS"
+
+_pool: Executor | None = None
+
+
+def configured_workers() -> int | None:
+    """Worker count from ``PYVENSIM_API_WORKERS``, or None for one per CPU."""
+    value = os.environ.get(WORKERS_ENV, "").strip()
+    if not value:
+        return None
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        raise ValueError(f"{WORKERS_ENV} must be a positive integer, got {value!r}")
+    return workers
+
+
+def configure_pool(
+    max_workers: int | None = None, executor: Executor | None = None
+) -> Executor:
+    """Replace the simulation pool; ``executor`` is used as given."""
+    global _pool
+    shutdown_pool()
+    _pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+    return _pool
+
+
+def get_pool() -> Executor:
+    return _pool or configure_pool(configured_workers())
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def build_scenario(definition: CreateScenarioRequest) -> Scenario:
+    """Compile a model definition into a scenario."""
+    auxiliaries = [Auxiliary(aux.name, aux.values) for aux in definition.auxiliaries]
+
+    rates: dict[str, dict[str, Any]] = {}
+    for rate_name, rate_schema in definition.rates.items():
+        try:
+            rate_fn = compile_rate_function(rate_schema.expression, rate_schema.params)
+        except ExpressionError as e:
+            raise ExpressionError(
+                f"Invalid expression for rate '{rate_name}': {e}"
+            ) from e
+        rates[rate_name] = {
+            "rate_function": rate_fn,
+            "source": rate_schema.source,
+            "destination": rate_schema.destination,
+        }
+
+    return Scenario(
+        name=definition.name,
+        initial_values=dict(definition.initial_values),
+        rates=rates,
+        auxiliaries=auxiliaries,
+    )
+
+
+def scenario_task(
+    definition: CreateScenarioRequest, method: str, /, **kwargs: Any
+) -> tuple[Any, Any]:
+    """Call a ``Scenario`` method in a worker, returning its value and results.
+
+    Compiled rate functions cannot be pickled, so workers receive the
+    definition and rebuild the scenario.
+    """
+    return _call(build_scenario(definition), method, **kwargs)
+
+
+async def run_session_task(
+    session: SessionData, method: str, /, **kwargs: Any
+) -> tuple[Any, Any]:
+    """Run a scenario method in the pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    if session.definition is None:
+        # Scenarios built in-process have no definition to ship to a worker.
+        # They are reused across runs, so their auxiliaries restart here.
+        for aux in session.scenario.auxiliaries:
+            aux.current_time_step = 0
+        task = partial(_call, session.scenario, method, **kwargs)
+        return await loop.run_in_executor(None, task)
+    task = partial(scenario_task, session.definition, method, **kwargs)
+    return await loop.run_in_executor(get_pool(), task)
+
+
+def _call(scenario: Scenario, method: str, /, **kwargs: Any) -> tuple[Any, Any]:
+    value = getattr(scenario, method)(**kwargs)
+    return value, scenario.results
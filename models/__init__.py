@@ -1,17 +1,20 @@
-from .calibration import Calibrator
+from .calibration import CalibrationTargets, Calibrator
 from .core import Auxiliary, AuxiliaryValue, Flow, Stock, SystemComponent
-from .engine import Simulation
+from .engine import EnsembleResult, Simulation, SimulationResult
 from .scenario import Scenario, ScenarioManager
 from .visualization import Visualization
 
 __all__ = [
     "Auxiliary",
     "AuxiliaryValue",
+    "CalibrationTargets",
     "Calibrator",
+    "EnsembleResult",
     "Flow",
     "Scenario",
     "ScenarioManager",
     "Simulation",
+    "SimulationResult",
     "Stock",
     "SystemComponent",
     "Visualization",
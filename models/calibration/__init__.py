@@ -1,5 +1,11 @@
 from .calibrator import Calibrator
+from .loader import read_calibration_data
+from .mcmc import run_ensemble_sampler
+from .targets import CalibrationTargets
 
 __all__ = [
+    "CalibrationTargets",
     "Calibrator",
+    "read_calibration_data",
+    "run_ensemble_sampler",
 ]
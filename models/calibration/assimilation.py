@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..core.stock import Stock
+
+
+class EnsembleKalmanFilter:
+    """Sequential correction of stock values from incoming observations.
+
+    The ensemble runs as one batched simulation whose stocks hold an array
+    with one value per member, so advancing to the next observation is a
+    single short ``continue_run``. Rate functions must therefore accept
+    numpy arrays.
+    """
+
+    def __init__(
+        self,
+        scenario: Any,
+        num_members: int = 50,
+        dt: float = 1,
+        observation_noise: float | dict[str, float] = 1.0,
+        initial_spread: float = 0.1,
+        seed: int | None = None,
+    ) -> None:
+        if num_members < 2:
+            raise ValueError("num_members must be at least 2")
+        self.scenario = scenario
+        self.num_members = num_members
+        self.dt = dt
+        self.observation_noise = observation_noise
+        self.stock_names = list(scenario.initial_values)
+        self.analyses: list[dict[str, Any]] = []
+        self._rng = np.random.default_rng(seed)
+
+        initial = {
+            name: value
+            * (1 + initial_spread * self._rng.standard_normal(num_members))
+            for name, value in scenario.initial_values.items()
+        }
+        # An empty auxiliary override gives the filter its own auxiliaries.
+        self.simulation = scenario.construct_simulation(
+            {"auxiliaries": {}, "initial_values": initial}
+        )
+        self.simulation.initialize_history()
+        self._stocks = {
+            component.name: component
+            for component in self.simulation.components
+            if isinstance(component, Stock)
+        }
+
+    @property
+    def time(self) -> float:
+        """Time of the last recorded state, or -dt before the first step."""
+        times = self.simulation.history["time"]
+        return times[-1] if times else -self.dt
+
+    @property
+    def state(self) -> NDArray[np.floating[Any]]:
+        """Ensemble stock values as a (stocks, members) array."""
+        return np.array(
+            [
+                np.broadcast_to(self._stocks[name].value, self.num_members)
+                for name in self.stock_names
+            ],
+            dtype=float,
+        )
+
+    def advance(self, until: float) -> None:
+        """Run every member until the state at time ``until`` is recorded."""
+        if until < self.time:
+            raise ValueError("Observations must not precede the filter time")
+        current = dict(zip(self.stock_names, self.state))
+        try:
+            with np.errstate(all="ignore"):
+                self.simulation.continue_run(current, until + self.dt, self.dt)
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"Rate functions must accept numpy arrays for ensemble runs: {e}"
+            ) from e
+        # Only the latest state is needed; older steps would grow without bound.
+        for values in self.simulation.history.values():
+            del values[:-1]
+
+    def assimilate(self, time: float, observations: dict[str, float]) -> dict[str, Any]:
+        """Advance to ``time`` and correct the stocks with ``observations``."""
+        unknown = [name for name in observations if name not in self._stocks]
+        if unknown:
+            raise ValueError(f"Unknown stocks in observations: {unknown}")
+        self.advance(time)
+
+        forecast = self.state
+        observed = [self.stock_names.index(name) for name in observations]
+        noise = np.array(
+            [
+                self.observation_noise.get(name, 1.0)
+                if isinstance(self.observation_noise, dict)
+                else self.observation_noise
+                for name in observations
+            ],
+            dtype=float,
+        )
+        # Perturbed-observation EnKF: each member assimilates a noisy copy.
+        perturbed = np.array(list(observations.values()), dtype=float)[:, None] + (
+            noise[:, None] * self._rng.standard_normal((len(noise), self.num_members))
+        )
+        anomalies = forecast - forecast.mean(axis=1, keepdims=True)
+        observed_anomalies = anomalies[observed]
+        scale = self.num_members - 1
+        innovation_cov = observed_anomalies @ observed_anomalies.T / scale + np.diag(
+            noise**2
+        )
+        cross_cov = anomalies @ observed_anomalies.T / scale
+        gain = np.linalg.solve(innovation_cov, cross_cov.T).T
+        analysis = forecast + gain @ (perturbed - forecast[observed])
+
+        for name, values in zip(self.stock_names, analysis):
+            self._stocks[name].value = values
+        summary = {
+            "time": time,
+            "mean": dict(zip(self.stock_names, analysis.mean(axis=1).tolist())),
+            "std": dict(zip(self.stock_names, analysis.std(axis=1, ddof=1).tolist())),
+        }
+        self.analyses.append(summary)
+        return summary
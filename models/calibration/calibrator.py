@@ -1,14 +1,31 @@
 from __future__ import annotations
 
+import inspect
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Executor
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.optimize import minimize
+from scipy.optimize import OptimizeResult, least_squares, minimize
+from scipy.stats import qmc
+
+from ..engine.dual import seed_duals, unpack_duals
+from ..engine.parallel import worker_pool
+from .loader import read_calibration_data
+from .mcmc import run_ensemble_sampler
+from .targets import CalibrationTargets
 
 if TYPE_CHECKING:
     import pandas as pd
 
+# Parameter vectors equal to this many decimals share one cached evaluation.
+_CACHE_DECIMALS = 12
+
 
 class Calibrator:
     def __init__(
@@ -16,15 +33,69 @@ class Calibrator:
         scenario: Any,
         simulation_time: float = 91,
         dt: float = 1,
+        bounds: list[tuple[float, float]] | None = None,
+        use_jacobian: bool = True,
+        time_column: str | None = None,
+        weights: dict[str, float] | None = None,
+        time_origin: float = 0,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        cache_size: int = 128,
     ) -> None:
         self.scenario = scenario
         self.simulation_time = simulation_time
         self.dt = dt
-        self.methods: dict[str, Any] = {"least_squares": self._least_squares}
+        self.bounds = bounds
+        self.use_jacobian = use_jacobian
+        self.time_column = time_column
+        self.weights = weights
+        self.time_origin = time_origin
+        self.max_workers = max_workers
+        self.executor = executor
+        self.cache_size = cache_size
+        self.n_simulations = 0
+        self.n_augmented_simulations = 0
+        self.n_cache_hits = 0
+        self.n_aborted = 0
+        self._cache: OrderedDict[
+            bytes,
+            tuple[NDArray[np.floating[Any]], NDArray[np.floating[Any]] | None],
+        ] = OrderedDict()
+        self.last_result: OptimizeResult | None = None
+        self.methods: dict[str, Any] = {
+            "least_squares": self._least_squares,
+            "gradient": self._gradient,
+            "trust_region": self._trust_region,
+            "nelder_mead": self._nelder_mead,
+            "multi_start": self._multi_start,
+            "ensemble_mcmc": self._ensemble_mcmc,
+        }
+
+    def calibrate(
+        self,
+        data: pd.DataFrame | CalibrationTargets | str | Path,
+        method: str = "least_squares",
+        sheet_name: str | int = 0,
+        cache_dir: str | Path | None = None,
+        **options: Any,
+    ) -> Any:
+        """Fit the scenario to ``data``; ``options`` go to the chosen method.
 
-    def calibrate(self, data: pd.DataFrame, method: str = "least_squares") -> Any:
+        ``sheet_name`` and ``cache_dir`` apply when ``data`` is a file path.
+        """
         if method in self.methods:
-            return self.methods[method](data)
+            accepted = list(inspect.signature(self.methods[method]).parameters)[1:]
+            unknown = sorted(set(options) - set(accepted))
+            if unknown:
+                raise ValueError(f"Method '{method}' does not accept {unknown}.")
+            targets = self._prepare_targets(data, sheet_name, cache_dir)
+            self.n_simulations = 0
+            self.n_augmented_simulations = 0
+            self.n_cache_hits = 0
+            self.n_aborted = 0
+            self._cache.clear()
+            self._started_at = time.perf_counter()
+            return self.methods[method](targets, **options)
         else:
             raise ValueError(f"Method '{method}' not supported.")
 
@@ -36,29 +107,602 @@ class Calibrator:
     ) -> NDArray[np.floating[Any]]:
         return np.reshape(calibration_data, (num_stocks, num_data_points))
 
-    def _least_squares(self, data: pd.DataFrame) -> NDArray[np.floating[Any]]:
-        def objective_function(params: NDArray[np.floating[Any]]) -> float:
-            self._update_scenario_params(params)
-            all_simulated_data = self.scenario.run(self.simulation_time, self.dt)
+    def _least_squares(self, data: CalibrationTargets) -> NDArray[np.floating[Any]]:
+        initial_params = self._get_initial_params()
+        result = minimize(
+            self._loss,
+            initial_params,
+            args=(data,),
+            method="L-BFGS-B",
+            bounds=self.bounds,
+        )
+        return self._finish(result)
 
-            stock_names = [name for name in self.scenario.initial_values.keys()]
-            simulated_stock_data = {
-                name: value
-                for name, value in all_simulated_data.items()
-                if name in stock_names
-            }
+    def _nelder_mead(
+        self,
+        data: CalibrationTargets,
+        early_abort: bool = False,
+        loss_threshold: float | None = None,
+        xatol: float = 1e-8,
+        fatol: float = 1e-8,
+        max_iterations: int | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        # Each Nelder-Mead step compares a trial with one known loss, so with
+        # early_abort a trial run stops once it exceeds that loss and the search
+        # takes exactly the steps it would without aborting. Gradient methods
+        # cannot abort: a cut-short finite-difference probe corrupts the slope.
+        lower, upper = self._bounds_arrays(len(self.scenario.auxiliaries))
+        x0 = np.clip(np.asarray(self._get_initial_params(), dtype=float), lower, upper)
+        num_params = len(x0)
+        if max_iterations is None:
+            max_iterations = 200 * num_params
 
-            simulated_stock_values = np.array(
-                [simulated_stock_data[name] for name in stock_names]
+        def value(x: NDArray[np.floating[Any]], decides: float = math.inf) -> float:
+            bound = decides if early_abort else math.inf
+            if loss_threshold is not None:
+                bound = min(bound, loss_threshold)
+            loss, complete = self._evaluate(
+                x, data, None if math.isinf(bound) else bound
             )
-            target_data_array = [data[col].tolist() for col in data.columns]
+            return loss if complete else math.inf
+
+        # Same initial simplex as scipy: 5% steps, or 0.00025 from zero.
+        simplex = np.array([x0] * (num_params + 1))
+        for i in range(num_params):
+            simplex[i + 1, i] = 1.05 * x0[i] if x0[i] != 0 else 0.00025
+        simplex = np.clip(simplex, lower, upper)
+        losses = np.array([value(x) for x in simplex])
 
-            return float(np.sum((simulated_stock_values - target_data_array) ** 2))
+        nit = 0
+        while nit < max_iterations:
+            order = np.argsort(losses, kind="stable")
+            simplex, losses = simplex[order], losses[order]
+            if (
+                np.max(np.abs(simplex[1:] - simplex[0])) <= xatol
+                and np.max(np.abs(losses[1:] - losses[0])) <= fatol
+            ):
+                break
+            nit += 1
+            centroid = simplex[:-1].mean(axis=0)
+            worst = losses[-1]
+            reflected = np.clip(2 * centroid - simplex[-1], lower, upper)
+            reflected_loss = value(reflected, worst)
+            if reflected_loss < losses[0]:
+                expanded = np.clip(3 * centroid - 2 * simplex[-1], lower, upper)
+                expanded_loss = value(expanded, reflected_loss)
+                if expanded_loss < reflected_loss:
+                    simplex[-1], losses[-1] = expanded, expanded_loss
+                else:
+                    simplex[-1], losses[-1] = reflected, reflected_loss
+                continue
+            if reflected_loss < losses[-2]:
+                simplex[-1], losses[-1] = reflected, reflected_loss
+                continue
+            if reflected_loss < worst:
+                contracted = np.clip((centroid + reflected) / 2, lower, upper)
+                contracted_loss = value(contracted, reflected_loss)
+                accepted = contracted_loss <= reflected_loss
+            else:
+                contracted = np.clip((centroid + simplex[-1]) / 2, lower, upper)
+                contracted_loss = value(contracted, worst)
+                accepted = contracted_loss < worst
+            if accepted:
+                simplex[-1], losses[-1] = contracted, contracted_loss
+                continue
+            simplex[1:] = simplex[0] + (simplex[1:] - simplex[0]) / 2
+            losses[1:] = [value(x) for x in simplex[1:]]
 
+        best = int(np.argmin(losses))
+        result = OptimizeResult(
+            x=simplex[best],
+            fun=float(losses[best]),
+            nit=nit,
+            success=nit < max_iterations,
+        )
+        return self._finish(result)
+
+    def _gradient(self, data: CalibrationTargets) -> NDArray[np.floating[Any]]:
         initial_params = self._get_initial_params()
-        result = minimize(objective_function, initial_params, method="L-BFGS-B")
+        result = minimize(
+            self._loss_and_gradient,
+            initial_params,
+            args=(data,),
+            jac=True,
+            method="L-BFGS-B",
+            bounds=self.bounds,
+        )
+        return self._finish(result)
+
+    def _loss_and_gradient(
+        self, params: NDArray[np.floating[Any]], data: CalibrationTargets
+    ) -> tuple[float, NDArray[np.floating[Any]]]:
+        simulated, sensitivities = self._simulate_with_gradients(params, data)
+        residuals = data.residuals(simulated)
+        jacobian = data.weighted_sensitivities(sensitivities)
+        gradient = 2 * np.einsum("st,stp->p", residuals, jacobian)
+        return float(np.sum(residuals**2)), gradient
+
+    def _loss(
+        self,
+        params: NDArray[np.floating[Any]],
+        data: CalibrationTargets,
+        loss_threshold: float | None = None,
+    ) -> float:
+        return self._evaluate(params, data, loss_threshold)[0]
+
+    def _evaluate(
+        self,
+        params: NDArray[np.floating[Any]],
+        data: CalibrationTargets,
+        bound: float | None = None,
+    ) -> tuple[float, bool]:
+        """The loss and whether it is complete rather than an aborted partial sum."""
+        if bound is None or self._cache_key(params) in self._cache:
+            loss = float(np.sum(data.residuals(self._simulate(params, data)) ** 2))
+        else:
+            return self._bounded_loss(params, data, bound)
+        return loss, True
+
+    def _bounded_loss(
+        self,
+        params: NDArray[np.floating[Any]],
+        targets: CalibrationTargets,
+        bound: float,
+    ) -> tuple[float, bool]:
+        # Observations are scored as they are recorded and the run stops once
+        # the partial sum exceeds the bound; that partial sum is returned.
+        partial = 0.0
+
+        def exceeds_bound(history: dict[str, list[float]]) -> bool:
+            nonlocal partial
+            values = np.array([history[name][-1] for name in targets.stock_names])
+            partial += targets.partial_loss(len(history["time"]) - 1, values)
+            return partial > bound
+
+        history = self._run_observed(
+            {aux.name: float(v) for aux, v in zip(self.scenario.auxiliaries, params)},
+            targets,
+            stop_when=exceeds_bound,
+        )
+        if len(history["time"]) < len(targets.record_steps):
+            self.n_aborted += 1
+            return partial, False
+        simulated = self._align(history, targets)
+        self._cache_put(self._cache_key(params), simulated, None)
+        return float(np.sum(targets.residuals(simulated) ** 2)), True
+
+    def _trust_region(self, data: CalibrationTargets) -> NDArray[np.floating[Any]]:
+        # The augmented run behind each residual evaluation is cached, so the
+        # Jacobian least_squares requests next at the same point is free.
+        def residual_function(
+            params: NDArray[np.floating[Any]],
+        ) -> NDArray[np.floating[Any]]:
+            if not self.use_jacobian:
+                return data.residuals(self._simulate(params, data)).ravel()
+            simulated, _ = self._simulate_with_gradients(params, data)
+            return data.residuals(simulated).ravel()
+
+        def jacobian_function(
+            params: NDArray[np.floating[Any]],
+        ) -> NDArray[np.floating[Any]]:
+            _, sensitivities = self._simulate_with_gradients(params, data)
+            return data.weighted_sensitivities(sensitivities).reshape(
+                -1, len(params)
+            )
+
+        initial_params = np.asarray(self._get_initial_params(), dtype=float)
+        lower, upper = self._bounds_arrays(len(initial_params))
+        result = least_squares(
+            residual_function,
+            np.clip(initial_params, lower, upper),
+            jac=jacobian_function if self.use_jacobian else "2-point",
+            bounds=(lower, upper),
+        )
+        return self._finish(result)
+
+    def _multi_start(
+        self,
+        data: CalibrationTargets,
+        num_starts: int = 8,
+        prune_factor: float | None = None,
+        stage_iterations: int = 10,
+        seed: int | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        if self.bounds is None:
+            raise ValueError("Method 'multi_start' requires bounds.")
+        if num_starts < 1:
+            raise ValueError("num_starts must be at least 1")
+        lower, upper = self._bounds_arrays(len(self.bounds))
+        if not np.all(np.isfinite(lower) & np.isfinite(upper)):
+            raise ValueError("Method 'multi_start' requires finite bounds.")
+
+        # The current parameter values are always one of the starts.
+        sampler = qmc.LatinHypercube(d=len(lower), seed=seed)
+        starts = np.vstack(
+            [
+                np.clip(self._get_initial_params(), lower, upper),
+                qmc.scale(sampler.random(num_starts - 1), lower, upper),
+            ]
+        )
+
+        summaries = [
+            {"x0": x0, "x": x0, "fun": np.inf, "nit": 0, "status": "running"}
+            for x0 in starts
+        ]
+        maxiter = stage_iterations if prune_factor is not None else None
+        # Workers get only what a local search needs, never the executor.
+        payload = _LocalSearch(
+            self.scenario,
+            data,
+            self.bounds,
+            self.simulation_time,
+            self.dt,
+            self.use_jacobian,
+            self.cache_size,
+        )
+
+        with worker_pool(payload, self.max_workers, self.executor) as executor:
+            active = list(range(len(starts)))
+            while active:
+                futures = {
+                    i: executor.submit(payload, summaries[i]["x"], maxiter)
+                    for i in active
+                }
+                for i, future in futures.items():
+                    result, counts = future.result()
+                    self.n_simulations += counts["n_simulations"]
+                    self.n_augmented_simulations += counts["n_augmented_simulations"]
+                    self.n_cache_hits += counts["n_cache_hits"]
+                    self.n_aborted += counts["n_aborted"]
+                    summary = summaries[i]
+                    previous = summary["fun"]
+                    summary.update(x=result.x, fun=float(result.fun))
+                    summary["nit"] += result.nit
+                    # A stage that no longer improves the loss counts as
+                    # converged, so restarted stages cannot loop forever.
+                    stalled = math.isfinite(previous) and (
+                        previous - summary["fun"] <= 1e-12 * max(1.0, previous)
+                    )
+                    if result.success or stalled:
+                        summary["status"] = "converged"
+                    elif maxiter is None or result.nit < maxiter:
+                        summary["status"] = "failed"
+
+                best = min(summary["fun"] for summary in summaries)
+                active = [i for i in active if summaries[i]["status"] == "running"]
+                if prune_factor is not None:
+                    for i in active:
+                        if summaries[i]["fun"] > prune_factor * best:
+                            summaries[i]["status"] = "pruned"
+                    active = [i for i in active if summaries[i]["status"] == "running"]
+
+        best_summary = min(summaries, key=lambda summary: summary["fun"])
+        result = OptimizeResult(
+            x=best_summary["x"],
+            fun=best_summary["fun"],
+            success=best_summary["status"] == "converged",
+            starts=summaries,
+        )
+        return self._finish(result)
+
+    def _ensemble_mcmc(
+        self,
+        data: CalibrationTargets,
+        priors: dict[str, Any] | None = None,
+        num_walkers: int = 32,
+        num_samples: int = 500,
+        noise_scale: float = 1.0,
+        seed: int | None = None,
+        checkpoint_path: str | None = None,
+        checkpoint_every: int = 50,
+    ) -> NDArray[np.floating[Any]]:
+        # Without priors every auxiliary is sampled, flat within its bounds.
+        if priors is None:
+            names = [aux.name for aux in self.scenario.auxiliaries]
+            lower, upper = self._bounds_arrays(len(names))
+        else:
+            names = list(priors)
+            unknown = [
+                name
+                for name in names
+                if name not in self.scenario.initial_values
+                and name not in {aux.name for aux in self.scenario.auxiliaries}
+            ]
+            if unknown:
+                raise ValueError(f"Priors for unknown parameters: {unknown}")
+
+        def log_prior(
+            positions: NDArray[np.floating[Any]],
+        ) -> NDArray[np.floating[Any]]:
+            if priors is None:
+                inside = np.all((positions >= lower) & (positions <= upper), axis=1)
+                return np.where(inside, 0.0, -np.inf)
+            return np.sum(
+                [
+                    priors[name].logpdf(positions[:, i])
+                    for i, name in enumerate(names)
+                ],
+                axis=0,
+            )
+
+        def log_posterior(
+            positions: NDArray[np.floating[Any]],
+        ) -> NDArray[np.floating[Any]]:
+            log_probs = np.asarray(log_prior(positions), dtype=float)
+            members = np.isfinite(log_probs)
+            if np.any(members):
+                simulated = self._simulate_batch(names, positions[members], data)
+                losses = np.sum(data.residuals(simulated) ** 2, axis=(1, 2))
+                log_likelihood = -0.5 * losses / noise_scale**2
+                log_probs[members] += np.where(
+                    np.isfinite(log_likelihood), log_likelihood, -np.inf
+                )
+            return log_probs
+
+        # Walkers start in a tight ball around the current parameter values.
+        current = np.array(
+            [self._current_value(name) for name in names], dtype=float
+        )
+        rng = np.random.default_rng(seed)
+        scatter = 1e-4 * np.where(current == 0, 1.0, np.abs(current))
+        initial = current + scatter * rng.standard_normal(
+            (num_walkers, len(names))
+        )
+        if priors is None:
+            initial = np.clip(initial, lower, upper)
+
+        sampled = run_ensemble_sampler(
+            log_posterior,
+            initial,
+            num_samples,
+            seed=seed,
+            checkpoint_path=checkpoint_path,
+            checkpoint_every=checkpoint_every,
+        )
+        # The second half of the chain is kept as the posterior sample.
+        samples = sampled["chain"][num_samples // 2 :].reshape(-1, len(names))
+        result = OptimizeResult(
+            x=np.median(samples, axis=0),
+            success=True,
+            nit=num_samples,
+            parameter_names=names,
+            samples=samples,
+            **sampled,
+        )
+        return self._finish(result, names)
+
+    def load_targets(
+        self,
+        path: str | Path,
+        sheet_name: str | int = 0,
+        cache_dir: str | Path | None = None,
+    ) -> CalibrationTargets:
+        """Read a calibration file, cached in ``cache_dir``, aligned to the stocks."""
+        return self._prepare_targets(path, sheet_name, cache_dir)
+
+    def _prepare_targets(
+        self,
+        data: pd.DataFrame | CalibrationTargets | str | Path,
+        sheet_name: str | int = 0,
+        cache_dir: str | Path | None = None,
+    ) -> CalibrationTargets:
+        if isinstance(data, (str, Path)):
+            data = read_calibration_data(
+                data, sheet_name=sheet_name, cache_dir=cache_dir
+            )
+        if isinstance(data, CalibrationTargets):
+            targets = data
+        else:
+            targets = CalibrationTargets(
+                data,
+                list(self.scenario.initial_values),
+                dt=self.dt,
+                time_column=self.time_column,
+                weights=self.weights,
+                time_origin=self.time_origin,
+            )
+        if targets.num_steps > math.ceil(self.simulation_time / self.dt):
+            raise ValueError("Calibration data extends beyond the simulation time")
+        return targets
+
+    def _finish(
+        self, result: OptimizeResult, names: list[str] | None = None
+    ) -> NDArray[np.floating[Any]]:
+        if names is None:
+            self._update_scenario_params(result.x)
+        else:
+            for name, value in zip(names, result.x):
+                self._set_value(name, float(value))
+        # Dual-number runs are counted separately: each costs several plain runs.
+        result.n_simulations = self.n_simulations
+        result.n_augmented_simulations = self.n_augmented_simulations
+        # Every requested evaluation was either simulated or served from cache.
+        result.n_cache_hits = self.n_cache_hits
+        result.n_evaluations = self.n_simulations + self.n_cache_hits
+        result.n_aborted = self.n_aborted
+        result.elapsed = time.perf_counter() - self._started_at
+        self.last_result = result
         return result.x
 
+    def _bounds_arrays(
+        self, num_params: int
+    ) -> tuple[NDArray[np.floating[Any]], NDArray[np.floating[Any]]]:
+        if self.bounds is None:
+            return np.full(num_params, -np.inf), np.full(num_params, np.inf)
+        lower, upper = np.array(
+            [
+                (-np.inf if lo is None else lo, np.inf if hi is None else hi)
+                for lo, hi in self.bounds
+            ],
+            dtype=float,
+        ).T
+        return lower, upper
+
+    def _simulate(
+        self, params: NDArray[np.floating[Any]], targets: CalibrationTargets
+    ) -> NDArray[np.floating[Any]]:
+        key = self._cache_key(params)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached[0]
+        history = self._run_observed(
+            {aux.name: float(v) for aux, v in zip(self.scenario.auxiliaries, params)},
+            targets,
+        )
+        simulated = self._align(history, targets)
+        self._cache_put(key, simulated, None)
+        return simulated
+
+    def _align(
+        self, history: dict[str, list[Any]], targets: CalibrationTargets
+    ) -> NDArray[np.floating[Any]]:
+        recorded = np.array(
+            [history[name] for name in targets.stock_names], dtype=float
+        )
+        return targets.align(recorded)
+
+    def _simulate_with_gradients(
+        self, params: NDArray[np.floating[Any]], targets: CalibrationTargets
+    ) -> tuple[NDArray[np.floating[Any]], NDArray[np.floating[Any]]]:
+        key = self._cache_key(params)
+        cached = self._cache_get(key, with_gradients=True)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+        history = self._run_observed(
+            {
+                aux.name: dual
+                for aux, dual in zip(self.scenario.auxiliaries, seed_duals(params))
+            },
+            targets,
+        )
+        self.n_augmented_simulations += 1
+        values, gradients = unpack_duals(
+            [history[name] for name in targets.stock_names], len(params)
+        )
+        simulated, sensitivities = targets.align(values), targets.align(gradients)
+        self._cache_put(key, simulated, sensitivities)
+        return simulated, sensitivities
+
+    def _simulate_batch(
+        self,
+        names: list[str],
+        positions: NDArray[np.floating[Any]],
+        targets: CalibrationTargets,
+    ) -> NDArray[np.floating[Any]]:
+        """Observations (members, stocks, observations) from one batched run.
+
+        Parameters enter the engine as arrays with one entry per member, so
+        rate functions must be numpy-friendly; otherwise members run one by
+        one.
+        """
+        num_members = len(positions)
+        overrides = self._overrides(names, positions.T)
+        try:
+            with np.errstate(all="ignore"):
+                history = self._run_observed(
+                    overrides["auxiliaries"],
+                    targets,
+                    initial_values=overrides["initial_values"],
+                )
+            recorded = np.array(
+                [
+                    [np.broadcast_to(value, num_members) for value in history[name]]
+                    for name in targets.stock_names
+                ],
+                dtype=float,
+            )
+        except (TypeError, ValueError):
+            simulated = np.full(
+                (num_members, len(targets.stock_names), len(targets.steps)), np.nan
+            )
+            for i, row in enumerate(positions):
+                member = self._overrides(names, row)
+                try:
+                    history = self._run_observed(
+                        member["auxiliaries"],
+                        targets,
+                        initial_values=member["initial_values"],
+                    )
+                except ValueError:
+                    continue  # the member diverged
+                simulated[i] = self._align(history, targets)
+            return simulated
+        return np.moveaxis(targets.align(recorded), -1, 0)
+
+    def _overrides(self, names: list[str], values: Any) -> dict[str, dict[str, Any]]:
+        overrides: dict[str, dict[str, Any]] = {"auxiliaries": {}, "initial_values": {}}
+        for name, value in zip(names, values):
+            if name in self.scenario.initial_values:
+                overrides["initial_values"][name] = value
+            else:
+                overrides["auxiliaries"][name] = value
+        return overrides
+
+    def _current_value(self, name: str) -> float:
+        if name in self.scenario.initial_values:
+            return float(self.scenario.initial_values[name])
+        aux = next(aux for aux in self.scenario.auxiliaries if aux.name == name)
+        return float(aux.values[0] if isinstance(aux.values, list) else aux.values)
+
+    def _set_value(self, name: str, value: float) -> None:
+        if name in self.scenario.initial_values:
+            self.scenario.initial_values[name] = value
+        for aux in self.scenario.auxiliaries:
+            if aux.name == name:
+                aux.values = value
+
+    def _cache_key(self, params: NDArray[np.floating[Any]]) -> bytes:
+        # Adding 0.0 folds -0.0 into 0.0 so both hash alike.
+        rounded = np.round(np.asarray(params, dtype=float), _CACHE_DECIMALS)
+        return (rounded + 0.0).tobytes()
+
+    def _cache_get(
+        self, key: bytes, with_gradients: bool = False
+    ) -> tuple[NDArray[np.floating[Any]], NDArray[np.floating[Any]] | None] | None:
+        cached = self._cache.get(key)
+        if cached is None or (with_gradients and cached[1] is None):
+            return None
+        self._cache.move_to_end(key)
+        self.n_cache_hits += 1
+        return cached
+
+    def _cache_put(
+        self,
+        key: bytes,
+        simulated: NDArray[np.floating[Any]],
+        sensitivities: NDArray[np.floating[Any]] | None,
+    ) -> None:
+        if self.cache_size < 1:
+            return
+        # Cached arrays are handed out repeatedly, so they must stay unchanged.
+        simulated.setflags(write=False)
+        if sensitivities is not None:
+            sensitivities.setflags(write=False)
+        self._cache[key] = (simulated, sensitivities)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _run_observed(
+        self,
+        auxiliaries: dict[str, Any],
+        targets: CalibrationTargets,
+        stop_when: Callable[[dict[str, list[Any]]], bool] | None = None,
+        initial_values: dict[str, Any] | None = None,
+    ) -> dict[str, list[Any]]:
+        simulation = self.scenario.construct_simulation(
+            {"auxiliaries": auxiliaries, "initial_values": initial_values or {}}
+        )
+        history = simulation.run(
+            self.simulation_time,
+            self.dt,
+            variables=targets.stock_names,
+            record_steps=targets.observed_steps,
+            stop_when=stop_when,
+        )
+        self.n_simulations += 1
+        return history
+
     def _update_scenario_params(self, params: NDArray[np.floating[Any]]) -> None:
         for i, auxiliary in enumerate(self.scenario.auxiliaries):
             auxiliary.values = params[i]
@@ -72,3 +716,57 @@ class Calibrator:
                 initial_param = aux.values
             initial_params.append(initial_param)
         return initial_params
+
+
+class _LocalSearch:
+    """One L-BFGS-B run from a given start; picklable for process pools."""
+
+    def __init__(
+        self,
+        scenario: Any,
+        data: CalibrationTargets,
+        bounds: list[tuple[float, float]],
+        simulation_time: float,
+        dt: float,
+        use_jacobian: bool,
+        cache_size: int,
+    ) -> None:
+        self.scenario = scenario
+        self.data = data
+        self.bounds = bounds
+        self.simulation_time = simulation_time
+        self.dt = dt
+        self.use_jacobian = use_jacobian
+        self.cache_size = cache_size
+
+    def __call__(
+        self, x0: NDArray[np.floating[Any]], maxiter: int | None
+    ) -> tuple[OptimizeResult, dict[str, int]]:
+        worker = Calibrator(
+            self.scenario,
+            simulation_time=self.simulation_time,
+            dt=self.dt,
+            bounds=self.bounds,
+            use_jacobian=self.use_jacobian,
+            cache_size=self.cache_size,
+        )
+        if worker.use_jacobian:
+            objective, jac = worker._loss_and_gradient, True
+        else:
+            objective, jac = worker._loss, None
+        result = minimize(
+            objective,
+            x0,
+            args=(self.data,),
+            jac=jac,
+            method="L-BFGS-B",
+            bounds=self.bounds,
+            options={} if maxiter is None else {"maxiter": maxiter},
+        )
+        counts = {
+            "n_simulations": worker.n_simulations,
+            "n_augmented_simulations": worker.n_augmented_simulations,
+            "n_cache_hits": worker.n_cache_hits,
+            "n_aborted": worker.n_aborted,
+        }
+        return result, counts
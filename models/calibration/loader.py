@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_HASH_CHUNK = 1 << 20
+
+
+def read_calibration_data(
+    path: str | Path,
+    sheet_name: str | int = 0,
+    cache_dir: str | Path | None = None,
+) -> pd.DataFrame:
+    """Read a calibration spreadsheet or CSV, through a binary cache if asked.
+
+    With ``cache_dir`` the parsed columns are stored there as an ``.npz``
+    array. A cache entry is reused while the file's modification time and
+    size are unchanged; when they change the file is hashed, so a file that
+    was only touched is not parsed again. A cache that cannot be read or
+    written is skipped.
+    """
+    path = Path(path).resolve()
+    if cache_dir is None:
+        return _parse(path, sheet_name)
+    stat = path.stat()
+    entry = hashlib.sha256(f"{path}:{sheet_name}".encode()).hexdigest()[:32]
+    cache_path = Path(cache_dir) / f"{entry}.npz"
+
+    digest: str | None = None
+    try:
+        with np.load(cache_path) as cached:
+            meta = json.loads(str(cached["meta"]))
+            values = cached["values"]
+    except (OSError, ValueError, KeyError):
+        meta = None
+    if meta is not None:
+        if (meta["mtime_ns"], meta["size"]) != (stat.st_mtime_ns, stat.st_size):
+            digest = _file_digest(path)
+        if digest is None or digest == meta["sha256"]:
+            frame = pd.DataFrame(values, columns=meta["columns"])
+            if digest is not None:
+                _write_cache(cache_path, frame, stat, digest)
+            return frame
+
+    frame = _parse(path, sheet_name)
+    _write_cache(cache_path, frame, stat, digest or _file_digest(path))
+    return frame
+
+
+def _parse(path: Path, sheet_name: str | int) -> pd.DataFrame:
+    if path.suffix.lower() in (".csv", ".txt"):
+        frame = pd.read_csv(path)
+    else:
+        frame = pd.read_excel(path, sheet_name=sheet_name)
+    frame.columns = [str(column) for column in frame.columns]
+    non_numeric = [
+        column
+        for column in frame.columns
+        if not pd.api.types.is_numeric_dtype(frame[column])
+    ]
+    if non_numeric:
+        raise ValueError(f"Calibration data has non-numeric columns: {non_numeric}")
+    return frame.astype(float)
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_CHUNK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_cache(
+    cache_path: Path, frame: pd.DataFrame, stat: os.stat_result, digest: str
+) -> None:
+    meta = {
+        "columns": list(frame.columns),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+    }
+    # Written beside the entry and renamed, as for MCMC checkpoints.
+    temporary = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary, "wb") as handle:
+            np.savez(
+                handle,
+                values=frame.to_numpy(dtype=float),
+                meta=np.array(json.dumps(meta)),
+            )
+        os.replace(temporary, cache_path)
+    except OSError:
+        # Read-only or full cache directories only cost a parse next time.
+        with contextlib.suppress(OSError):
+            temporary.unlink()
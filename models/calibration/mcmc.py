@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+LogProbability = Callable[[NDArray[np.floating[Any]]], NDArray[np.floating[Any]]]
+
+
+def stretch_move(
+    positions: NDArray[np.floating[Any]],
+    log_probs: NDArray[np.floating[Any]],
+    log_prob_fn: LogProbability,
+    rng: np.random.Generator,
+    scale: float = 2.0,
+) -> NDArray[np.bool_]:
+    """Advance the ensemble in place by one affine-invariant stretch move.
+
+    Walkers are split in two halves that are updated in turn against the
+    other half, so each half's proposals are scored by one ``log_prob_fn``
+    call (Goodman & Weare, 2010).
+    """
+    num_walkers, num_params = positions.shape
+    half = num_walkers // 2
+    accepted = np.zeros(num_walkers, dtype=bool)
+    for active, complement in (
+        (slice(0, half), slice(half, num_walkers)),
+        (slice(half, num_walkers), slice(0, half)),
+    ):
+        walkers = positions[active]
+        others = positions[complement]
+        count = len(walkers)
+        z = ((scale - 1) * rng.random(count) + 1) ** 2 / scale
+        partners = others[rng.integers(len(others), size=count)]
+        proposals = partners + z[:, None] * (walkers - partners)
+
+        proposal_log_probs = log_prob_fn(proposals)
+        with np.errstate(invalid="ignore"):
+            log_ratio = (
+                (num_params - 1) * np.log(z)
+                + proposal_log_probs
+                - log_probs[active]
+            )
+        accept = np.log(rng.random(count)) < log_ratio
+        walkers[accept] = proposals[accept]
+        log_probs[active][accept] = proposal_log_probs[accept]
+        accepted[active] = accept
+    return accepted
+
+
+def run_ensemble_sampler(
+    log_prob_fn: LogProbability,
+    initial: NDArray[np.floating[Any]],
+    num_samples: int,
+    seed: int | None = None,
+    checkpoint_path: str | Path | None = None,
+    checkpoint_every: int = 50,
+) -> dict[str, Any]:
+    """Sample ``num_samples`` ensemble iterations, resuming from a checkpoint.
+
+    Each iteration draws from its own generator seeded by the run entropy and
+    the iteration number, so a resumed chain matches an uninterrupted one.
+    """
+    num_walkers, num_params = initial.shape
+    if num_walkers < 2 * num_params or num_walkers % 2:
+        raise ValueError(
+            "num_walkers must be even and at least twice the number of parameters"
+        )
+
+    chain = np.empty((num_samples, num_walkers, num_params))
+    log_prob_chain = np.empty((num_samples, num_walkers))
+    num_accepted = np.zeros(num_walkers)
+    entropy = np.random.SeedSequence(seed).entropy
+    start = 0
+
+    if checkpoint_path is not None and Path(checkpoint_path).exists():
+        with np.load(checkpoint_path) as saved:
+            done = saved["chain"]
+            if done.shape[1:] != (num_walkers, num_params):
+                raise ValueError(
+                    f"Checkpoint {checkpoint_path} holds {done.shape[1]} walkers "
+                    f"over {done.shape[2]} parameters"
+                )
+            start = min(len(done), num_samples)
+            chain[:start] = done[:start]
+            log_prob_chain[:start] = saved["log_prob"][:start]
+            num_accepted = saved["num_accepted"]
+            entropy = int(str(saved["entropy"]))
+
+    if start:
+        positions = chain[start - 1].copy()
+        log_probs = log_prob_chain[start - 1].copy()
+    else:
+        positions = np.array(initial, dtype=float)
+        log_probs = log_prob_fn(positions)
+        if not np.all(np.isfinite(log_probs)):
+            raise ValueError("Initial walkers have zero posterior probability")
+
+    for iteration in range(start, num_samples):
+        rng = np.random.default_rng([entropy, iteration])
+        num_accepted += stretch_move(positions, log_probs, log_prob_fn, rng)
+        chain[iteration] = positions
+        log_prob_chain[iteration] = log_probs
+        finished = iteration + 1
+        if checkpoint_path is not None and (
+            finished % checkpoint_every == 0 or finished == num_samples
+        ):
+            _save_checkpoint(
+                checkpoint_path,
+                chain[:finished],
+                log_prob_chain[:finished],
+                num_accepted,
+                entropy,
+            )
+
+    return {
+        "chain": chain,
+        "log_prob": log_prob_chain,
+        "acceptance_fraction": num_accepted / max(num_samples, 1),
+    }
+
+
+def _save_checkpoint(
+    path: str | Path,
+    chain: NDArray[np.floating[Any]],
+    log_prob: NDArray[np.floating[Any]],
+    num_accepted: NDArray[np.floating[Any]],
+    entropy: int,
+) -> None:
+    # Written beside the target and renamed, so a crash never leaves a
+    # truncated checkpoint behind.
+    temporary = Path(f"{path}.tmp")
+    with open(temporary, "wb") as handle:
+        np.savez(
+            handle,
+            chain=chain,
+            log_prob=log_prob,
+            num_accepted=num_accepted,
+            entropy=np.array(str(entropy)),
+        )
+    os.replace(temporary, path)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class CalibrationTargets:
+    """Observed stock series aligned once to simulation steps.
+
+    Without ``time_column`` row ``i`` is compared with simulation step ``i``.
+    With it, observation times are mapped to steps relative to
+    ``time_origin``, the data time at which the simulation starts. Missing
+    observations (NaN) and per-series ``weights`` are folded into a weight
+    matrix so residuals are a single array expression.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        stock_names: list[str],
+        dt: float = 1,
+        time_column: str | None = None,
+        weights: dict[str, float] | None = None,
+        time_origin: float = 0,
+    ) -> None:
+        columns = [col for col in data.columns if col != time_column]
+        if any(col in stock_names for col in columns):
+            unknown = [col for col in columns if col not in stock_names]
+            if unknown:
+                raise ValueError(f"Unknown stocks in calibration data: {unknown}")
+            self.stock_names = columns
+        elif len(columns) == len(stock_names):
+            # Legacy layout: unnamed columns follow the scenario's stock order
+            self.stock_names = list(stock_names)
+        else:
+            raise ValueError(
+                f"Calibration data has {len(columns)} series for "
+                f"{len(stock_names)} stocks"
+            )
+
+        values = data[columns].to_numpy(dtype=float).T
+        self.values: np.ma.MaskedArray[Any, Any] = np.ma.masked_invalid(values)
+
+        if time_column is None:
+            steps = np.arange(values.shape[1])
+        else:
+            times = data[time_column].to_numpy(dtype=float)
+            steps = np.rint((times - time_origin) / dt).astype(int)
+            if np.any(steps < 0):
+                raise ValueError("Observation times precede the time origin")
+        self.steps: NDArray[np.integer[Any]] = steps
+        self.record_steps: NDArray[np.integer[Any]] = np.unique(steps)
+        self.observed_steps = frozenset(self.record_steps.tolist())
+        self._columns = np.searchsorted(self.record_steps, steps)
+        self._observations_at = [
+            np.flatnonzero(self._columns == column)
+            for column in range(len(self.record_steps))
+        ]
+
+        series_weights = np.array(
+            [(weights or {}).get(name, 1.0) for name in self.stock_names]
+        )
+        self._targets = self.values.filled(0.0)
+        self._weights = np.sqrt(series_weights)[:, None] * ~np.ma.getmaskarray(
+            self.values
+        )
+
+    @property
+    def num_steps(self) -> int:
+        return int(self.record_steps[-1]) + 1 if len(self.record_steps) else 0
+
+    def align(
+        self, recorded: NDArray[np.floating[Any]]
+    ) -> NDArray[np.floating[Any]]:
+        return recorded[:, self._columns]
+
+    def residuals(
+        self, simulated: NDArray[np.floating[Any]]
+    ) -> NDArray[np.floating[Any]]:
+        return (simulated - self._targets) * self._weights
+
+    def partial_loss(
+        self, column: int, values: NDArray[np.floating[Any]]
+    ) -> float:
+        """Squared residuals of the observations at one recorded step."""
+        observations = self._observations_at[column]
+        residuals = (values[:, None] - self._targets[:, observations]) * (
+            self._weights[:, observations]
+        )
+        return float(np.sum(residuals**2))
+
+    def weighted_sensitivities(
+        self, sensitivities: NDArray[np.floating[Any]]
+    ) -> NDArray[np.floating[Any]]:
+        return sensitivities * self._weights[..., None]
@@ -1,6 +1,9 @@
-from .system_component import SystemComponent
+import math
+
 import numpy as np
 
+from .system_component import SystemComponent
+
 
 class Stock(SystemComponent):
     def __init__(self, name: str, initial_value: float = 0) -> None:
@@ -9,9 +12,12 @@ class Stock(SystemComponent):
 
     def change(self, amount: float) -> None:
         new_value = self.value + amount
-        if not np.isfinite(
-            new_value
-        ):  # Check if the new value is infinite or NaN
+        if isinstance(new_value, np.ndarray):
+            # Batched runs hold one value per ensemble member; a member that
+            # diverges keeps its non-finite value without stopping the others.
+            self.value = new_value
+            return
+        if not math.isfinite(new_value):  # Check if the new value is infinite or NaN
             raise ValueError("Stock value became non-finite")
         self.value = new_value
 
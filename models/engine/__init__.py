@@ -1,5 +1,13 @@
+from .result import EnsembleResult, SimulationResult
 from .simulation import Simulation
+from .storage import EnsembleWriter, ResultWriter, load_result, save_result
 
 __all__ = [
+    "EnsembleResult",
+    "EnsembleWriter",
+    "ResultWriter",
     "Simulation",
+    "SimulationResult",
+    "load_result",
+    "save_result",
 ]
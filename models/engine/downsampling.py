@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def minmax_indices(
+    values: NDArray[np.floating[Any]], num_points: int
+) -> NDArray[np.intp]:
+    """Time indices keeping each series' minimum and maximum per bucket.
+
+    ``values`` is (n_series, n_times). The series are cut into
+    ``num_points // 2`` equal buckets and the indices chosen for any series
+    are merged, together with the first and last step.
+    """
+    num_times = values.shape[1]
+    if num_points >= num_times:
+        return np.arange(num_times)
+    size = -(-num_times // max(num_points // 2, 1))
+    num_buckets = -(-num_times // size)
+    padding = num_buckets * size - num_times
+    # NaN gaps and the padding never win a bucket.
+    missing = np.isnan(values)
+    pad = ((0, 0), (0, padding))
+    low = np.pad(np.where(missing, np.inf, values), pad, constant_values=np.inf)
+    high = np.pad(np.where(missing, -np.inf, values), pad, constant_values=-np.inf)
+    offsets = np.arange(num_buckets) * size
+    lows = low.reshape(len(values), num_buckets, size).argmin(axis=2) + offsets
+    highs = high.reshape(len(values), num_buckets, size).argmax(axis=2) + offsets
+    chosen = np.concatenate([lows.ravel(), highs.ravel(), [0, num_times - 1]])
+    return np.unique(np.minimum(chosen, num_times - 1))
+
+
+def lttb_indices(
+    time: NDArray[np.floating[Any]],
+    values: NDArray[np.floating[Any]],
+    num_points: int,
+) -> NDArray[np.intp]:
+    """Time indices chosen by largest-triangle-three-buckets for each series.
+
+    Buckets are visited in order because each choice depends on the previous
+    one, but every bucket is scored for all series at once. The indices of
+    all series are merged.
+    """
+    num_series, num_times = values.shape
+    if num_points >= num_times or num_points < 3:
+        return np.arange(num_times)
+    edges = np.linspace(1, num_times - 1, num_points - 1).astype(int)
+    values = np.nan_to_num(values)
+    previous = np.zeros(num_series, dtype=int)
+    rows = np.arange(num_series)
+    chosen = [previous, np.full(num_series, num_times - 1)]
+    for bucket in range(num_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        end = edges[bucket + 2] if bucket + 2 < len(edges) else num_times
+        following = slice(stop, end)
+        next_time = time[following].mean()
+        next_value = values[:, following].mean(axis=1)
+        prev_time = time[previous]
+        prev_value = values[rows, previous]
+        # Twice the area of the triangle (previous, candidate, next average).
+        candidates = values[:, start:stop]
+        area = np.abs(
+            (prev_time - next_time)[:, None] * (candidates - prev_value[:, None])
+            - (prev_time[:, None] - time[start:stop])
+            * (next_value - prev_value)[:, None]
+        )
+        previous = start + area.argmax(axis=1)
+        chosen.append(previous)
+    return np.unique(np.concatenate(chosen))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pickle
+import warnings
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+
+def is_picklable(payload: Any) -> bool:
+    try:
+        pickle.dumps(payload)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
+@contextmanager
+def worker_pool(
+    payload: Any,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> Iterator[Executor]:
+    """Yield an executor able to receive ``payload``.
+
+    A caller-supplied process pool requires a picklable payload. Without an
+    executor a process pool is created, falling back to threads when the
+    payload (typically a scenario built from lambdas) cannot be pickled.
+    """
+    if executor is not None:
+        if isinstance(executor, ProcessPoolExecutor) and not is_picklable(payload):
+            raise ValueError(
+                "Scenario cannot be sent to a process pool; define its rate "
+                "functions at module level or use a thread pool."
+            )
+        yield executor
+        return
+
+    if is_picklable(payload):
+        pool: Executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        warnings.warn(
+            "Scenario is not picklable; running workers in threads instead "
+            "of processes.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    with pool:
+        yield pool
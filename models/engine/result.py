@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .downsampling import lttb_indices, minmax_indices
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Marks series not yet converted to a list.
+_UNREAD: Any = object()
+
+
+class SimulationResult(dict[str, Any]):
+    """Recorded series held in one (n_series, n_times) float array.
+
+    The ``time`` vector is the last row, so every variable is a contiguous
+    block: ``to_numpy`` and ``to_pandas`` return views rather than copies.
+    It is still the ``{name: list}`` dict callers expect. A series becomes a
+    list the first time it is read, so editing that list leaves the array
+    untouched.
+    """
+
+    def __init__(self, data: NDArray[np.floating[Any]], columns: list[str]) -> None:
+        if columns[-1] != "time":
+            raise ValueError("The last column of a result must be 'time'")
+        data.setflags(write=False)
+        # Placeholders until read; memory-mapped results stay on disk.
+        super().__init__(dict.fromkeys(columns, _UNREAD))
+        self._data = data
+        self.columns = columns
+        self._index = {name: i for i, name in enumerate(columns)}
+
+    def __getitem__(self, name: str) -> list[float]:
+        series = super().__getitem__(name)
+        if series is _UNREAD:
+            series = self._data[self._index[name]].tolist()
+            super().__setitem__(name, series)
+        return series  # type: ignore[no-any-return]
+
+    # Every other way of reading values goes through __getitem__.
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(super().keys()))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default
+
+    def items(self) -> Any:
+        return [(name, self[name]) for name in self]
+
+    def values(self) -> Any:
+        return [self[name] for name in self]
+
+    def copy(self) -> dict[str, Any]:
+        return dict(self.items())
+
+    def pop(self, name: str, *default: Any) -> Any:
+        if name in self:
+            self[name]
+        return super().pop(name, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        name = next(reversed(list(super().keys())))
+        return name, self.pop(name)
+
+    def setdefault(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else super().setdefault(name, default)
+
+    def __or__(self, other: Any) -> Any:
+        return self.copy() | other
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (SimulationResult, (np.array(self._data), self.columns))
+
+    @classmethod
+    def from_history(cls, history: Mapping[str, list[float]]) -> SimulationResult:
+        columns = [name for name in history if name != "time"] + ["time"]
+        num_times = len(history["time"])
+        data = np.full((len(columns), num_times), np.nan)
+        for i, name in enumerate(columns):
+            # Auxiliaries that were None at some steps leave shorter series.
+            values = history[name][:num_times]
+            data[i, : len(values)] = values
+        return cls(data, columns)
+
+    @property
+    def data(self) -> NDArray[np.floating[Any]]:
+        """Read-only (n_series, n_times) block, ``time`` last."""
+        return self._data
+
+    @property
+    def time(self) -> NDArray[np.floating[Any]]:
+        return self._data[-1]
+
+    @property
+    def variables(self) -> list[str]:
+        return self.columns[:-1]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SimulationResult):
+            return self.columns == other.columns and np.array_equal(
+                self._data, other._data, equal_nan=True
+            )
+        if isinstance(other, Mapping):
+            return set(self) == set(other) and all(
+                np.array_equal(self[name], np.asarray(other[name], dtype=float))
+                for name in self
+            )
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"SimulationResult({len(self.variables)} variables, "
+            f"{self._data.shape[1]} times)"
+        )
+
+    def to_numpy(self) -> NDArray[np.floating[Any]]:
+        """Read-only (n_times, n_variables) view, without the time column."""
+        return self._data[:-1].T
+
+    def to_pandas(self) -> pd.DataFrame:
+        """DataFrame over the same memory, with ``time`` as a column."""
+        import pandas as pd
+
+        return pd.DataFrame(self._data.T, columns=self.columns, copy=False)
+
+    def select(
+        self,
+        variables: list[str] | None = None,
+        start: float | None = None,
+        stop: float | None = None,
+        stride: int = 1,
+    ) -> SimulationResult:
+        """Subset by variables, the time window ``start <= t < stop`` and stride.
+
+        A time window alone is a view; choosing variables copies their rows.
+        """
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+        first = 0 if start is None else int(np.searchsorted(self.time, start))
+        last = (
+            len(self.time)
+            if stop is None
+            else int(np.searchsorted(self.time, stop))
+        )
+        if variables is None:
+            return SimulationResult(self._data[:, first:last:stride], self.columns)
+        unknown = [name for name in variables if name not in self._index]
+        if unknown:
+            raise KeyError(f"Unknown variables: {unknown}")
+        columns = [name for name in variables if name != "time"] + ["time"]
+        rows = [self._index[name] for name in columns]
+        return SimulationResult(self._data[rows, first:last:stride], columns)
+
+    def downsample(self, num_points: int, method: str = "minmax") -> SimulationResult:
+        """Keep about ``num_points`` steps per variable for plotting.
+
+        ``"minmax"`` keeps each bucket's extremes and ``"lttb"`` the points of
+        largest-triangle-three-buckets. Variables share one time axis, so the
+        steps chosen for each are merged and several variables can return up
+        to ``num_points`` steps each.
+        """
+        if method == "minmax":
+            steps = minmax_indices(self._data[:-1], num_points)
+        elif method == "lttb":
+            steps = lttb_indices(self.time, self._data[:-1], num_points)
+        else:
+            raise ValueError(f"Downsampling method '{method}' not supported.")
+        return SimulationResult(self._data[:, steps], self.columns)
+
+
+class EnsembleResult(Mapping[Any, SimulationResult]):
+    """Runs of one model stacked into a (n_members, n_series, n_times) array.
+
+    Members are keyed like the sensitivity results they replace (parameter
+    value or combination) and each row of ``parameters`` holds the member's
+    parameter values. ``result[key]`` is a ``SimulationResult`` view of one
+    member, so ensemble and single-run code read the same way.
+    """
+
+    def __init__(
+        self,
+        data: NDArray[np.floating[Any]],
+        columns: list[str],
+        keys: list[Any],
+        parameters: NDArray[Any],
+        parameter_names: list[str],
+    ) -> None:
+        if columns[-1] != "time":
+            raise ValueError("The last column of a result must be 'time'")
+        data.setflags(write=False)
+        self._data = data
+        self.columns = columns
+        self.member_keys = keys
+        self.parameters = parameters
+        self.parameter_names = parameter_names
+        self._members = {key: i for i, key in enumerate(keys)}
+        self._index = {name: i for i, name in enumerate(columns)}
+
+    @classmethod
+    def from_histories(
+        cls,
+        histories: Mapping[Any, Mapping[str, Any]],
+        parameter_names: list[str],
+    ) -> EnsembleResult:
+        keys = list(histories)
+        members = [
+            r if isinstance(r, SimulationResult) else SimulationResult.from_history(r)
+            for r in histories.values()
+        ]
+        if not members:
+            empty = np.empty((0, len(parameter_names)))
+            return cls(np.empty((0, 1, 0)), ["time"], [], empty, parameter_names)
+        columns = members[0].columns
+        num_times = len(members[0].time)
+        if any(m.columns != columns or len(m.time) != num_times for m in members):
+            raise ValueError("Ensemble members must record the same series and times")
+        data = np.stack([member._data for member in members])
+        return cls.from_array(data, columns, keys, parameter_names)
+
+    @classmethod
+    def from_array(
+        cls,
+        data: NDArray[np.floating[Any]],
+        columns: list[str],
+        keys: list[Any],
+        parameter_names: list[str],
+    ) -> EnsembleResult:
+        """Wrap a stacked array, deriving ``parameters`` from the member keys."""
+        rows = [key if isinstance(key, tuple) else (key,) for key in keys]
+        try:
+            parameters = np.array(rows, dtype=float)
+        except (TypeError, ValueError):
+            parameters = np.array(rows, dtype=object)
+        return cls(data, columns, keys, parameters, parameter_names)
+
+    def __getitem__(self, key: Any) -> SimulationResult:
+        return SimulationResult(self._data[self._members[key]], self.columns)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.member_keys)
+
+    def __len__(self) -> int:
+        return len(self.member_keys)
+
+    def __repr__(self) -> str:
+        members, series, times = self._data.shape
+        return (
+            f"EnsembleResult({members} members, {series - 1} variables, "
+            f"{times} times)"
+        )
+
+    @property
+    def data(self) -> NDArray[np.floating[Any]]:
+        """Read-only (n_members, n_series, n_times) block, ``time`` last."""
+        return self._data
+
+    @property
+    def time(self) -> NDArray[np.floating[Any]]:
+        return self._data[0, -1]
+
+    @property
+    def variables(self) -> list[str]:
+        return self.columns[:-1]
+
+    @property
+    def values(self) -> NDArray[np.floating[Any]]:
+        """Read-only (n_members, n_times, n_variables) view."""
+        return self._data[:, :-1, :].transpose(0, 2, 1)
+
+    def variable(self, name: str) -> NDArray[np.floating[Any]]:
+        """Read-only (n_members, n_times) view of one variable."""
+        return self._data[:, self._index[name], :]
+
+    def reduce(
+        self, reduction: str = "mean", axis: str = "time"
+    ) -> NDArray[np.floating[Any]]:
+        """Collapse ``values`` over ``"members"``, ``"time"`` or ``"variables"``."""
+        # Imported here: the scenario package itself depends on the engine.
+        from ..scenario.metrics import reduce_output
+
+        axes = {"members": 0, "time": 1, "variables": 2}
+        if axis not in axes:
+            raise ValueError(f"Axis '{axis}' not supported.")
+        return reduce_output(self.values, reduction, axis=axes[axis])
+
+    def select(self, **values: Any) -> EnsembleResult:
+        """Members whose parameters equal the given values, by parameter name."""
+        unknown = [name for name in values if name not in self.parameter_names]
+        if unknown:
+            raise KeyError(f"Unknown parameters: {unknown}")
+        mask = np.ones(len(self.member_keys), dtype=bool)
+        for name, value in values.items():
+            column = self.parameters[:, self.parameter_names.index(name)]
+            if column.dtype == object:
+                mask &= np.array([entry == value for entry in column], dtype=bool)
+            else:
+                mask &= np.isclose(column, value)
+        chosen = np.flatnonzero(mask)
+        return EnsembleResult(
+            self._data[chosen],
+            self.columns,
+            [self.member_keys[i] for i in chosen],
+            self.parameters[chosen],
+            self.parameter_names,
+        )
+
+    def parameter_table(self) -> pd.DataFrame:
+        import pandas as pd
+
+        return pd.DataFrame(self.parameters, columns=self.parameter_names)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Collection, Iterator
+from typing import Any
+
 from ..core.flow import Flow
 from ..core.stock import Stock
 from ..core.auxiliary import Auxiliary
@@ -14,16 +17,63 @@ class Simulation:
     def add_component(self, component: SystemComponent) -> None:
         self.components.append(component)
 
-    def run(self, until: float = 100, dt: float = 1) -> dict[str, list[float]]:
-        time: float = 0
-        self.initialize_history()
+    def run(
+        self,
+        until: float = 100,
+        dt: float = 1,
+        variables: Collection[str] | None = None,
+        record_steps: Collection[int] | None = None,
+        stop_when: Callable[[dict[str, list[float]]], bool] | None = None,
+        start_time: float = 0,
+    ) -> dict[str, list[float]]:
+        for _ in self.run_chunks(
+            until, dt, None, variables, record_steps, stop_when, start_time
+        ):
+            pass
+        return self.history
+
+    def run_chunks(
+        self,
+        until: float = 100,
+        dt: float = 1,
+        chunk_size: int | None = 256,
+        variables: Collection[str] | None = None,
+        record_steps: Collection[int] | None = None,
+        stop_when: Callable[[dict[str, list[float]]], bool] | None = None,
+        start_time: float = 0,
+    ) -> Iterator[dict[str, list[float]]]:
+        """Run like ``run``, yielding the history every ``chunk_size`` records.
+
+        Each full chunk is handed over and the history starts empty again, so
+        a consumer that stops iterating also stops the run. The last chunk
+        stays in ``history``; with ``chunk_size=None`` it is the whole run.
+        ``stop_when`` sees the current chunk only.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        time = start_time
+        step = 0
+        self.initialize_history(variables)
+        recorded = self._recorded_components(variables)
         while time < until:
             for component in self.components:
                 component.step(dt)
-            self.record_state(time)
+            if record_steps is None or step in record_steps:
+                self.record_state(time, recorded)
+                # Checked on recorded steps only; the history ends there.
+                if stop_when is not None and stop_when(self.history):
+                    break
+                if chunk_size is not None and len(self.history["time"]) >= chunk_size:
+                    yield self._take_history()
             time += dt
+            step += 1
+        if self.history["time"]:
+            yield self.history
 
-        return self.history
+    def _take_history(self) -> dict[str, list[float]]:
+        chunk = self.history
+        self.history = {name: [] for name in chunk}
+        return chunk
 
     def continue_run(
         self, current_state: dict[str, float], until: float, dt: float
@@ -32,7 +82,8 @@ class Simulation:
             if isinstance(component, Stock) and component.name in current_state:
                 component.value = current_state[component.name]
 
-        time = max(self.history["time"]) if self.history["time"] else 0
+        # Resume one step after the last recorded time instead of repeating it.
+        time = self.history["time"][-1] + dt if self.history["time"] else 0
         while time < until:
             for component in self.components:
                 component.step(dt)
@@ -41,15 +92,40 @@ class Simulation:
 
         return self.history
 
-    def initialize_history(self) -> None:
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Stock values and auxiliary positions needed to resume elsewhere."""
+        return {
+            "stocks": {
+                c.name: c.value for c in self.components if isinstance(c, Stock)
+            },
+            "auxiliary_steps": {
+                c.name: c.current_time_step
+                for c in self.components
+                if isinstance(c, Auxiliary)
+            },
+        }
+
+    def restore(self, snapshot: dict[str, dict[str, Any]]) -> None:
         for component in self.components:
+            if isinstance(component, Stock) and component.name in snapshot["stocks"]:
+                component.value = snapshot["stocks"][component.name]
+            elif isinstance(component, Auxiliary):
+                component.current_time_step = snapshot["auxiliary_steps"].get(
+                    component.name, component.current_time_step
+                )
+
+    def initialize_history(self, variables: Collection[str] | None = None) -> None:
+        self.history.clear()
+        for component in self._recorded_components(variables):
             self.history[component.name] = []
         self.history["time"] = []
 
-    def record_state(self, time: float) -> None:
+    def record_state(
+        self, time: float, components: list[SystemComponent] | None = None
+    ) -> None:
         self.history["time"].append(time)
 
-        for component in self.components:
+        for component in self.components if components is None else components:
             if isinstance(component, Stock):
                 self.history[component.name].append(component.value)
             elif isinstance(component, Flow):
@@ -60,5 +136,22 @@ class Simulation:
                 if aux_value is not None:
                     self.history[component.name].append(aux_value)
 
+    def _recorded_components(
+        self, variables: Collection[str] | None
+    ) -> list[SystemComponent]:
+        if variables is None:
+            return self.components
+        return [c for c in self.components if c.name in variables]
+
     def get_results(self) -> dict[str, list[float]]:
         return self.history
+
+
+def count_steps(until: float, dt: float, start_time: float = 0) -> int:
+    """Number of steps ``Simulation.run`` takes, with the same float rounding."""
+    time = start_time
+    steps = 0
+    while time < until:
+        time += dt
+        steps += 1
+    return steps
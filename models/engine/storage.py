@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from numpy.typing import NDArray
+
+from .result import EnsembleResult, SimulationResult
+
+# A stored result is a directory holding the (members, series, times) or
+# (series, times) block as ``data.npy`` plus ``meta.json``. The metadata is
+# written last, so a directory without it is an unfinished write.
+DATA_FILE = "data.npy"
+META_FILE = "meta.json"
+PARQUET_METADATA_KEY = b"pyvensim"
+
+Result = SimulationResult | EnsembleResult
+
+
+def save_result(result: Result, path: str | Path) -> Path:
+    """Write a result as a ``.npy`` directory, an ``.npz`` file or Parquet.
+
+    The format follows the suffix of ``path``: ``.parquet`` needs pyarrow,
+    ``.npz`` is a single uncompressed archive and anything else becomes a
+    directory that ``load_result`` memory-maps.
+    """
+    path = Path(path)
+    data = np.asarray(result.data)
+    meta = _metadata(result)
+    if path.suffix == ".parquet":
+        _write_parquet(data, meta, path)
+    elif path.suffix == ".npz":
+        with open(path, "wb") as handle:
+            np.savez(handle, data=data, meta=np.array(json.dumps(meta)))
+    else:
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / DATA_FILE, data)
+        _write_metadata(path, meta)
+    return path
+
+
+def load_result(path: str | Path, mmap: bool = True) -> Result:
+    """Reopen a saved result; directories are memory-mapped unless ``mmap=False``.
+
+    A memory-mapped result reads from disk only the slices that are used, so
+    selecting a few members or variables of a large ensemble stays cheap.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        data, meta = _read_parquet(path)
+    elif path.suffix == ".npz":
+        with np.load(path) as archive:
+            data = archive["data"]
+            meta = json.loads(str(archive["meta"]))
+    else:
+        if not (path / META_FILE).exists():
+            raise FileNotFoundError(f"No complete result stored at {path}")
+        meta = json.loads((path / META_FILE).read_text())
+        data = np.load(path / DATA_FILE, mmap_mode="r" if mmap else None)
+        data = data[..., : meta["num_times"]]
+    return _from_metadata(data, meta)
+
+
+class ResultWriter:
+    """Stream one run to disk in chunks of recorded steps.
+
+    The (series, times) file is allocated up front for ``num_times`` steps;
+    ``write`` fills the next columns, so only one chunk is held in memory.
+    A run that stops early leaves the unused tail out of the stored result.
+    """
+
+    def __init__(self, path: str | Path, columns: list[str], num_times: int) -> None:
+        if columns[-1] != "time":
+            raise ValueError("The last column of a result must be 'time'")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.columns = columns
+        self.num_written = 0
+        self._data = open_memmap(
+            self.path / DATA_FILE, mode="w+", shape=(len(columns), num_times)
+        )
+
+    def write(self, history: Mapping[str, list[float]]) -> None:
+        """Append the steps of a history chunk laid out like ``columns``."""
+        chunk = SimulationResult.from_history(history)
+        if chunk.columns != self.columns:
+            raise ValueError("History chunk does not match the writer columns")
+        end = self.num_written + len(chunk.time)
+        if end > self._data.shape[1]:
+            raise ValueError("More steps written than the result was sized for")
+        self._data[:, self.num_written : end] = chunk._data
+        self.num_written = end
+
+    def close(self) -> None:
+        self._data.flush()
+        meta = {
+            "kind": "simulation",
+            "columns": self.columns,
+            "num_times": self.num_written,
+        }
+        _write_metadata(self.path, meta)
+
+    def __enter__(self) -> ResultWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+
+
+class EnsembleWriter:
+    """Stream ensemble members to disk as they finish.
+
+    The file is sized on the first member, whose series and times every
+    later member must share.
+    """
+
+    def __init__(
+        self, path: str | Path, num_members: int, parameter_names: list[str]
+    ) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.num_members = num_members
+        self.parameter_names = parameter_names
+        self.keys: list[Any] = []
+        self.columns: list[str] | None = None
+        self._data: np.memmap[Any, Any] | None = None
+
+    def add(self, key: Any, history: Mapping[str, Any]) -> None:
+        member = (
+            history
+            if isinstance(history, SimulationResult)
+            else SimulationResult.from_history(history)
+        )
+        if len(self.keys) >= self.num_members:
+            raise ValueError(f"The ensemble was sized for {self.num_members} members")
+        if self._data is None:
+            self.columns = member.columns
+            self._data = open_memmap(
+                self.path / DATA_FILE,
+                mode="w+",
+                shape=(self.num_members, *member.data.shape),
+            )
+        elif (
+            member.columns != self.columns
+            or member.data.shape != self._data.shape[1:]
+        ):
+            raise ValueError("Ensemble members must record the same series and times")
+        self._data[len(self.keys)] = member.data
+        self.keys.append(key)
+
+    def close(self) -> None:
+        if self._data is None:
+            raise ValueError("No ensemble members were written")
+        if len(self.keys) < self.num_members:
+            raise ValueError(
+                f"Only {len(self.keys)} of {self.num_members} members were written"
+            )
+        self._data.flush()
+        _write_metadata(
+            self.path,
+            {
+                "kind": "ensemble",
+                "columns": self.columns,
+                "num_times": self._data.shape[2],
+                "keys": [_encode_key(key) for key in self.keys],
+                "parameter_names": self.parameter_names,
+            },
+        )
+
+    def __enter__(self) -> EnsembleWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+
+
+def _metadata(result: Result) -> dict[str, Any]:
+    if isinstance(result, EnsembleResult):
+        return {
+            "kind": "ensemble",
+            "columns": result.columns,
+            "num_times": result.data.shape[2],
+            "keys": [_encode_key(key) for key in result.member_keys],
+            "parameter_names": result.parameter_names,
+        }
+    return {
+        "kind": "simulation",
+        "columns": result.columns,
+        "num_times": result.data.shape[1],
+    }
+
+
+def _from_metadata(data: NDArray[np.floating[Any]], meta: dict[str, Any]) -> Result:
+    if meta["kind"] == "ensemble":
+        keys = [_decode_key(key) for key in meta["keys"]]
+        return EnsembleResult.from_array(
+            data, meta["columns"], keys, meta["parameter_names"]
+        )
+    return SimulationResult(data, meta["columns"])
+
+
+def _encode_key(key: Any) -> Any:
+    # JSON has no tuples; multivariate keys come back as lists.
+    if isinstance(key, tuple):
+        return [_encode_key(part) for part in key]
+    if isinstance(key, np.generic):
+        return key.item()
+    return key
+
+
+def _decode_key(key: Any) -> Any:
+    if isinstance(key, list):
+        return tuple(_decode_key(part) for part in key)
+    return key
+
+
+def _write_metadata(path: Path, meta: dict[str, Any]) -> None:
+    temporary = path / f"{META_FILE}.tmp"
+    temporary.write_text(json.dumps(meta))
+    os.replace(temporary, path / META_FILE)
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet results require pyarrow; install it or use the .npy format."
+        ) from e
+    return pyarrow
+
+
+def _write_parquet(
+    data: NDArray[np.floating[Any]], meta: dict[str, Any], path: Path
+) -> None:
+    pa = _require_pyarrow()
+    # Ensembles are stored long: one row per member and time.
+    if meta["kind"] == "ensemble":
+        num_members, _, num_times = data.shape
+        arrays = {"member": np.repeat(np.arange(num_members), num_times)}
+        arrays.update(
+            (name, data[:, i, :].reshape(-1)) for i, name in enumerate(meta["columns"])
+        )
+    else:
+        arrays = {name: data[i] for i, name in enumerate(meta["columns"])}
+    table = pa.table(arrays).replace_schema_metadata(
+        {PARQUET_METADATA_KEY: json.dumps(meta).encode()}
+    )
+    pa.parquet.write_table(table, path)
+
+
+def _read_parquet(path: Path) -> tuple[NDArray[np.floating[Any]], dict[str, Any]]:
+    pa = _require_pyarrow()
+    table = pa.parquet.read_table(path, memory_map=True)
+    meta = json.loads(table.schema.metadata[PARQUET_METADATA_KEY])
+    columns = [table.column(name).to_numpy() for name in meta["columns"]]
+    data = np.stack(columns)
+    if meta["kind"] == "ensemble":
+        num_members = len(meta["keys"])
+        data = data.reshape(len(columns), num_members, -1).transpose(1, 0, 2)
+        data = np.ascontiguousarray(data)
+    return data, meta
@@ -1,7 +1,13 @@
+from .branching import Branch, BranchResult
 from .scenario import Scenario
 from .scenario_manager import ScenarioManager
+from .surrogate import Surrogate, fit_surrogate
 
 __all__ = [
+    "Branch",
+    "BranchResult",
     "Scenario",
     "ScenarioManager",
+    "Surrogate",
+    "fit_surrogate",
 ]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from ..engine.result import SimulationResult
+from .scenario import Scenario
+
+
+class Branch:
+    """A variant that follows its baseline until ``at`` and then diverges.
+
+    ``overrides`` uses the ``construct_simulation`` layout: ``auxiliaries``
+    replace auxiliary values from the branch point on and ``initial_values``
+    reset stocks at the branch point.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        baseline: str,
+        at: float,
+        overrides: dict[str, dict[str, Any]],
+    ) -> None:
+        if at < 0:
+            raise ValueError("Branch time must not be negative")
+        self.name = name
+        self.baseline = baseline
+        self.at = at
+        self.overrides = overrides
+
+
+class BranchResult(Mapping[str, list[float]]):
+    """Branch history stored as its baseline prefix plus its own suffix.
+
+    Only the suffix belongs to the branch; the prefix is shared with the
+    baseline results and series are joined when they are read.
+    """
+
+    def __init__(
+        self,
+        prefix: Mapping[str, list[float]],
+        split: int,
+        suffix: dict[str, list[float]],
+    ) -> None:
+        self.prefix = prefix
+        self.split = split
+        self.suffix = suffix
+
+    def __getitem__(self, name: str) -> list[float]:
+        return self.prefix[name][: self.split] + self.suffix[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.suffix)
+
+    def __len__(self) -> int:
+        return len(self.suffix)
+
+
+def run_branched(
+    scenario: Scenario,
+    branches: list[Branch],
+    simulation_time: float,
+    dt: float,
+) -> tuple[SimulationResult, dict[str, tuple[int, dict[str, list[float]]]]]:
+    """Run the baseline once, forking the engine state at each branch point.
+
+    Returns the baseline history and, per branch, the number of shared
+    baseline steps and the branch's own suffix history.
+    """
+    split_of = {branch.name: round(branch.at / dt) for branch in branches}
+    snapshots: dict[int, dict[str, dict[str, Any]]] = {}
+    simulation = scenario.construct_simulation()
+    if 0 in split_of.values():
+        snapshots[0] = simulation.snapshot()
+
+    def take_snapshots(history: dict[str, list[float]]) -> bool:
+        steps_done = len(history["time"])
+        if steps_done in split_of.values():
+            snapshots[steps_done] = simulation.snapshot()
+        return False
+
+    baseline = SimulationResult.from_history(
+        simulation.run(simulation_time, dt, stop_when=take_snapshots)
+    )
+    scenario.results = baseline
+
+    suffixes: dict[str, tuple[int, dict[str, list[float]]]] = {}
+    for branch in branches:
+        split = split_of[branch.name]
+        if split >= len(baseline["time"]):
+            suffixes[branch.name] = (split, {name: [] for name in baseline})
+            continue
+        stock_overrides = branch.overrides.get("initial_values", {})
+        fork = scenario.construct_simulation(
+            {"auxiliaries": branch.overrides.get("auxiliaries", {})}
+        )
+        fork.restore(snapshots[split])
+        fork.restore({"stocks": stock_overrides, "auxiliary_steps": {}})
+        suffix = fork.run(simulation_time, dt, start_time=split * dt)
+        suffixes[branch.name] = (split, suffix)
+    return baseline, suffixes
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+REDUCTIONS: dict[str, Callable[[NDArray[np.floating[Any]], int], Any]] = {
+    "mean": lambda values, axis: np.mean(values, axis=axis),
+    "final": lambda values, axis: np.take(values, -1, axis=axis),
+    "peak": lambda values, axis: np.max(values, axis=axis),
+}
+
+
+def reduce_output(values: ArrayLike, reduction: str = "mean", axis: int = -1) -> Any:
+    """Collapse a trajectory (or a stack of them) along the time axis."""
+    if reduction not in REDUCTIONS:
+        raise ValueError(f"Reduction '{reduction}' not supported.")
+    return REDUCTIONS[reduction](np.asarray(values, dtype=float), axis)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..engine.parallel import worker_pool
+from .metrics import reduce_output
+
+
+def generate_morris_trajectories(
+    num_factors: int,
+    num_trajectories: int,
+    num_levels: int = 4,
+    rng: np.random.Generator | None = None,
+) -> NDArray[np.floating[Any]]:
+    """Sample (r, k + 1, k) one-at-a-time trajectories on the unit hypercube."""
+    if num_levels < 2:
+        raise ValueError("num_levels must be at least 2")
+    rng = rng if rng is not None else np.random.default_rng()
+
+    delta = num_levels / (2 * (num_levels - 1))
+    grid = np.arange(num_levels) / (num_levels - 1)
+    base_levels = grid[grid <= 1 - delta + 1e-12]
+
+    trajectories = np.empty((num_trajectories, num_factors + 1, num_factors))
+    for j in range(num_trajectories):
+        directions = rng.choice([-1.0, 1.0], size=num_factors)
+        point = rng.choice(base_levels, size=num_factors) + delta * (directions < 0)
+        trajectories[j, 0] = point
+        for step, factor in enumerate(rng.permutation(num_factors), start=1):
+            point = point.copy()
+            point[factor] += directions[factor] * delta
+            trajectories[j, step] = point
+
+    return trajectories
+
+
+def validate_parameters(
+    scenario: Any,
+    parameters: list[dict[str, str]],
+    bounds: list[tuple[float, float]],
+) -> None:
+    if len(parameters) != len(bounds):
+        raise ValueError("Each parameter needs a (lower, upper) bound")
+    aux_names = {aux.name for aux in scenario.auxiliaries}
+    for param in parameters:
+        if param["component"] == "auxiliaries":
+            known = param["name"] in aux_names
+        elif param["component"] == "stocks":
+            known = param["name"] in scenario.initial_values
+        else:
+            raise ValueError(f"Unknown component '{param['component']}'")
+        if not known:
+            raise ValueError(
+                f"Unknown {param['component']} parameter '{param['name']}'"
+            )
+
+
+def run_morris_screening(
+    scenario: Any,
+    parameters: list[dict[str, str]],
+    bounds: list[tuple[float, float]],
+    outputs: list[str],
+    reduction: str = "mean",
+    num_trajectories: int = 10,
+    num_levels: int = 4,
+    until: float = 100,
+    dt: float = 1,
+    seed: int | None = None,
+    max_workers: int = 1,
+    executor: Executor | None = None,
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Return mu, mu* and sigma of the elementary effects per output and parameter."""
+    validate_parameters(scenario, parameters, bounds)
+
+    num_factors = len(parameters)
+    rng = np.random.default_rng(seed)
+    unit_trajectories = generate_morris_trajectories(
+        num_factors, num_trajectories, num_levels, rng
+    )
+    lower, upper = np.asarray(bounds, dtype=float).T
+    trajectories = lower + unit_trajectories * (upper - lower)
+
+    run_args = (scenario, parameters, outputs, reduction, until, dt)
+    if executor is not None or max_workers > 1:
+        with worker_pool(scenario, max_workers, executor) as pool:
+            futures = [pool.submit(evaluate_points, t, *run_args) for t in trajectories]
+            evaluations = [future.result() for future in futures]
+    else:
+        evaluations = [evaluate_points(t, *run_args) for t in trajectories]
+
+    # (r, k + 1, n_outputs) model outputs -> (r, k, n_outputs) elementary effects
+    outputs_array = np.stack(evaluations)
+    steps = np.diff(unit_trajectories, axis=1)
+    factor_index = np.argmax(np.abs(steps), axis=2)
+    step_size = np.take_along_axis(steps, factor_index[..., None], axis=2)
+    effects = np.diff(outputs_array, axis=1) / step_size
+
+    by_factor = np.empty((num_trajectories, num_factors, len(outputs)))
+    rows = np.arange(num_trajectories)[:, None]
+    by_factor[rows, factor_index] = effects
+
+    mu = by_factor.mean(axis=0)
+    mu_star = np.abs(by_factor).mean(axis=0)
+    sigma = (
+        by_factor.std(axis=0, ddof=1)
+        if num_trajectories > 1
+        else np.zeros_like(mu)
+    )
+
+    return {
+        output: {
+            param["name"]: {
+                "mu": float(mu[i, o]),
+                "mu_star": float(mu_star[i, o]),
+                "sigma": float(sigma[i, o]),
+            }
+            for i, param in enumerate(parameters)
+        }
+        for o, output in enumerate(outputs)
+    }
+
+
+def evaluate_points(
+    points: NDArray[np.floating[Any]],
+    scenario: Any,
+    parameters: list[dict[str, str]],
+    outputs: list[str],
+    reduction: str,
+    until: float,
+    dt: float,
+) -> NDArray[np.floating[Any]]:
+    """Reduced outputs (n_points, n_outputs), one simulation per point."""
+    results = np.empty((len(points), len(outputs)))
+    for row, point in enumerate(points):
+        modified_parameters: dict[str, dict[str, float]] = {
+            "auxiliaries": {},
+            "initial_values": {},
+        }
+        for param, value in zip(parameters, point):
+            if param["component"] == "auxiliaries":
+                modified_parameters["auxiliaries"][param["name"]] = float(value)
+            else:
+                modified_parameters["initial_values"][param["name"]] = float(value)
+
+        history = scenario.construct_simulation(modified_parameters).run(until, dt)
+        for col, output in enumerate(outputs):
+            if output not in history:
+                raise ValueError(f"Unknown output '{output}'")
+            results[row, col] = reduce_output(history[output], reduction)
+    return results
@@ -2,15 +2,24 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import Callable
+from concurrent.futures import Executor
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
 
 from ..calibration.calibrator import Calibrator
 from ..core.auxiliary import Auxiliary
 from ..core.flow import Flow
 from ..core.stock import Stock
-from ..engine.simulation import Simulation
+from ..engine.result import EnsembleResult, SimulationResult
+from ..engine.simulation import Simulation, count_steps
+from ..engine.storage import EnsembleWriter, ResultWriter, load_result
+from .metrics import reduce_output
+from .morris import run_morris_screening
+from .surrogate import Surrogate, fit_surrogate
 
 
 class Scenario:
@@ -25,7 +34,7 @@ class Scenario:
         self.initial_values = initial_values
         self.rates = rates
         self.auxiliaries = auxiliaries
-        self.results: dict[str, list[float]] | None = None
+        self.results: SimulationResult | None = None
 
     def construct_simulation(
         self, modified_parameters: dict[str, Any] | None = None
@@ -40,7 +49,15 @@ class Scenario:
                 if name in stocks:
                     stocks[name].value = value
 
-        aux_values = {aux.name: aux.value() for aux in self.auxiliaries}
+        auxiliaries = self.auxiliaries
+        if modified_parameters and "auxiliaries" in modified_parameters:
+            overrides = modified_parameters["auxiliaries"]
+            auxiliaries = [
+                Auxiliary(aux.name, overrides.get(aux.name, aux.values))
+                for aux in self.auxiliaries
+            ]
+
+        aux_values = {aux.name: aux.value() for aux in auxiliaries}
 
         flows: list[Flow] = []
         for rate_name, rate_details in self.rates.items():
@@ -71,16 +88,40 @@ class Scenario:
             simulation.add_component(stock)
         for flow in flows:
             simulation.add_component(flow)
-        for auxiliary in self.auxiliaries:
+        for auxiliary in auxiliaries:
             simulation.add_component(auxiliary)
 
         return simulation
 
-    def run(self, simulation_time: float, dt: float) -> dict[str, list[float]]:
+    def run(self, simulation_time: float, dt: float) -> SimulationResult:
         simulation = self.construct_simulation()
-        self.results = simulation.run(until=simulation_time, dt=dt)
+        history = simulation.run(until=simulation_time, dt=dt)
+        self.results = SimulationResult.from_history(history)
         return self.results
 
+    def run_to_disk(
+        self,
+        path: str | Path,
+        simulation_time: float,
+        dt: float,
+        chunk_size: int = 1024,
+    ) -> SimulationResult:
+        """Run while writing every ``chunk_size`` steps to ``path``.
+
+        At most one chunk of history is kept in memory; the returned result
+        is memory-mapped from disk.
+        """
+        simulation = self.construct_simulation()
+        simulation.initialize_history()
+        writer = ResultWriter(
+            path, list(simulation.history), count_steps(simulation_time, dt)
+        )
+        with writer:
+            for chunk in simulation.run_chunks(simulation_time, dt, chunk_size):
+                writer.write(chunk)
+        self.results = load_result(path)  # type: ignore[assignment]
+        return self.results  # type: ignore[return-value]
+
     def run_sensitivity_analysis_univariate(
         self,
         component_name: str,
@@ -88,17 +129,30 @@ class Scenario:
         range_values: list[Any],
         until: float = 100,
         dt: float = 1,
-    ) -> dict[Any, dict[str, list[float]]]:
+        store: str | Path | None = None,
+    ) -> EnsembleResult:
         original_values = self._get_original_values(component_name, parameter)
         results: dict[Any, dict[str, list[float]]] = {}
+        writer = (
+            None
+            if store is None
+            else EnsembleWriter(store, len(range_values), [parameter])
+        )
 
         for value in range_values:
             self._modify_component_value(component_name, parameter, value)
             simulation = self.construct_simulation()
-            results[value] = simulation.run(until, dt)
+            history = simulation.run(until, dt)
+            if writer is None:
+                results[value] = history
+            else:
+                writer.add(value, history)
             self._restore_original_values(component_name, parameter, original_values)
 
-        return results
+        if writer is not None:
+            writer.close()
+            return load_result(writer.path)  # type: ignore[return-value]
+        return EnsembleResult.from_histories(results, [parameter])
 
     def run_sensitivity_analysis_multivariate(
         self,
@@ -106,9 +160,17 @@ class Scenario:
         param_combinations: list[tuple[Any, ...]],
         until: float = 100,
         dt: float = 1,
-    ) -> dict[tuple[Any, ...], dict[str, list[float]]]:
+        store: str | Path | None = None,
+    ) -> EnsembleResult:
+        """Run every combination; ``store`` streams members to disk instead."""
         results: dict[tuple[Any, ...], dict[str, list[float]]] = {}
         original_values: dict[str, Any] = {}
+        names = [param["name"] for param in parameters]
+        writer = (
+            None
+            if store is None
+            else EnsembleWriter(store, len(param_combinations), names)
+        )
 
         for param in parameters:
             original_values[param["name"]] = self._get_original_values(
@@ -122,14 +184,81 @@ class Scenario:
                 )
 
             simulation = self.construct_simulation()
-            results[combination] = simulation.run(until, dt)
+            history = simulation.run(until, dt)
+            if writer is None:
+                results[combination] = history
+            else:
+                writer.add(combination, history)
 
             for param in parameters:
                 self._restore_original_values(
                     param["component"], param["name"], original_values[param["name"]]
                 )
 
-        return results
+        if writer is not None:
+            writer.close()
+            return load_result(writer.path)  # type: ignore[return-value]
+        return EnsembleResult.from_histories(results, names)
+
+    def run_sensitivity_analysis_morris(
+        self,
+        parameters: list[dict[str, str]],
+        bounds: list[tuple[float, float]],
+        outputs: list[str],
+        reduction: str = "mean",
+        num_trajectories: int = 10,
+        num_levels: int = 4,
+        until: float = 100,
+        dt: float = 1,
+        seed: int | None = None,
+        max_workers: int = 1,
+        executor: Executor | None = None,
+    ) -> dict[str, dict[str, dict[str, float]]]:
+        return run_morris_screening(
+            self,
+            parameters,
+            bounds,
+            outputs,
+            reduction=reduction,
+            num_trajectories=num_trajectories,
+            num_levels=num_levels,
+            until=until,
+            dt=dt,
+            seed=seed,
+            max_workers=max_workers,
+            executor=executor,
+        )
+
+    def fit_surrogate(
+        self,
+        parameters: list[dict[str, str]],
+        bounds: list[tuple[float, float]],
+        outputs: list[str],
+        reduction: str = "mean",
+        degree: int = 2,
+        num_samples: int | None = None,
+        num_validation: int = 16,
+        until: float = 100,
+        dt: float = 1,
+        seed: int | None = None,
+        max_workers: int = 1,
+        executor: Executor | None = None,
+    ) -> Surrogate:
+        return fit_surrogate(
+            self,
+            parameters,
+            bounds,
+            outputs,
+            reduction=reduction,
+            degree=degree,
+            num_samples=num_samples,
+            num_validation=num_validation,
+            until=until,
+            dt=dt,
+            seed=seed,
+            max_workers=max_workers,
+            executor=executor,
+        )
 
     def _get_original_values(self, component_name: str, parameter: str) -> Any:
         if component_name == "auxiliaries":
@@ -162,33 +291,45 @@ class Scenario:
 
     def calculate_elasticities(
         self,
-        sensitivity_results: dict[tuple[Any, ...], dict[str, list[float]]],
-        base_params: tuple[Any, ...],
-        comparison_params: tuple[Any, ...],
+        sensitivity_results: dict[Any, dict[str, list[float]]],
+        base_params: Any,
+        comparison_params: list[Any] | None,
         stock_name: str,
-    ) -> dict[tuple[Any, ...], float]:
-        elasticities: dict[tuple[Any, ...], float] = {}
-        base_df = pd.DataFrame(sensitivity_results[base_params])
-        base_population: float = base_df[stock_name].mean()
-
-        for params, comparison_dict in sensitivity_results.items():
-            if params != base_params:
-                comparison_df = pd.DataFrame(comparison_dict)
-                comparison_population: float = comparison_df[stock_name].mean()
-                percentage_change_in_population = (
-                    (comparison_population - base_population) / base_population
-                ) * 100
-                percentage_change_in_params = (
-                    (params[0] - base_params[0]) / base_params[0]
-                ) * 100
-
-                if percentage_change_in_params != 0:
-                    elasticity = (
-                        percentage_change_in_population / percentage_change_in_params
-                    )
-                    elasticities[params] = elasticity
-
-        return elasticities
+        reduction: str = "mean",
+        parameter_names: list[str] | None = None,
+    ) -> dict[Any, NDArray[np.floating[Any]]]:
+        combinations = (
+            list(sensitivity_results)
+            if comparison_params is None
+            else list(comparison_params)
+        )
+        ensemble = np.array(
+            [sensitivity_results[params][stock_name] for params in combinations],
+            dtype=float,
+        )
+        outputs = reduce_output(ensemble, reduction, axis=1)
+        base_output = reduce_output(
+            sensitivity_results[base_params][stock_name], reduction
+        )
+
+        param_values = np.array(combinations, dtype=float).reshape(
+            len(combinations), -1
+        )
+        base_values = np.atleast_1d(np.asarray(base_params, dtype=float))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            output_change = (outputs - base_output) / base_output * 100
+            param_change = (param_values - base_values) / base_values * 100
+            elasticities = output_change[:, None] / param_change
+        elasticities[param_change == 0] = np.nan
+
+        num_params = param_values.shape[1]
+        if parameter_names is not None and len(parameter_names) != num_params:
+            raise ValueError(
+                f"Expected {num_params} parameter names, got {len(parameter_names)}"
+            )
+        keys = parameter_names or list(range(num_params))
+        return {key: elasticities[:, i] for i, key in enumerate(keys)}
 
     def apply_shock_over_period(
         self, components: dict[str, dict[str, Any]], until: float = 100, dt: float = 1
@@ -249,10 +390,23 @@ class Scenario:
 
     def calibrate(
         self,
-        data: pd.DataFrame,
+        data: pd.DataFrame | str | Path,
         method: str = "least_squares",
         simulation_time: float = 91,
         dt: float = 1,
+        bounds: list[tuple[float, float]] | None = None,
+        time_column: str | None = None,
+        weights: dict[str, float] | None = None,
+        time_origin: float = 0,
+        **options: Any,
     ) -> Any:
-        calibrator = Calibrator(self, simulation_time=simulation_time, dt=dt)
-        return calibrator.calibrate(data, method)
+        calibrator = Calibrator(
+            self,
+            simulation_time=simulation_time,
+            dt=dt,
+            bounds=bounds,
+            time_column=time_column,
+            weights=weights,
+            time_origin=time_origin,
+        )
+        return calibrator.calibrate(data, method, **options)
@@ -1,26 +1,135 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor, Future, as_completed
+from typing import Any
+
+from ..engine.parallel import worker_pool
+from ..engine.result import SimulationResult
+from .branching import Branch, BranchResult, run_branched
 from .scenario import Scenario
 
 
 class ScenarioManager:
     def __init__(self) -> None:
         self.scenarios: list[Scenario] = []
+        self.branches: list[Branch] = []
+        self.results: dict[str, Mapping[str, list[float]]] = {}
+        self.failures: dict[str, BaseException] = {}
+        self._by_name: dict[str, Scenario] = {}
 
     def add_scenario(self, scenario: Scenario) -> None:
         self.scenarios.append(scenario)
+        self._by_name[scenario.name] = scenario
+
+    def add_branch(
+        self,
+        name: str,
+        baseline: str,
+        at: float,
+        overrides: dict[str, dict[str, Any]],
+    ) -> None:
+        """Declare a variant equal to ``baseline`` until ``at``, then overridden.
+
+        The baseline is simulated once; branches only simulate from ``at``.
+        """
+        if baseline not in self._by_name:
+            raise ValueError(f"Unknown baseline scenario '{baseline}'")
+        if name in self._by_name or any(b.name == name for b in self.branches):
+            raise ValueError(f"Scenario name '{name}' is already used")
+        self.branches.append(Branch(name, baseline, at, overrides))
 
     def reset_timesteps(self, scenario: Scenario) -> None:
         for aux in scenario.auxiliaries:
             aux.current_time_step = 0
 
-    def run_all(self, simulation_time: float, dt: float) -> None:
+    def run_all(
+        self,
+        simulation_time: float,
+        dt: float,
+        max_workers: int = 1,
+        executor: Executor | None = None,
+        on_complete: Callable[[str, BaseException | None], Any] | None = None,
+    ) -> dict[str, BaseException]:
+        """Run every scenario, returning the failures by scenario name.
+
+        A failing scenario is recorded in ``failures`` and reported through
+        ``on_complete`` without stopping the others. Parallel runs are
+        reported as they finish.
+        """
+        self.failures = {}
         for scenario in self.scenarios:
             self.reset_timesteps(scenario)
-            scenario.run(simulation_time, dt)
 
-    def get_results(self, scenario_name: str) -> dict[str, list[float]] | None:
-        for scenario in self.scenarios:
-            if scenario.name == scenario_name:
-                return scenario.results
-        return None
+        run_args = (simulation_time, dt)
+        if executor is None and max_workers <= 1:
+            for scenario in self.scenarios:
+                branches = self._branches_of(scenario)
+                try:
+                    outcome = _run_scenario(scenario, branches, *run_args)
+                except Exception as e:  # noqa: BLE001
+                    self._record(scenario, None, e, on_complete)
+                else:
+                    self._record(scenario, outcome, None, on_complete)
+            return self.failures
+
+        with worker_pool(self.scenarios, max_workers, executor) as pool:
+            futures: dict[Future[Any], Scenario] = {
+                pool.submit(
+                    _run_scenario, scenario, self._branches_of(scenario), *run_args
+                ): scenario
+                for scenario in self.scenarios
+            }
+            for future in as_completed(futures):
+                scenario = futures[future]
+                error = future.exception()
+                if error is None:
+                    self._record(scenario, future.result(), None, on_complete)
+                else:
+                    self._record(scenario, None, error, on_complete)
+        return self.failures
+
+    def get_results(self, scenario_name: str) -> Mapping[str, list[float]] | None:
+        # A scenario's own results are current even after a direct run;
+        # branches exist only in the store.
+        scenario = self._by_name.get(scenario_name)
+        if scenario is not None:
+            return scenario.results
+        return self.results.get(scenario_name)
+
+    def _branches_of(self, scenario: Scenario) -> list[Branch]:
+        return [b for b in self.branches if b.baseline == scenario.name]
+
+    def _record(
+        self,
+        scenario: Scenario,
+        outcome: tuple[SimulationResult, dict[str, Any]] | None,
+        error: BaseException | None,
+        on_complete: Callable[[str, BaseException | None], Any] | None,
+    ) -> None:
+        names = [scenario.name] + [b.name for b in self._branches_of(scenario)]
+        if outcome is None:
+            for name in names:
+                self.results.pop(name, None)
+                self.failures[name] = error  # type: ignore[assignment]
+        else:
+            # Worker processes run a copy, so results are stored back here.
+            baseline, suffixes = outcome
+            scenario.results = baseline
+            self.results[scenario.name] = baseline
+            for name, (split, suffix) in suffixes.items():
+                self.results[name] = BranchResult(baseline, split, suffix)
+        if on_complete is not None:
+            for name in names:
+                on_complete(name, error)
+
+
+def _run_scenario(
+    scenario: Scenario,
+    branches: list[Branch],
+    simulation_time: float,
+    dt: float,
+) -> tuple[SimulationResult, dict[str, Any]]:
+    if branches:
+        return run_branched(scenario, branches, simulation_time, dt)
+    return scenario.run(simulation_time, dt), {}
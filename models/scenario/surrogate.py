@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import Executor
+from typing import Any
+
+import numpy as np
+from numpy.polynomial import legendre
+from numpy.typing import ArrayLike, NDArray
+from scipy.optimize import minimize
+from scipy.stats import qmc
+
+from ..engine.parallel import worker_pool
+from .morris import evaluate_points, validate_parameters
+
+
+class Surrogate:
+    """Polynomial chaos emulator of reduced scenario outputs.
+
+    Outputs are expanded in Legendre polynomials of the parameters scaled to
+    [-1, 1], which makes predictions a single matrix product and gives Sobol
+    indices directly from the coefficients.
+    """
+
+    def __init__(
+        self,
+        parameters: list[dict[str, str]],
+        bounds: list[tuple[float, float]],
+        outputs: list[str],
+        exponents: NDArray[np.integer[Any]],
+        coefficients: NDArray[np.floating[Any]],
+    ) -> None:
+        self.parameters = parameters
+        self.bounds = bounds
+        self.outputs = outputs
+        self.exponents = exponents
+        self.coefficients = coefficients
+        self.validation: dict[str, dict[str, float]] = {}
+        self._lower, self._upper = np.asarray(bounds, dtype=float).T
+
+    @property
+    def parameter_names(self) -> list[str]:
+        return [param["name"] for param in self.parameters]
+
+    def predict(self, points: ArrayLike) -> NDArray[np.floating[Any]]:
+        """Predicted outputs (n_points, n_outputs) for parameter points."""
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        unit = _to_unit(points, self._lower, self._upper)
+        return _legendre_basis(unit, self.exponents) @ self.coefficients
+
+    def sobol_indices(self) -> dict[str, dict[str, dict[str, float]]]:
+        """First-order and total Sobol indices per output and parameter."""
+        # Legendre polynomials on [-1, 1] have E[P_k^2] = 1 / (2k + 1).
+        norms = np.prod(1.0 / (2 * self.exponents + 1), axis=1)
+        contributions = self.coefficients**2 * norms[:, None]
+        non_constant = self.exponents.sum(axis=1) > 0
+        variance = contributions[non_constant].sum(axis=0)
+
+        indices: dict[str, dict[str, dict[str, float]]] = {}
+        for o, output in enumerate(self.outputs):
+            indices[output] = {}
+            for i, name in enumerate(self.parameter_names):
+                involves = self.exponents[:, i] > 0
+                only = involves & (self.exponents.sum(axis=1) == self.exponents[:, i])
+                total = variance[o] if variance[o] > 0 else np.nan
+                indices[output][name] = {
+                    "first": float(contributions[only, o].sum() / total),
+                    "total": float(contributions[involves, o].sum() / total),
+                }
+        return indices
+
+    def fit_targets(
+        self, targets: dict[str, float], weights: dict[str, float] | None = None
+    ) -> dict[str, float]:
+        """Parameter values whose predicted outputs best match ``targets``."""
+        unknown = [name for name in targets if name not in self.outputs]
+        if unknown:
+            raise ValueError(f"Unknown surrogate outputs: {unknown}")
+        columns = [self.outputs.index(name) for name in targets]
+        observed = np.array(list(targets.values()), dtype=float)
+        scale = np.sqrt([(weights or {}).get(name, 1.0) for name in targets])
+
+        def loss(unit: NDArray[np.floating[Any]]) -> float:
+            basis = _legendre_basis(unit[None, :], self.exponents)
+            predicted = basis @ self.coefficients[:, columns]
+            return float(np.sum(((predicted[0] - observed) * scale) ** 2))
+
+        start = np.zeros(len(self.parameters))
+        result = minimize(
+            loss, start, method="L-BFGS-B", bounds=[(-1.0, 1.0)] * len(start)
+        )
+        values = self._lower + (result.x + 1) / 2 * (self._upper - self._lower)
+        return dict(zip(self.parameter_names, values.tolist()))
+
+
+def fit_surrogate(
+    scenario: Any,
+    parameters: list[dict[str, str]],
+    bounds: list[tuple[float, float]],
+    outputs: list[str],
+    reduction: str = "mean",
+    degree: int = 2,
+    num_samples: int | None = None,
+    num_validation: int = 16,
+    until: float = 100,
+    dt: float = 1,
+    seed: int | None = None,
+    max_workers: int = 1,
+    executor: Executor | None = None,
+) -> Surrogate:
+    """Fit a surrogate on a Latin hypercube design of real runs.
+
+    ``num_samples`` defaults to twice the number of polynomial terms. A
+    separate set of ``num_validation`` runs is held out and summarised in
+    ``Surrogate.validation``.
+    """
+    validate_parameters(scenario, parameters, bounds)
+    exponents = np.array(
+        [
+            powers
+            for powers in itertools.product(range(degree + 1), repeat=len(parameters))
+            if sum(powers) <= degree
+        ],
+        dtype=int,
+    ).reshape(-1, len(parameters))
+    num_samples = 2 * len(exponents) if num_samples is None else num_samples
+    if num_samples < len(exponents):
+        raise ValueError(
+            f"A degree {degree} surrogate needs at least {len(exponents)} samples"
+        )
+
+    lower, upper = np.asarray(bounds, dtype=float).T
+    sampler = qmc.LatinHypercube(d=len(parameters), seed=seed)
+    points = qmc.scale(sampler.random(num_samples + num_validation), lower, upper)
+
+    run_args = (scenario, parameters, outputs, reduction, until, dt)
+    if executor is not None or max_workers > 1:
+        chunks = np.array_split(points, max(max_workers, 1) * 4)
+        with worker_pool(scenario, max_workers, executor) as pool:
+            futures = [pool.submit(evaluate_points, c, *run_args) for c in chunks]
+            values = np.vstack([future.result() for future in futures])
+    else:
+        values = evaluate_points(points, *run_args)
+
+    design = _legendre_basis(_to_unit(points[:num_samples], lower, upper), exponents)
+    coefficients, *_ = np.linalg.lstsq(design, values[:num_samples], rcond=None)
+    surrogate = Surrogate(parameters, bounds, outputs, exponents, coefficients)
+
+    if num_validation:
+        observed = values[num_samples:]
+        errors = surrogate.predict(points[num_samples:]) - observed
+        spread = np.sum((observed - observed.mean(axis=0)) ** 2, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = 1 - np.sum(errors**2, axis=0) / spread
+        surrogate.validation = {
+            output: {
+                "rmse": float(np.sqrt(np.mean(errors[:, o] ** 2))),
+                "max_abs_error": float(np.max(np.abs(errors[:, o]))),
+                "r2": float(r2[o]),
+            }
+            for o, output in enumerate(outputs)
+        }
+    return surrogate
+
+
+def _to_unit(
+    points: NDArray[np.floating[Any]],
+    lower: NDArray[np.floating[Any]],
+    upper: NDArray[np.floating[Any]],
+) -> NDArray[np.floating[Any]]:
+    return 2 * (points - lower) / (upper - lower) - 1
+
+
+def _legendre_basis(
+    unit: NDArray[np.floating[Any]], exponents: NDArray[np.integer[Any]]
+) -> NDArray[np.floating[Any]]:
+    degree = int(exponents.max(initial=0))
+    # (n_points, n_parameters, degree + 1) one-dimensional polynomials
+    polynomials = np.stack(
+        [legendre.legval(unit, np.eye(degree + 1)[k]) for k in range(degree + 1)],
+        axis=-1,
+    )
+    columns = np.arange(exponents.shape[1])
+    return np.prod(polynomials[:, columns, exponents], axis=2)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import itertools
+from collections.abc import Mapping
 from typing import Any
 
 import matplotlib.pyplot as plt
@@ -8,11 +9,16 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 
+from ..engine.result import EnsembleResult, SimulationResult
+
 
 class Visualization:
-    def __init__(self, simulation_data: dict[str, list[float]]) -> None:
+    def __init__(self, simulation_data: Mapping[str, list[float]]) -> None:
         self.data = simulation_data
-        self.dataframe = pd.DataFrame(simulation_data)
+        if isinstance(simulation_data, SimulationResult):
+            self.dataframe = simulation_data.to_pandas()
+        else:
+            self.dataframe = pd.DataFrame(simulation_data)
 
     def plot_stock(self, stock_name: str, interval: int) -> None:
         plt.figure()
@@ -140,25 +146,31 @@ class Visualization:
 
     def plot_sensitivity_heatmap(
         self,
-        sensitivity_results: dict[tuple[Any, ...], dict[str, list[float]]],
+        sensitivity_results: Mapping[tuple[Any, ...], Mapping[str, Any]],
         param_names: list[str],
         stock_name: str,
         aggfunc: str = "mean",
         aggfunc_name: str = "Mean",
         title: str | None = None,
     ) -> None:
-        heatmap_data: list[tuple[Any, ...]] = []
-        for params, data in sensitivity_results.items():
-            data_series = pd.Series(data[stock_name])
-
-            agg_value = data_series.agg(aggfunc)
-            heatmap_data.append(params + (agg_value,))
-
-        columns = list(param_names) + [f"{aggfunc_name} Value"]
-        heatmap_df = pd.DataFrame(heatmap_data, columns=columns)
+        value_column = f"{aggfunc_name} Value"
+        if isinstance(sensitivity_results, EnsembleResult):
+            # One aggregation over the (times, members) block of the stock
+            heatmap_df = sensitivity_results.parameter_table()
+            heatmap_df.columns = list(param_names)
+            series = pd.DataFrame(sensitivity_results.variable(stock_name).T)
+            heatmap_df[value_column] = series.agg(aggfunc).to_numpy()
+        else:
+            heatmap_data: list[tuple[Any, ...]] = []
+            for params, data in sensitivity_results.items():
+                agg_value = pd.Series(data[stock_name]).agg(aggfunc)
+                heatmap_data.append(params + (agg_value,))
+            heatmap_df = pd.DataFrame(
+                heatmap_data, columns=list(param_names) + [value_column]
+            )
 
         heatmap_pivot = heatmap_df.pivot(
-            index=param_names[0], columns=param_names[1], values=f"{aggfunc_name} Value"
+            index=param_names[0], columns=param_names[1], values=value_column
         )
 
         plt.figure(figsize=(10, 8))
@@ -203,12 +215,18 @@ class Visualization:
 
     def plot_elasticities(
         self,
-        elasticities: dict[Any, float],
+        elasticities: dict[Any, Any],
         title: str = "Elasticities of Parameters",
     ) -> None:
-        params, values = zip(*elasticities.items())
-        plt.bar(range(len(params)), values)
-        plt.xticks(range(len(params)), params)
+        params = list(elasticities.keys())
+        values = np.array(
+            [np.atleast_1d(value) for value in elasticities.values()], dtype=float
+        )
+        positions = np.arange(len(params))
+        width = 0.8 / values.shape[1]
+        for j in range(values.shape[1]):
+            plt.bar(positions + j * width, values[:, j], width)
+        plt.xticks(positions + 0.4 - width / 2, params)
         plt.ylabel("Elasticity")
         plt.title(title)
         plt.show()
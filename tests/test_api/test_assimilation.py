@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+
+class TestAssimilation:
+    def test_batches_reuse_the_filter(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+
+        resp = client.post(
+            f"/scenarios/{sid}/assimilate",
+            json={
+                "observations": [{"time": 2, "values": {"infected": 30}}],
+                "num_members": 20,
+                "observation_noise": 0.5,
+                "seed": 0,
+            },
+        )
+        assert resp.status_code == 200
+        analyses = resp.json()["analyses"]
+        assert analyses[0]["time"] == 2
+        assert set(analyses[0]["mean"]) == {"susceptible", "infected", "recovered"}
+
+        resp = client.post(
+            f"/scenarios/{sid}/assimilate",
+            json={"observations": [{"time": 1, "values": {"infected": 30}}]},
+        )
+        assert resp.status_code == 422
+
+        resp = client.post(
+            f"/scenarios/{sid}/assimilate",
+            json={
+                "observations": [{"time": 1, "values": {"infected": 30}}],
+                "reset": True,
+            },
+        )
+        assert resp.status_code == 200
+
+    def test_unknown_stock(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = client.post(
+            f"/scenarios/{sid}/assimilate",
+            json={"observations": [{"time": 1, "values": {"dead": 1}}]},
+        )
+        assert resp.status_code == 422
+
+    def test_unknown_session(self, client: TestClient) -> None:
+        resp = client.post(
+            "/scenarios/unknown123/assimilate", json={"observations": []}
+        )
+        assert resp.status_code == 404
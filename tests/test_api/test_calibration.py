@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.session import store
+
+
+def _observations(client: TestClient, sid: str) -> dict[str, list[float]]:
+    results = client.post(
+        f"/scenarios/{sid}/run", json={"simulation_time": 20, "dt": 1}
+    ).json()["results"]
+    return {name: results[name] for name in ("susceptible", "infected", "recovered")}
+
+
+class TestCalibrate:
+    def test_fits_and_updates_auxiliaries(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = client.post(
+            f"/scenarios/{sid}/calibrate",
+            json={
+                "data": _observations(client, sid),
+                "method": "trust_region",
+                "simulation_time": 20,
+                "bounds": [[0.0, 0.1], [0.0, 0.1]],
+            },
+        )
+        assert resp.status_code == 200
+        parameters = resp.json()["parameters"]
+        assert set(parameters) == {"transmission_rate", "recovery_rate"}
+        assert parameters["transmission_rate"] == pytest.approx(0.015, rel=0.05)
+        definition = store.get(sid).definition
+        assert definition.auxiliaries[0].values == parameters["transmission_rate"]
+
+    def test_unknown_method(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = client.post(
+            f"/scenarios/{sid}/calibrate",
+            json={"data": {"infected": [10.0]}, "method": "guess"},
+        )
+        assert resp.status_code == 422
+
+    def test_not_found(self, client: TestClient) -> None:
+        resp = client.post("/scenarios/missing/calibrate", json={"data": {}})
+        assert resp.status_code == 404
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import struct
+from typing import Any
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api.encoding import ARROW_STREAM, FLOAT64, MSGPACK, negotiate
+
+
+def _decode_float64(body: bytes) -> tuple[dict[str, Any], np.ndarray]:
+    (length,) = struct.unpack_from("<I", body)
+    header = json.loads(body[4 : 4 + length])
+    values = np.frombuffer(body, dtype="<f8", offset=4 + length)
+    return header, values.reshape(header["shape"])
+
+
+class TestNegotiate:
+    def test_json_is_the_default(self) -> None:
+        assert negotiate(None) is None
+        assert negotiate("application/json") is None
+        assert negotiate("*/*") is None
+
+    def test_prefers_higher_quality(self) -> None:
+        accept = f"application/json;q=0.5, {FLOAT64}"
+        assert negotiate(accept) == FLOAT64
+        assert negotiate(f"{FLOAT64};q=0.1, application/json") is None
+
+    def test_unavailable_types_are_not_acceptable(self) -> None:
+        with pytest.raises(HTTPException) as error:
+            negotiate("text/csv")
+        assert error.value.status_code == 406
+
+
+class TestBinaryResults:
+    def test_run_as_float64(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        body = {"simulation_time": 10, "dt": 1}
+        resp = client.post(
+            f"/scenarios/{sid}/run", json=body, headers={"Accept": FLOAT64}
+        )
+        assert resp.headers["content-type"] == FLOAT64
+        header, values = _decode_float64(resp.content)
+        assert (4 + struct.unpack_from("<I", resp.content)[0]) % 8 == 0
+        assert header["columns"][-1] == "time"
+
+        expected = client.get(f"/scenarios/{sid}/results").json()["results"]
+        infected = values[header["columns"].index("infected")]
+        np.testing.assert_allclose(infected, expected["infected"])
+
+        cached = client.get(f"/scenarios/{sid}/results", headers={"Accept": FLOAT64})
+        assert cached.content == resp.content
+
+    def test_sensitivity_as_float64(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = client.post(
+            f"/scenarios/{sid}/sensitivity/univariate",
+            json={
+                "component_name": "auxiliaries",
+                "parameter": "transmission_rate",
+                "range_values": [0.01, 0.02],
+                "simulation_time": 5,
+            },
+            headers={"Accept": FLOAT64},
+        )
+        header, values = _decode_float64(resp.content)
+        assert header["keys"] == ["0.01", "0.02"]
+        assert values.shape == (2, len(header["columns"]), 5)
+
+    def test_binary_results_need_a_run(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = client.get(f"/scenarios/{sid}/results", headers={"Accept": FLOAT64})
+        assert resp.status_code == 404
+        assert client.get(f"/scenarios/{sid}/results").json()["has_results"] is False
+
+    def test_run_as_msgpack(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = client.post(
+            f"/scenarios/{sid}/run",
+            json={"simulation_time": 5},
+            headers={"Accept": MSGPACK},
+        )
+        decoded = msgpack.unpackb(resp.content)
+        assert decoded["results"]["time"] == [0, 1, 2, 3, 4]
+
+    def test_run_as_arrow(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = client.post(
+            f"/scenarios/{sid}/run",
+            json={"simulation_time": 5},
+            headers={"Accept": ARROW_STREAM},
+        )
+        if importlib.util.find_spec("pyarrow") is None:
+            assert resp.status_code == 406
+            return
+        import pyarrow as pa
+
+        table = pa.ipc.open_stream(resp.content).read_all()
+        assert table.column("time").to_pylist() == [0, 1, 2, 3, 4]
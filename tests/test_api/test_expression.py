@@ -4,7 +4,13 @@ import inspect
 
 import pytest
 
-from api.expression import ExpressionError, compile_rate_function, validate_expression
+from api.expression import (
+    ExpressionError,
+    clear_expression_cache,
+    compile_rate_function,
+    expression_cache_info,
+    validate_expression,
+)
 
 
 class TestValidateExpression:
@@ -90,3 +96,31 @@ class TestCompileRateFunction:
     def test_safe_functions(self) -> None:
         fn = compile_rate_function("max(a, b)", ["a", "b"])
         assert fn(3, 7) == 7
+
+    def test_propagates_dual_numbers(self) -> None:
+        from models.engine.dual import seed_duals
+
+        fn = compile_rate_function("max(a, b) * a ** 2", ["a", "b"])
+        a, b = seed_duals([3.0, 1.0])
+        result = fn(a, b)
+        assert result.value == pytest.approx(27.0)
+        assert list(result.gradient) == pytest.approx([27.0, 0.0])
+
+
+class TestExpressionCache:
+    def test_repeated_expressions_share_one_function(self) -> None:
+        clear_expression_cache()
+        first = compile_rate_function("a * b", ["a", "b"])
+        assert compile_rate_function("a * b", ["a", "b"]) is first
+        assert compile_rate_function("a * b", ["b", "a"]) is not first
+
+        info = expression_cache_info()
+        assert (info["hits"], info["misses"], info["size"]) == (1, 2, 2)
+        assert info["hit_rate"] == pytest.approx(1 / 3)
+
+    def test_invalid_expressions_are_not_cached(self) -> None:
+        clear_expression_cache()
+        for _ in range(2):
+            with pytest.raises(ExpressionError):
+                compile_rate_function("a +", ["a"])
+        assert expression_cache_info()["size"] == 0
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.jobs import JobQueue, split_parts
+from api.main import app
+from api.session import store
+
+
+@pytest.fixture
+def jobs_client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """Client whose event loop outlives requests, so jobs keep running."""
+    store._sessions.clear()
+    queue = JobQueue(max_running=1, max_queued=2)
+    monkeypatch.setattr("api.routes.jobs.queue", queue)
+    with TestClient(app) as client:
+        yield client
+
+
+def _wait(client: TestClient, job_id: str) -> dict[str, Any]:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def _univariate(values: list[float]) -> dict[str, Any]:
+    return {
+        "component_name": "auxiliaries",
+        "parameter": "transmission_rate",
+        "range_values": values,
+        "simulation_time": 10,
+        "dt": 1,
+    }
+
+
+class TestJobs:
+    def test_sweep_job_reports_progress_and_result(
+        self, jobs_client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = jobs_client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        values = [0.005 * k for k in range(1, 13)]
+        resp = jobs_client.post(
+            f"/scenarios/{sid}/sensitivity/univariate/jobs", json=_univariate(values)
+        )
+        assert resp.status_code == 202
+        job = _wait(jobs_client, resp.json()["job_id"])
+        assert job["status"] == "succeeded"
+        assert job["progress"] == 1.0
+
+        result = jobs_client.get(f"/jobs/{job['job_id']}/result").json()["result"]
+        direct = jobs_client.post(
+            f"/scenarios/{sid}/sensitivity/univariate", json=_univariate(values)
+        ).json()
+        assert result == direct
+
+    def test_shock_job_stores_session_results(
+        self, jobs_client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = jobs_client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        shock = {
+            "components": {
+                "transmission_rate": {
+                    "component_type": "auxiliary",
+                    "shock_value": 0.1,
+                    "start_time": 2,
+                    "end_time": 4,
+                }
+            },
+            "simulation_time": 10,
+        }
+        job_id = jobs_client.post(f"/scenarios/{sid}/shocks/jobs", json=shock).json()[
+            "job_id"
+        ]
+        assert _wait(jobs_client, job_id)["status"] == "succeeded"
+        assert jobs_client.get(f"/scenarios/{sid}/results").json()["has_results"]
+
+    def test_failed_job_reports_error(
+        self, jobs_client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = jobs_client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = jobs_client.post(
+            f"/scenarios/{sid}/calibrate/jobs",
+            json={"data": {"infected": [10.0]}, "method": "guess"},
+        )
+        job = _wait(jobs_client, resp.json()["job_id"])
+        assert job["status"] == "failed"
+        assert "guess" in job["error"]
+        result = jobs_client.get(f"/jobs/{job['job_id']}/result")
+        assert result.status_code == 422
+
+    def test_queue_limit_and_cancel(
+        self, jobs_client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = jobs_client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        url = f"/scenarios/{sid}/sensitivity/univariate/jobs"
+        # A long-running first job keeps the next two waiting.
+        long_sweep = _univariate([0.01] * 1000)
+        long_sweep["simulation_time"] = 150
+        ids = [jobs_client.post(url, json=long_sweep).json()["job_id"]]
+        ids += [
+            jobs_client.post(url, json=_univariate([0.01])).json()["job_id"]
+            for _ in range(2)
+        ]
+        assert jobs_client.post(url, json=_univariate([0.01])).status_code == 429
+
+        cancelled = jobs_client.delete(f"/jobs/{ids[2]}").json()
+        assert cancelled["status"] == "cancelled"
+        assert jobs_client.get(f"/jobs/{ids[2]}/result").status_code == 409
+        jobs_client.delete(f"/jobs/{ids[0]}")
+        assert _wait(jobs_client, ids[0])["status"] == "cancelled"
+        assert _wait(jobs_client, ids[1])["status"] == "succeeded"
+
+    def test_unknown_job(self, jobs_client: TestClient) -> None:
+        assert jobs_client.get("/jobs/missing").status_code == 404
+        assert jobs_client.delete("/jobs/missing").status_code == 404
+
+
+class TestSplitParts:
+    def test_splits_into_contiguous_parts(self) -> None:
+        assert split_parts(list(range(5)), 2) == [[0, 1, 2], [3, 4]]
+        assert split_parts([1], 10) == [[1]]
+        assert split_parts([], 3) == []
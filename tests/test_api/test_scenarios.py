@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import Any
 
 import pytest
@@ -154,3 +155,83 @@ class TestGetResults:
     def test_results_unknown_session(self, client: TestClient) -> None:
         resp = client.get("/scenarios/unknown123/results")
         assert resp.status_code == 404
+
+
+class TestStreamScenario:
+    def test_ndjson_chunks_match_run(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        body = {"simulation_time": 10, "dt": 1, "chunk_size": 4}
+        with client.stream("POST", f"/scenarios/{sid}/run/stream", json=body) as resp:
+            assert resp.headers["content-type"] == "application/x-ndjson"
+            frames = [json.loads(line) for line in resp.iter_lines() if line]
+        assert [frame["event"] for frame in frames] == ["chunk"] * 3 + ["end"]
+        chunks = [frame["data"] for frame in frames[:-1]]
+        assert [len(chunk["time"]) for chunk in chunks] == [4, 4, 2]
+
+        full = client.post(f"/scenarios/{sid}/run", json=body).json()["results"]
+        joined = [value for chunk in chunks for value in chunk["infected"]]
+        assert joined == pytest.approx(full["infected"])
+
+    def test_server_sent_events(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+        resp = client.post(
+            f"/scenarios/{sid}/run/stream",
+            json={"simulation_time": 5, "chunk_size": 2},
+            headers={"Accept": "text/event-stream"},
+        )
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.removeprefix("event: ")
+            for line in resp.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert events == ["chunk", "chunk", "chunk", "end"]
+
+    def test_not_found(self, client: TestClient) -> None:
+        resp = client.post("/scenarios/missing/run/stream", json={"simulation_time": 5})
+        assert resp.status_code == 404
+
+
+class TestResultQueries:
+    def _run(self, client: TestClient, payload: dict[str, Any]) -> str:
+        sid = client.post("/scenarios/", json=payload).json()["session_id"]
+        client.post(f"/scenarios/{sid}/run", json={"simulation_time": 150})
+        return sid
+
+    def test_variables_window_and_stride(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = self._run(client, sir_payload)
+        resp = client.get(
+            f"/scenarios/{sid}/results",
+            params={"variables": ["infected"], "start": 10, "stop": 20, "stride": 3},
+        )
+        results = resp.json()["results"]
+        assert set(results) == {"infected", "time"}
+        assert results["time"] == [10, 13, 16, 19]
+
+    def test_downsampling_keeps_extremes(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = self._run(client, sir_payload)
+        full = client.get(f"/scenarios/{sid}/results").json()["results"]
+        for method in ("minmax", "lttb"):
+            params = {"variables": "infected", "max_points": 20, "downsample": method}
+            resp = client.get(f"/scenarios/{sid}/results", params=params)
+            infected = resp.json()["results"]["infected"]
+            assert 3 <= len(infected) <= 20
+            assert infected[0] == full["infected"][0]
+            assert infected[-1] == full["infected"][-1]
+            if method == "minmax":
+                assert max(infected) == max(full["infected"])
+
+    def test_unknown_variable(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = self._run(client, sir_payload)
+        resp = client.get(f"/scenarios/{sid}/results", params={"variables": "z"})
+        assert resp.status_code == 422
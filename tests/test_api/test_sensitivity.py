@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
 
+from api.schemas import MAX_PARALLEL_RUNS
+
 
 class TestSensitivityUnivariate:
     def test_univariate_returns_results(
@@ -70,3 +73,118 @@ class TestSensitivityMultivariate:
             },
         )
         assert resp.status_code == 404
+
+
+class TestSensitivityMorris:
+    def test_morris_returns_statistics(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        create_resp = client.post("/scenarios/", json=sir_payload)
+        sid = create_resp.json()["session_id"]
+
+        # The nested pool is started inside an API worker process.
+        resp = client.post(
+            f"/scenarios/{sid}/sensitivity/morris",
+            json={
+                "parameters": [
+                    {
+                        "component": "auxiliaries",
+                        "name": "transmission_rate",
+                        "lower": 0.005,
+                        "upper": 0.03,
+                    },
+                    {
+                        "component": "stocks",
+                        "name": "infected",
+                        "lower": 5,
+                        "upper": 15,
+                    },
+                ],
+                "outputs": ["infected", "recovered"],
+                "num_trajectories": 3,
+                "seed": 0,
+                "max_workers": min(2, MAX_PARALLEL_RUNS),
+                "simulation_time": 10,
+                "dt": 1,
+            },
+        )
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert set(results) == {"infected", "recovered"}
+        assert set(results["infected"]["transmission_rate"]) == {
+            "mu",
+            "mu_star",
+            "sigma",
+        }
+
+    def test_morris_invalid_reduction(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        create_resp = client.post("/scenarios/", json=sir_payload)
+        sid = create_resp.json()["session_id"]
+
+        resp = client.post(
+            f"/scenarios/{sid}/sensitivity/morris",
+            json={
+                "parameters": [
+                    {
+                        "component": "stocks",
+                        "name": "infected",
+                        "lower": 5,
+                        "upper": 15,
+                    }
+                ],
+                "outputs": ["infected"],
+                "reduction": "median",
+                "num_trajectories": 1,
+                "simulation_time": 5,
+            },
+        )
+        assert resp.status_code == 422
+
+    def test_morris_unknown_parameter(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        create_resp = client.post("/scenarios/", json=sir_payload)
+        sid = create_resp.json()["session_id"]
+
+        resp = client.post(
+            f"/scenarios/{sid}/sensitivity/morris",
+            json={
+                "parameters": [
+                    {
+                        "component": "auxiliaries",
+                        "name": "transmision_rate",
+                        "lower": 0.0,
+                        "upper": 1.0,
+                    }
+                ],
+                "outputs": ["infected"],
+            },
+        )
+        assert resp.status_code == 422
+        assert "transmision_rate" in resp.json()["detail"]
+
+    def test_morris_caps_parallel_runs(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        sid = client.post("/scenarios/", json=sir_payload).json()["session_id"]
+
+        resp = client.post(
+            f"/scenarios/{sid}/sensitivity/morris",
+            json={
+                "parameters": [
+                    {"component": "stocks", "name": "infected", "lower": 5, "upper": 15}
+                ],
+                "outputs": ["infected"],
+                "max_workers": MAX_PARALLEL_RUNS + 1,
+            },
+        )
+        assert resp.status_code == 422
+
+    def test_morris_unknown_session(self, client: TestClient) -> None:
+        resp = client.post(
+            "/scenarios/unknown123/sensitivity/morris",
+            json={"parameters": [], "outputs": []},
+        )
+        assert resp.status_code == 404
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fastapi.testclient import TestClient
 from models.core.auxiliary import Auxiliary
+from models.engine.result import SimulationResult
 from models.scenario.scenario import Scenario
 
-from api.session import SessionStore
+from api.session import SESSION_OVERHEAD_BYTES, SessionStore, estimate_result_bytes
 
 
 def _make_scenario(name: str = "test") -> Scenario:
@@ -51,3 +56,87 @@ class TestSessionStore:
         assert len(sessions) == 2
         names = {s["name"] for s in sessions}
         assert names == {"alpha", "beta"}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _results(num_times: int) -> SimulationResult:
+    return SimulationResult.from_history(
+        {"x": [0.0] * num_times, "time": list(range(num_times))}
+    )
+
+
+class TestBoundedSessionStore:
+    def test_idle_sessions_expire(self) -> None:
+        clock = _Clock()
+        store = SessionStore(ttl=10, clock=clock)
+        old = store.create(_make_scenario("old"))
+        clock.now = 6
+        kept = store.create(_make_scenario("kept"))
+        clock.now = 12
+        assert store.get(kept) is not None
+        assert store.get(old) is None
+        assert store.metrics()["expired_sessions"] == 1
+
+    def test_results_are_evicted_before_sessions(self) -> None:
+        # Each result of 1,000 steps and two series is 16,000 bytes.
+        store = SessionStore(max_bytes=3 * SESSION_OVERHEAD_BYTES + 40_000)
+        first, second, third = (store.create(_make_scenario()) for _ in range(3))
+        store.get(first).results = _results(1000)
+        store.get(second).results = _results(1000)
+        store.get(third).results = _results(1000)
+
+        assert store.get(first).results is None
+        assert store.get(second).results is not None
+        assert store.resident_bytes() <= store.max_bytes
+        assert store.metrics()["evicted_results"] == 1
+
+        store.create(_make_scenario())
+        store.max_bytes = SESSION_OVERHEAD_BYTES * 2
+        store.get(first).results = None
+        metrics = store.metrics()
+        assert metrics["evicted_sessions"] >= 1
+        assert metrics["resident_bytes"] <= store.max_bytes
+        assert store.get(first) is not None
+
+    def test_concurrent_use_keeps_the_budget(self) -> None:
+        store = SessionStore(max_bytes=4 * SESSION_OVERHEAD_BYTES + 40_000)
+
+        def churn() -> None:
+            for _ in range(50):
+                session_id = store.create(_make_scenario())
+                session = store.get(session_id)
+                if session is not None:
+                    session.results = _results(1000)
+                store.list_sessions()
+                store.metrics()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(churn) for _ in range(8)]:
+                future.result()
+        assert store.resident_bytes() <= store.max_bytes
+
+    def test_result_size_estimate(self) -> None:
+        assert estimate_result_bytes(None) == 0
+        assert estimate_result_bytes({"x": [1.0, 2.0], "time": [0, 1]}) == 32
+        assert estimate_result_bytes(_results(10)) == 160
+
+    def test_metrics_endpoint(
+        self, client: TestClient, sir_payload: dict[str, Any]
+    ) -> None:
+        session_id = client.post("/scenarios", json=sir_payload).json()["session_id"]
+        client.post(f"/scenarios/{session_id}/run", json={"simulation_time": 10})
+
+        resp = client.get("/metrics")
+        assert resp.status_code == 200
+        sessions = resp.json()["sessions"]
+        assert sessions["sessions"] == 1
+        assert sessions["sessions_with_results"] == 1
+        assert sessions["resident_bytes"] > SESSION_OVERHEAD_BYTES
+        assert "hit_rate" in resp.json()["expressions"]
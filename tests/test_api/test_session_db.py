@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.routes import assimilation, scenarios
+from api.schemas import CreateScenarioRequest
+from api.session_db import SqliteSessionStore, pack_results, unpack_results
+from api.worker import build_scenario
+from models.engine.result import SimulationResult
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def stores(tmp_path: Path) -> Iterator[tuple[SqliteSessionStore, SqliteSessionStore]]:
+    """Two stores on one database, as two server processes would have."""
+    first = SqliteSessionStore(tmp_path / "sessions.db")
+    second = SqliteSessionStore(tmp_path / "sessions.db")
+    yield first, second
+    first.close()
+    second.close()
+
+
+def _create(store: SqliteSessionStore, payload: dict[str, Any]) -> str:
+    definition = CreateScenarioRequest(**payload)
+    return store.create(build_scenario(definition), definition=definition)
+
+
+class TestPackResults:
+    def test_round_trip(self) -> None:
+        results = SimulationResult.from_history(
+            {"x": [1.0, 2.0, 3.0], "time": [0.0, 1.0, 2.0]}
+        )
+        columns, blob = pack_results(results)
+        assert blob is not None and len(blob) == 48
+        assert unpack_results(columns, blob) == results
+        assert unpack_results(*pack_results(None)) is None
+
+
+class TestSqliteSessionStore:
+    def test_sessions_are_shared(
+        self,
+        stores: tuple[SqliteSessionStore, SqliteSessionStore],
+        sir_payload: dict[str, Any],
+    ) -> None:
+        first, second = stores
+        session_id = _create(first, sir_payload)
+
+        session = second.get(session_id)
+        assert session is not None
+        assert session.scenario.name == "SIR Model"
+        assert session.results is None
+        assert second.list_sessions() == [
+            {"session_id": session_id, "name": "SIR Model"}
+        ]
+
+    def test_saved_results_reach_other_stores(
+        self,
+        stores: tuple[SqliteSessionStore, SqliteSessionStore],
+        sir_payload: dict[str, Any],
+    ) -> None:
+        first, second = stores
+        session_id = _create(first, sir_payload)
+        assert second.get(session_id) is second.get(session_id)
+
+        session = first.get(session_id)
+        session.results = session.scenario.run(simulation_time=10, dt=1)
+        first.save(session_id, session)
+
+        shared = second.get(session_id)
+        assert shared.results == session.results
+        assert second.metrics()["rebuilt_sessions"] == 2
+
+    def test_delete(
+        self,
+        stores: tuple[SqliteSessionStore, SqliteSessionStore],
+        sir_payload: dict[str, Any],
+    ) -> None:
+        first, second = stores
+        session_id = _create(first, sir_payload)
+        assert second.delete(session_id) is True
+        assert first.get(session_id) is None
+        assert first.delete(session_id) is False
+
+    def test_idle_sessions_expire(
+        self, tmp_path: Path, sir_payload: dict[str, Any]
+    ) -> None:
+        clock = _Clock()
+        store = SqliteSessionStore(tmp_path / "sessions.db", ttl=10, clock=clock)
+        session_id = _create(store, sir_payload)
+        clock.now += 11
+        assert store.get(session_id) is None
+        assert store.metrics()["expired_sessions"] == 1
+        store.close()
+
+    def test_reads_touch_sessions_sparingly(
+        self, tmp_path: Path, sir_payload: dict[str, Any]
+    ) -> None:
+        clock = _Clock()
+        store = SqliteSessionStore(tmp_path / "sessions.db", ttl=100, clock=clock)
+        session_id = _create(store, sir_payload)
+
+        def last_access() -> float:
+            query = "SELECT last_access FROM sessions WHERE session_id = ?"
+            return store._connect().execute(query, (session_id,)).fetchone()[0]
+
+        clock.now += 5
+        store.get(session_id)
+        assert last_access() == 1000.0
+        clock.now += 5
+        store.get(session_id)
+        assert last_access() == 1010.0
+        store.close()
+
+    def test_requires_definition(
+        self, tmp_path: Path, sir_payload: dict[str, Any]
+    ) -> None:
+        store = SqliteSessionStore(tmp_path / "sessions.db")
+        scenario = build_scenario(CreateScenarioRequest(**sir_payload))
+        with pytest.raises(ValueError, match="definition"):
+            store.create(scenario)
+        store.close()
+
+    def test_results_served_by_another_process(
+        self,
+        stores: tuple[SqliteSessionStore, SqliteSessionStore],
+        client: TestClient,
+        sir_payload: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        first, second = stores
+        monkeypatch.setattr(scenarios, "store", first)
+        session_id = client.post("/scenarios", json=sir_payload).json()["session_id"]
+        run = client.post(
+            f"/scenarios/{session_id}/run", json={"simulation_time": 10}
+        ).json()
+
+        monkeypatch.setattr(scenarios, "store", second)
+        resp = client.get(f"/scenarios/{session_id}/results")
+        assert resp.status_code == 200
+        assert resp.json()["results"] == run["results"]
+
+    def test_filters_outlive_the_cache(
+        self,
+        tmp_path: Path,
+        client: TestClient,
+        sir_payload: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        first = SqliteSessionStore(tmp_path / "sessions.db", cache_size=1)
+        second = SqliteSessionStore(tmp_path / "sessions.db")
+        monkeypatch.setattr(assimilation, "store", first)
+        session_id = _create(first, sir_payload)
+
+        def assimilate(time: float) -> int:
+            body = {"observations": [{"time": time, "values": {"infected": 30}}]}
+            url = f"/scenarios/{session_id}/assimilate"
+            return client.post(url, json={**body, "seed": 0}).status_code
+
+        assert assimilate(2) == 200
+        # Evicted from the cache, then rebuilt after another process saved it.
+        first.get(_create(first, sir_payload))
+        second.save(session_id, second.get(session_id))
+        # The kept filter is past time 2 already.
+        assert assimilate(1) == 422
+        assert first.metrics()["rebuilt_sessions"] == 1
+        first.close()
+        second.close()
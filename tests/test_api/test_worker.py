@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from api import worker
+from api.expression import ExpressionError
+from api.main import app
+from api.schemas import CreateScenarioRequest
+from api.session import store
+
+
+@pytest.fixture
+def pool() -> Iterator[None]:
+    yield
+    # Later tests lazily recreate the default process pool.
+    worker.shutdown_pool()
+
+
+class TestBuildScenario:
+    def test_names_the_invalid_rate(self, sir_payload: dict[str, Any]) -> None:
+        sir_payload["rates"]["recovery"]["expression"] = "infected +"
+        with pytest.raises(ExpressionError, match="rate 'recovery'"):
+            worker.build_scenario(CreateScenarioRequest(**sir_payload))
+
+
+class TestConfiguredWorkers:
+    def test_reads_the_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(worker.WORKERS_ENV, raising=False)
+        assert worker.configured_workers() is None
+        monkeypatch.setenv(worker.WORKERS_ENV, "3")
+        assert worker.configured_workers() == 3
+
+    @pytest.mark.parametrize("value", ["four", "0", "-2", "1.5"])
+    def test_rejects_malformed_values(
+        self, monkeypatch: pytest.MonkeyPatch, value: str
+    ) -> None:
+        monkeypatch.setenv(worker.WORKERS_ENV, value)
+        with pytest.raises(ValueError, match="PYVENSIM_API_WORKERS"):
+            worker.configured_workers()
+
+
+class TestPool:
+    def test_tasks_run_in_worker_processes(
+        self, pool: None, sir_payload: dict[str, Any]
+    ) -> None:
+        executor = worker.configure_pool(1)
+        assert executor.submit(os.getpid).result() != os.getpid()
+
+        definition = CreateScenarioRequest(**sir_payload)
+        results, stored = executor.submit(
+            worker.scenario_task, definition, "run", simulation_time=5, dt=1
+        ).result()
+        assert stored == results
+        assert list(results["time"]) == [0, 1, 2, 3, 4]
+
+    def test_health_responds_while_simulation_runs(
+        self,
+        pool: None,
+        sir_payload: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        store._sessions.clear()
+        worker.configure_pool(executor=ThreadPoolExecutor(1))
+        release = threading.Event()
+        original = worker.scenario_task
+
+        def blocked_task(*args: Any, **kwargs: Any) -> Any:
+            release.wait(5)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(worker, "scenario_task", blocked_task)
+
+        async def exercise() -> None:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                created = await client.post("/scenarios/", json=sir_payload)
+                sid = created.json()["session_id"]
+                run = asyncio.create_task(
+                    client.post(
+                        f"/scenarios/{sid}/run",
+                        json={"simulation_time": 5, "dt": 1},
+                    )
+                )
+                await asyncio.sleep(0.05)
+                health = await client.get("/health")
+                assert health.status_code == 200
+                assert not run.done()
+                release.set()
+                assert (await run).status_code == 200
+
+        asyncio.run(exercise())
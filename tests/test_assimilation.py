@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from models.calibration.assimilation import EnsembleKalmanFilter
+from models.core.auxiliary import Auxiliary
+from models.scenario.scenario import Scenario
+
+
+def _make_decay_scenario(initial: float = 10.0) -> Scenario:
+    rates = {
+        "inflow": {"rate_function": lambda growth: growth, "destination": "x"},
+        "outflow": {"rate_function": lambda x, decay: x * decay, "source": "x"},
+    }
+    auxiliaries = [Auxiliary("growth", 2.0), Auxiliary("decay", 0.1)]
+    return Scenario("decay", {"x": initial, "y": 1.0}, rates, auxiliaries)
+
+
+class TestEnsembleKalmanFilter:
+    def test_forecast_matches_deterministic_run(self) -> None:
+        scenario = _make_decay_scenario()
+        enkf = EnsembleKalmanFilter(scenario, num_members=10, initial_spread=0.0)
+        enkf.advance(4)
+        assert enkf.time == 4
+        np.testing.assert_allclose(enkf.state[0], scenario.run(5, 1)["x"][4])
+        # only the latest state is kept
+        assert enkf.simulation.history["time"] == [4]
+
+    def test_observations_pull_ensemble_towards_truth(self) -> None:
+        truth = _make_decay_scenario(initial=15.0).run(10, 1)["x"]
+        enkf = EnsembleKalmanFilter(
+            _make_decay_scenario(initial=10.0),
+            num_members=200,
+            observation_noise=0.1,
+            initial_spread=0.3,
+            seed=0,
+        )
+        errors = []
+        for time in (0, 3, 6, 9):
+            analysis = enkf.assimilate(time, {"x": truth[time]})
+            errors.append(abs(analysis["mean"]["x"] - truth[time]))
+        assert errors[-1] < 0.1
+        assert enkf.analyses[-1]["std"]["x"] < 0.2
+
+    def test_rejects_going_back_in_time(self) -> None:
+        enkf = EnsembleKalmanFilter(_make_decay_scenario(), num_members=5)
+        enkf.assimilate(5, {"x": 10.0})
+        with pytest.raises(ValueError, match="precede"):
+            enkf.assimilate(2, {"x": 10.0})
+
+    def test_unknown_stock(self) -> None:
+        enkf = EnsembleKalmanFilter(_make_decay_scenario(), num_members=5)
+        with pytest.raises(ValueError, match="Unknown stocks"):
+            enkf.assimilate(1, {"z": 1.0})
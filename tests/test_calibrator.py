@@ -1,3 +1,7 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from models.calibration.calibrator import Calibrator
@@ -28,6 +32,43 @@ def _make_scenario() -> Scenario:
     return Scenario("SIR", initial_values, rates, auxiliaries)
 
 
+def _inflow(growth: float) -> float:
+    return growth
+
+
+def _outflow(x: float, decay: float) -> float:
+    return x * decay
+
+
+def _make_picklable_decay_scenario() -> Scenario:
+    return Scenario(
+        "decay",
+        {"x": 10},
+        {
+            "inflow": {"rate_function": _inflow, "destination": "x"},
+            "outflow": {"rate_function": _outflow, "source": "x"},
+        },
+        [Auxiliary("growth", 1.0), Auxiliary("decay", 0.2)],
+    )
+
+
+def _make_decay_scenario(growth: float = 1.0, decay: float = 0.2) -> Scenario:
+    auxiliaries = [Auxiliary("growth", growth), Auxiliary("decay", decay)]
+    rates = {
+        "inflow": {
+            "rate_function": lambda growth: growth,
+            "source": None,
+            "destination": "x",
+        },
+        "outflow": {
+            "rate_function": lambda x, decay: x * decay,
+            "source": "x",
+            "destination": None,
+        },
+    }
+    return Scenario("decay", {"x": 10}, rates, auxiliaries)
+
+
 class TestCalibrator:
     def test_init_default_params(self) -> None:
         s = _make_scenario()
@@ -70,3 +111,327 @@ class TestCalibrator:
         cal = Calibrator(s)
         params = cal._get_initial_params()
         assert params == [1.0, 2.0]
+
+    def test_gradients_match_finite_differences(self) -> None:
+        s = _make_scenario()
+        cal = Calibrator(s, simulation_time=20)
+        targets = cal._prepare_targets(pd.DataFrame(s.run(20, 1))[["infected"]])
+        params = np.array([0.015, 0.01])
+        _, sensitivities = cal._simulate_with_gradients(params, targets)
+
+        step = 1e-7
+        for i in range(len(params)):
+            shift = np.zeros_like(params)
+            shift[i] = step
+            upper, _ = cal._simulate_with_gradients(params + shift, targets)
+            lower, _ = cal._simulate_with_gradients(params - shift, targets)
+            np.testing.assert_allclose(
+                sensitivities[..., i],
+                (upper - lower) / (2 * step),
+                rtol=1e-4,
+                atol=1e-6,
+            )
+
+    def test_gradient_method_recovers_parameters(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        observed = truth.run(30, 1)
+        data = pd.DataFrame({"x": observed["x"]})
+
+        cal = Calibrator(_make_decay_scenario(), simulation_time=30)
+        params = cal.calibrate(data, method="gradient")
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-4)
+
+    def test_trust_region_recovers_parameters(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        observed = truth.run(30, 1)
+        data = pd.DataFrame({"x": observed["x"]})
+
+        cal = Calibrator(
+            _make_decay_scenario(),
+            simulation_time=30,
+            bounds=[(0.0, 10.0), (0.0, 1.0)],
+        )
+        params = cal.calibrate(data, method="trust_region")
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-6)
+        assert cal.last_result is not None
+        assert cal.last_result.n_simulations == cal.n_simulations
+        # one augmented run per iteration provides residuals and Jacobian
+        assert cal.n_simulations == cal.last_result.nfev
+        assert cal.last_result.n_augmented_simulations == cal.n_simulations
+        assert cal.last_result.elapsed > 0
+
+    def test_trust_region_respects_bounds(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(20, 1)["x"]})
+
+        cal = Calibrator(
+            _make_decay_scenario(),
+            simulation_time=20,
+            bounds=[(0.0, 1.5), (0.0, 1.0)],
+        )
+        params = cal.calibrate(data, method="trust_region")
+        assert params[0] <= 1.5
+
+    def test_trust_region_finite_difference_jacobian(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(20, 1)["x"]})
+
+        cal = Calibrator(_make_decay_scenario(), simulation_time=20, use_jacobian=False)
+        params = cal.calibrate(data, method="trust_region")
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-4)
+        assert cal.n_simulations > cal.last_result.nfev
+
+    def test_least_squares_reports_simulations(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(10, 1)["x"]})
+
+        cal = Calibrator(_make_decay_scenario(), simulation_time=10)
+        cal.calibrate(data)
+        assert cal.last_result is not None
+        assert cal.last_result.n_simulations == cal.n_simulations > 0
+        assert cal.last_result.n_augmented_simulations == 0
+
+    def test_sparse_time_aligned_observations(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        observed = truth.run(30, 1)
+        steps = [0, 3, 7, 12, 20, 29]
+        data = pd.DataFrame(
+            {
+                "t": [observed["time"][i] for i in steps],
+                "x": [observed["x"][i] for i in steps],
+            }
+        )
+        data.loc[2, "x"] = np.nan
+
+        cal = Calibrator(_make_decay_scenario(), simulation_time=30, time_column="t")
+        params = cal.calibrate(data, method="trust_region")
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-6)
+
+    def test_data_beyond_simulation_time(self) -> None:
+        data = pd.DataFrame({"x": [1.0] * 20})
+        cal = Calibrator(_make_decay_scenario(), simulation_time=10)
+        with pytest.raises(ValueError, match="beyond the simulation time"):
+            cal.calibrate(data)
+
+    def test_calibrate_updates_scenario(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(20, 1)["x"]})
+
+        s = _make_decay_scenario()
+        params = Calibrator(s, simulation_time=20).calibrate(data, "trust_region")
+        assert [aux.values for aux in s.auxiliaries] == list(params)
+
+    def test_time_origin_offsets_observation_times(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        observed = truth.run(20, 1)
+        data = pd.DataFrame(
+            {"year": [1900 + t for t in observed["time"]], "x": observed["x"]}
+        )
+
+        s = _make_decay_scenario()
+        params = s.calibrate(
+            data,
+            method="trust_region",
+            simulation_time=20,
+            time_column="year",
+            time_origin=1900,
+        )
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-6)
+
+    def test_multi_start_requires_bounds(self) -> None:
+        data = pd.DataFrame({"x": [10.0] * 5})
+        cal = Calibrator(_make_decay_scenario(), simulation_time=5)
+        with pytest.raises(ValueError, match="requires bounds"):
+            cal.calibrate(data, method="multi_start")
+
+    def test_multi_start_returns_best_with_summary(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(20, 1)["x"]})
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cal = Calibrator(
+                _make_decay_scenario(),
+                simulation_time=20,
+                bounds=[(0.0, 5.0), (0.01, 1.0)],
+                executor=executor,
+            )
+            params = cal.calibrate(data, method="multi_start", num_starts=4, seed=0)
+
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-4)
+        starts = cal.last_result.starts
+        assert len(starts) == 4
+        assert cal.last_result.fun == min(start["fun"] for start in starts)
+        assert cal.n_simulations == cal.last_result.n_simulations > 0
+
+    def test_multi_start_prunes_trailing_starts(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(20, 1)["x"]})
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cal = Calibrator(
+                _make_decay_scenario(),
+                simulation_time=20,
+                bounds=[(0.0, 5.0), (0.01, 1.0)],
+                executor=executor,
+            )
+            cal.calibrate(
+                data,
+                method="multi_start",
+                num_starts=6,
+                prune_factor=1.0,
+                stage_iterations=5,
+                seed=1,
+            )
+
+        statuses = [start["status"] for start in cal.last_result.starts]
+        assert "pruned" in statuses
+        assert "running" not in statuses
+
+    def test_multi_start_process_pool(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(20, 1)["x"]})
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            cal = Calibrator(
+                _make_picklable_decay_scenario(),
+                simulation_time=20,
+                bounds=[(0.0, 5.0), (0.01, 1.0)],
+                executor=executor,
+            )
+            params = cal.calibrate(data, method="multi_start", num_starts=3, seed=0)
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-4)
+
+        cal = Calibrator(
+            _make_picklable_decay_scenario(),
+            simulation_time=20,
+            bounds=[(0.0, 5.0), (0.01, 1.0)],
+            max_workers=2,
+        )
+        params = cal.calibrate(data, method="multi_start", num_starts=2, seed=0)
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-4)
+
+    def test_multi_start_lambda_scenario(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(20, 1)["x"]})
+        bounds = [(0.0, 5.0), (0.01, 1.0)]
+
+        cal = Calibrator(_make_decay_scenario(), simulation_time=20, bounds=bounds)
+        with pytest.warns(RuntimeWarning, match="threads"):
+            params = cal.calibrate(data, method="multi_start", num_starts=2)
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-4)
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            cal = Calibrator(
+                _make_decay_scenario(),
+                simulation_time=20,
+                bounds=bounds,
+                executor=executor,
+            )
+            with pytest.raises(ValueError, match="process pool"):
+                cal.calibrate(data, method="multi_start")
+
+    def test_multi_start_requires_a_start(self) -> None:
+        data = pd.DataFrame({"x": [10.0] * 5})
+        cal = Calibrator(
+            _make_decay_scenario(),
+            simulation_time=5,
+            bounds=[(0.0, 5.0), (0.01, 1.0)],
+        )
+        with pytest.raises(ValueError, match="num_starts"):
+            cal.calibrate(data, method="multi_start", num_starts=0)
+
+    def test_rejects_options_of_other_methods(self) -> None:
+        data = pd.DataFrame({"x": [10.0] * 5})
+        cal = Calibrator(_make_decay_scenario(), simulation_time=5)
+        with pytest.raises(ValueError, match="num_walkers"):
+            cal.calibrate(data, method="trust_region", num_walkers=8)
+
+    def test_repeated_evaluations_hit_cache(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(10, 1)["x"]})
+        cal = Calibrator(_make_decay_scenario(), simulation_time=10)
+        targets = cal._prepare_targets(data)
+        params = np.array([1.5, 0.2])
+
+        first = cal._loss(params, targets)
+        assert cal._loss(params + 1e-14, targets) == first
+        assert cal.n_simulations == 1
+        assert cal.n_cache_hits == 1
+
+        # a plain run cannot answer a gradient request, the reverse works
+        cal._loss_and_gradient(params, targets)
+        cal._loss_and_gradient(params, targets)
+        assert cal.n_simulations == 2
+        assert cal.n_cache_hits == 2
+
+    def test_cache_is_bounded_and_reported(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(10, 1)["x"]})
+        cal = Calibrator(_make_decay_scenario(), simulation_time=10, cache_size=2)
+        targets = cal._prepare_targets(data)
+        for growth in (1.0, 2.0, 3.0, 1.0):
+            cal._loss(np.array([growth, 0.1]), targets)
+        assert len(cal._cache) == 2
+        assert cal.n_cache_hits == 0
+
+        cal.calibrate(data, method="trust_region")
+        result = cal.last_result
+        assert result.n_evaluations == result.n_simulations + result.n_cache_hits
+        assert result.n_cache_hits > 0
+
+    def test_early_abort_stops_hopeless_runs(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(30, 1)["x"]})
+
+        cal = Calibrator(_make_decay_scenario(), simulation_time=30)
+        targets = cal._prepare_targets(data)
+        loss = cal._loss(np.array([5.0, 0.01]), targets, loss_threshold=1.0)
+        assert loss > 1.0
+        assert loss < Calibrator(_make_decay_scenario(), simulation_time=30)._loss(
+            np.array([5.0, 0.01]), targets
+        )
+        assert cal.n_aborted == 1
+        # aborted runs are partial and must not be cached
+        assert len(cal._cache) == 0
+
+        assert cal._loss(np.array([2.0, 0.1]), targets, loss_threshold=1.0) < 1e-12
+        assert cal.n_aborted == 1
+
+    def test_early_abort_keeps_the_optimum(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(30, 1)["x"]})
+
+        cal = Calibrator(
+            _make_decay_scenario(),
+            simulation_time=30,
+            bounds=[(0.0, 5.0), (0.01, 1.0)],
+        )
+        params = cal.calibrate(data, method="nelder_mead", early_abort=True)
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=1e-3)
+        assert cal.last_result.n_aborted == cal.n_aborted > 0
+
+    def test_early_abort_takes_the_same_steps_on_noisy_data(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        observed = np.array(truth.run(30, 1)["x"])
+        noise = np.random.default_rng(0).normal(scale=0.5, size=observed.shape)
+        data = pd.DataFrame({"x": observed + noise})
+
+        results = []
+        for early_abort in (False, True):
+            cal = Calibrator(
+                _make_decay_scenario(),
+                simulation_time=30,
+                bounds=[(0.0, 5.0), (0.01, 1.0)],
+            )
+            params = cal.calibrate(data, method="nelder_mead", early_abort=early_abort)
+            results.append((params, cal.last_result))
+        (plain_params, plain), (aborted_params, aborted) = results
+        np.testing.assert_array_equal(aborted_params, plain_params)
+        assert aborted.n_aborted > 0
+        assert aborted.n_simulations <= plain.n_simulations
+
+    def test_early_abort_needs_a_derivative_free_method(self) -> None:
+        data = pd.DataFrame({"x": [10.0] * 5})
+        cal = Calibrator(_make_decay_scenario(), simulation_time=5)
+        with pytest.raises(ValueError, match="early_abort"):
+            cal.calibrate(data, early_abort=True)
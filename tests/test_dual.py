@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pytest
+
+from models.core.stock import Stock
+from models.engine.dual import Dual, seed_duals, unpack_duals
+
+
+def _derivative(fn, x: float) -> float:
+    (dual,) = seed_duals([x])
+    return float(fn(dual).gradient[0])
+
+
+class TestDual:
+    def test_arithmetic(self) -> None:
+        x = 1.5
+        assert _derivative(lambda d: 3 * d + 2, x) == pytest.approx(3)
+        assert _derivative(lambda d: d * d, x) == pytest.approx(2 * x)
+        assert _derivative(lambda d: 1 / d, x) == pytest.approx(-1 / x**2)
+        assert _derivative(lambda d: 2 - d / 4, x) == pytest.approx(-0.25)
+
+    def test_powers(self) -> None:
+        x = 2.0
+        assert _derivative(lambda d: d**3, x) == pytest.approx(3 * x**2)
+        assert _derivative(lambda d: 2**d, x) == pytest.approx(4 * math.log(2))
+        assert _derivative(lambda d: d**d, x) == pytest.approx(4 * (1 + math.log(2)))
+
+    def test_zero_to_the_zero(self) -> None:
+        (zero,) = seed_duals([0.0])
+        assert (zero**0).value == 0.0**0
+        assert _derivative(lambda d: d**0, 0.0) == 0
+        assert _derivative(lambda d: d ** Dual(0.0, np.zeros(1)), 0.0) == 0
+
+    def test_builtins_and_comparisons(self) -> None:
+        assert _derivative(lambda d: max(d, 0.0), 2.0) == 1
+        assert _derivative(lambda d: min(d, 3.0), 2.0) == 1
+        assert min(seed_duals([2.0])[0], 1.0) == 1.0
+        assert _derivative(lambda d: abs(d), -2.0) == -1
+        assert _derivative(lambda d: d if d > 1 else 0 * d, 2.0) == 1
+
+    def test_numpy_ufuncs(self) -> None:
+        x = 0.5
+        assert _derivative(np.exp, x) == pytest.approx(math.exp(x))
+        assert _derivative(np.log, x) == pytest.approx(1 / x)
+        assert _derivative(lambda d: np.float64(2.0) * d, x) == pytest.approx(2)
+        assert np.isfinite(Dual(1.0, np.zeros(1)))
+
+    def test_multiple_parameters(self) -> None:
+        a, b = seed_duals([2.0, 3.0])
+        result = a * b + a
+        assert result.value == 8
+        np.testing.assert_allclose(result.gradient, [4.0, 2.0])
+
+    def test_stock_accepts_duals(self) -> None:
+        (rate,) = seed_duals([0.5])
+        stock = Stock("x", 10)
+        stock.change(rate * 4)
+        assert stock.value.value == 12
+        assert stock.value.gradient[0] == 4
+
+    def test_unpack_mixes_floats_and_duals(self) -> None:
+        (d,) = seed_duals([1.0])
+        values, gradients = unpack_duals([[1.0, d * 2]], 1)
+        np.testing.assert_allclose(values, [[1.0, 2.0]])
+        np.testing.assert_allclose(gradients[..., 0], [[0.0, 2.0]])
@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from models.calibration import loader
+from models.calibration.calibrator import Calibrator
+from models.calibration.loader import read_calibration_data
+from models.scenario.scenario import Scenario
+
+DATA = Path(__file__).resolve().parents[1] / "data" / "calibration_data_test.xlsx"
+
+
+def _fail_parse(*args: object) -> None:
+    raise AssertionError("cached data was parsed again")
+
+
+class TestReadCalibrationData:
+    def test_reuses_cache_until_content_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "observed.csv"
+        path.write_text("infected,recovered\n10,0\n12,1\n")
+        cache = tmp_path / "cache"
+        first = read_calibration_data(path, cache_dir=cache)
+        assert list(first.columns) == ["infected", "recovered"]
+        assert first["infected"].tolist() == [10.0, 12.0]
+        assert cache.is_dir()
+
+        # A touched but unchanged file is recognised by its hash.
+        os.utime(path, ns=(0, 0))
+        with monkeypatch.context() as patch:
+            patch.setattr(loader, "_parse", _fail_parse)
+            assert read_calibration_data(path, cache_dir=cache).equals(first)
+            assert read_calibration_data(path, cache_dir=cache).equals(first)
+
+        path.write_text("infected,recovered\n10,0\n15,2\n")
+        changed = read_calibration_data(path, cache_dir=cache)
+        assert changed["infected"].tolist() == [10.0, 15.0]
+
+    def test_caches_only_when_asked(self, tmp_path: Path) -> None:
+        path = tmp_path / "observed.csv"
+        path.write_text("infected\n10\n")
+        assert read_calibration_data(path)["infected"].tolist() == [10.0]
+        assert [entry.name for entry in tmp_path.iterdir()] == ["observed.csv"]
+
+    def test_unwritable_cache_is_skipped(self, tmp_path: Path) -> None:
+        path = tmp_path / "observed.csv"
+        path.write_text("infected\n10\n")
+        blocked = tmp_path / "blocked"
+        blocked.write_text("a file where the cache directory should be")
+        frame = read_calibration_data(path, cache_dir=blocked / "cache")
+        assert frame["infected"].tolist() == [10.0]
+
+    def test_rejects_non_numeric_columns(self, tmp_path: Path) -> None:
+        path = tmp_path / "observed.csv"
+        path.write_text("infected,note\n10,a\n")
+        with pytest.raises(ValueError, match="note"):
+            read_calibration_data(path, cache_dir=tmp_path / "cache")
+
+    def test_reads_spreadsheet(self, tmp_path: Path) -> None:
+        frame = read_calibration_data(DATA, cache_dir=tmp_path)
+        assert list(frame.columns) == ["date", "Predator", "Prey"]
+
+
+class TestLoadTargets:
+    def test_aligns_spreadsheet_to_stocks(self, tmp_path: Path) -> None:
+        scenario = Scenario("lv", {"Predator": 20.0, "Prey": 30.0}, {}, [])
+        cal = Calibrator(
+            scenario, simulation_time=100, time_column="date", time_origin=1845
+        )
+        targets = cal.load_targets(DATA, cache_dir=tmp_path)
+        assert targets.stock_names == ["Predator", "Prey"]
+        assert targets.values[0, 0] == pytest.approx(19.58)
+
+    def test_rejects_unknown_stock_columns(self, tmp_path: Path) -> None:
+        path = tmp_path / "observed.csv"
+        path.write_text("x,y\n1,2\n")
+        scenario = Scenario("one", {"x": 1.0}, {}, [])
+        with pytest.raises(ValueError, match="Unknown stocks"):
+            Calibrator(scenario).load_targets(path)
+
+    def test_calibrate_passes_sheet_and_cache(self, tmp_path: Path) -> None:
+        scenario = Scenario("lv", {"Predator": 20.0, "Prey": 30.0}, {}, [])
+        cal = Calibrator(
+            scenario, simulation_time=100, time_column="date", time_origin=1845
+        )
+        cal.calibrate(DATA, "least_squares", sheet_name=0, cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.npz"))) == 1
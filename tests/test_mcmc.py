@@ -0,0 +1,140 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from models.calibration.calibrator import Calibrator
+from models.calibration.mcmc import run_ensemble_sampler
+from models.core.auxiliary import Auxiliary
+from models.scenario.scenario import Scenario
+
+
+def _make_decay_scenario(growth: float = 1.0, decay: float = 0.2) -> Scenario:
+    rates = {
+        "inflow": {"rate_function": lambda growth: growth, "destination": "x"},
+        "outflow": {"rate_function": lambda x, decay: x * decay, "source": "x"},
+    }
+    return Scenario(
+        "decay",
+        {"x": 10},
+        rates,
+        [Auxiliary("growth", growth), Auxiliary("decay", decay)],
+    )
+
+
+def _gaussian_log_prob(positions: np.ndarray) -> np.ndarray:
+    return -0.5 * np.sum((positions - [1.0, -2.0]) ** 2, axis=1)
+
+
+class TestEnsembleSampler:
+    def test_samples_gaussian(self) -> None:
+        rng = np.random.default_rng(0)
+        sampled = run_ensemble_sampler(
+            _gaussian_log_prob, rng.normal(size=(16, 2)), 600, seed=0
+        )
+        samples = sampled["chain"][200:].reshape(-1, 2)
+        np.testing.assert_allclose(samples.mean(axis=0), [1.0, -2.0], atol=0.2)
+        np.testing.assert_allclose(samples.std(axis=0), [1.0, 1.0], atol=0.2)
+        assert np.all(sampled["acceptance_fraction"] > 0.2)
+
+    def test_resumes_from_checkpoint(self, tmp_path: Path) -> None:
+        initial = np.random.default_rng(1).normal(size=(8, 2))
+        full = run_ensemble_sampler(_gaussian_log_prob, initial, 40, seed=3)
+
+        path = tmp_path / "chain.npz"
+        run_ensemble_sampler(
+            _gaussian_log_prob,
+            initial,
+            25,
+            seed=3,
+            checkpoint_path=path,
+            checkpoint_every=10,
+        )
+        # the seed is restored from the checkpoint, not taken from the caller
+        resumed = run_ensemble_sampler(
+            _gaussian_log_prob, initial, 40, seed=None, checkpoint_path=path
+        )
+        np.testing.assert_array_equal(resumed["chain"], full["chain"])
+
+    def test_rejects_small_ensemble(self) -> None:
+        with pytest.raises(ValueError, match="num_walkers"):
+            run_ensemble_sampler(_gaussian_log_prob, np.zeros((3, 2)), 10)
+
+
+class TestCalibratorEnsembleMCMC:
+    def test_posterior_covers_truth(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        observed = np.array(truth.run(30, 1)["x"])
+        noise = np.random.default_rng(0).normal(scale=0.1, size=observed.shape)
+        data = pd.DataFrame({"x": observed + noise})
+
+        scenario = _make_decay_scenario(growth=1.8, decay=0.09)
+        cal = Calibrator(
+            scenario,
+            simulation_time=30,
+            bounds=[(0.0, 5.0), (0.01, 1.0)],
+        )
+        params = cal.calibrate(
+            data,
+            method="ensemble_mcmc",
+            num_walkers=16,
+            num_samples=300,
+            noise_scale=0.1,
+            seed=0,
+        )
+
+        result = cal.last_result
+        assert result.chain.shape == (300, 16, 2)
+        assert result.parameter_names == ["growth", "decay"]
+        np.testing.assert_allclose(params, [2.0, 0.1], rtol=0.05)
+        assert scenario.auxiliaries[0].values == params[0]
+        # one batched run per half-ensemble and iteration
+        assert cal.n_simulations <= 2 * 300 + 1
+
+    def test_priors_over_initial_values(self) -> None:
+        truth = _make_decay_scenario(growth=2.0, decay=0.1)
+        data = pd.DataFrame({"x": truth.run(20, 1)["x"]})
+
+        scenario = _make_decay_scenario(growth=2.0, decay=0.1)
+        scenario.initial_values["x"] = 9.0
+        cal = Calibrator(scenario, simulation_time=20)
+        params = cal.calibrate(
+            data,
+            method="ensemble_mcmc",
+            priors={"x": stats.norm(10, 5), "decay": stats.uniform(0, 1)},
+            num_walkers=8,
+            num_samples=200,
+            noise_scale=0.1,
+            seed=1,
+        )
+        np.testing.assert_allclose(params, [10.0, 0.1], rtol=0.05)
+        assert scenario.initial_values["x"] == params[0]
+
+    def test_non_vectorized_rates_run_member_by_member(self) -> None:
+        rates = {
+            "inflow": {"rate_function": lambda growth: growth, "destination": "x"},
+            "outflow": {
+                "rate_function": lambda x, decay: min(x * decay, 100.0),
+                "source": "x",
+            },
+        }
+        auxiliaries = [Auxiliary("growth", 2.0), Auxiliary("decay", 0.1)]
+        scenario = Scenario("decay", {"x": 10}, rates, auxiliaries)
+        data = pd.DataFrame({"x": scenario.run(10, 1)["x"]})
+        cal = Calibrator(scenario, simulation_time=10)
+        targets = cal._prepare_targets(data)
+        simulated = cal._simulate_batch(
+            ["growth", "decay"], np.array([[2.0, 0.1], [1.0, 0.2]]), targets
+        )
+        assert simulated.shape == (2, 1, 10)
+        np.testing.assert_allclose(simulated[0, 0], data["x"])
+
+    def test_unknown_prior(self) -> None:
+        data = pd.DataFrame({"x": [10.0] * 5})
+        cal = Calibrator(_make_decay_scenario(), simulation_time=5)
+        with pytest.raises(ValueError, match="gamma"):
+            cal.calibrate(
+                data, method="ensemble_mcmc", priors={"gamma": stats.norm()}
+            )
@@ -0,0 +1,174 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from models.core.auxiliary import Auxiliary
+from models.scenario.morris import generate_morris_trajectories
+from models.scenario.scenario import Scenario
+
+
+def _growth_rate(growth: float) -> float:
+    return growth
+
+
+def _make_picklable_scenario() -> Scenario:
+    return Scenario(
+        "linear",
+        {"x": 0},
+        {"inflow": {"rate_function": _growth_rate, "destination": "x"}},
+        [Auxiliary("growth", 1.0), Auxiliary("unused", 5.0)],
+    )
+
+
+_SCREENING = {
+    "parameters": [
+        {"component": "auxiliaries", "name": "growth"},
+        {"component": "auxiliaries", "name": "unused"},
+    ],
+    "bounds": [(0.0, 2.0), (0.0, 10.0)],
+    "outputs": ["x"],
+    "reduction": "final",
+    "num_trajectories": 4,
+    "until": 10,
+    "seed": 3,
+}
+
+
+def _make_linear_scenario() -> Scenario:
+    auxiliaries = [Auxiliary("growth", 1.0), Auxiliary("unused", 5.0)]
+    initial_values = {"x": 0}
+    rates = {
+        "inflow": {
+            "rate_function": lambda growth: growth,
+            "source": None,
+            "destination": "x",
+        }
+    }
+    return Scenario("linear", initial_values, rates, auxiliaries)
+
+
+class TestMorrisTrajectories:
+    def test_shape_and_bounds(self) -> None:
+        rng = np.random.default_rng(0)
+        trajectories = generate_morris_trajectories(3, 5, 4, rng)
+        assert trajectories.shape == (5, 4, 3)
+        assert trajectories.min() >= 0
+        assert trajectories.max() <= 1
+
+    def test_one_factor_changes_per_step(self) -> None:
+        rng = np.random.default_rng(1)
+        trajectories = generate_morris_trajectories(4, 6, 4, rng)
+        changed = np.count_nonzero(np.diff(trajectories, axis=1), axis=2)
+        assert np.all(changed == 1)
+
+    def test_invalid_levels(self) -> None:
+        with pytest.raises(ValueError, match="num_levels"):
+            generate_morris_trajectories(2, 2, 1)
+
+
+class TestMorrisScreening:
+    def test_influential_and_inert_parameters(self) -> None:
+        scenario = _make_linear_scenario()
+        results = scenario.run_sensitivity_analysis_morris(
+            parameters=[
+                {"component": "auxiliaries", "name": "growth"},
+                {"component": "auxiliaries", "name": "unused"},
+                {"component": "stocks", "name": "x"},
+            ],
+            bounds=[(0.0, 2.0), (0.0, 10.0), (0.0, 4.0)],
+            outputs=["x"],
+            reduction="final",
+            num_trajectories=4,
+            until=10,
+            dt=1,
+            seed=42,
+        )
+        stats = results["x"]
+        # final x = x0 + 10 * growth, so effects are exact in unit-scaled space
+        assert stats["growth"]["mu_star"] == pytest.approx(20.0)
+        assert stats["x"]["mu_star"] == pytest.approx(4.0)
+        assert stats["unused"]["mu_star"] == pytest.approx(0.0)
+        assert stats["growth"]["sigma"] == pytest.approx(0.0, abs=1e-9)
+
+    def test_does_not_mutate_scenario(self) -> None:
+        scenario = _make_linear_scenario()
+        scenario.run_sensitivity_analysis_morris(
+            parameters=[{"component": "auxiliaries", "name": "growth"}],
+            bounds=[(0.0, 2.0)],
+            outputs=["x"],
+            num_trajectories=2,
+            until=5,
+            seed=0,
+        )
+        assert scenario.auxiliaries[0].values == 1.0
+        assert scenario.initial_values == {"x": 0}
+
+    def test_mismatched_bounds(self) -> None:
+        scenario = _make_linear_scenario()
+        with pytest.raises(ValueError, match="bound"):
+            scenario.run_sensitivity_analysis_morris(
+                parameters=[{"component": "auxiliaries", "name": "growth"}],
+                bounds=[],
+                outputs=["x"],
+            )
+
+    def test_unknown_output(self) -> None:
+        scenario = _make_linear_scenario()
+        with pytest.raises(ValueError, match="Unknown output"):
+            scenario.run_sensitivity_analysis_morris(
+                parameters=[{"component": "auxiliaries", "name": "growth"}],
+                bounds=[(0.0, 1.0)],
+                outputs=["missing"],
+                num_trajectories=1,
+                until=2,
+            )
+
+    def test_unknown_parameter_name(self) -> None:
+        scenario = _make_linear_scenario()
+        with pytest.raises(ValueError, match="Unknown auxiliaries parameter 'growht'"):
+            scenario.run_sensitivity_analysis_morris(
+                parameters=[{"component": "auxiliaries", "name": "growht"}],
+                bounds=[(0.0, 1.0)],
+                outputs=["x"],
+            )
+        with pytest.raises(ValueError, match="Unknown stocks parameter 'y'"):
+            scenario.run_sensitivity_analysis_morris(
+                parameters=[{"component": "stocks", "name": "y"}],
+                bounds=[(0.0, 1.0)],
+                outputs=["x"],
+            )
+
+
+class TestMorrisParallel:
+    def test_thread_executor_matches_serial(self) -> None:
+        serial = _make_linear_scenario().run_sensitivity_analysis_morris(**_SCREENING)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = _make_linear_scenario().run_sensitivity_analysis_morris(
+                **_SCREENING, executor=executor
+            )
+        assert threaded == serial
+
+    def test_process_pool_with_picklable_scenario(self) -> None:
+        serial = _make_picklable_scenario().run_sensitivity_analysis_morris(
+            **_SCREENING
+        )
+        parallel = _make_picklable_scenario().run_sensitivity_analysis_morris(
+            **_SCREENING, max_workers=2
+        )
+        assert parallel == serial
+
+    def test_lambda_scenario_falls_back_to_threads(self) -> None:
+        serial = _make_linear_scenario().run_sensitivity_analysis_morris(**_SCREENING)
+        with pytest.warns(RuntimeWarning, match="threads"):
+            parallel = _make_linear_scenario().run_sensitivity_analysis_morris(
+                **_SCREENING, max_workers=2
+            )
+        assert parallel == serial
+
+    def test_lambda_scenario_rejected_by_process_executor(self) -> None:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(ValueError, match="process pool"):
+                _make_linear_scenario().run_sensitivity_analysis_morris(
+                    **_SCREENING, executor=executor
+                )
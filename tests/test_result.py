@@ -0,0 +1,136 @@
+import json
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.engine.result import EnsembleResult, SimulationResult
+
+
+def _make_result() -> SimulationResult:
+    return SimulationResult.from_history(
+        {"x": [1.0, 2.0, 3.0, 4.0], "y": [5.0, 6.0, 7.0, 8.0], "time": [0, 1, 2, 3]}
+    )
+
+
+class TestSimulationResult:
+    def test_behaves_like_history_dict(self) -> None:
+        result = _make_result()
+        assert list(result) == ["x", "y", "time"]
+        assert result["x"][-1] == 4.0
+        assert list(result["time"][:2]) == [0.0, 1.0]
+        assert pd.DataFrame(result)["y"].tolist() == [5.0, 6.0, 7.0, 8.0]
+        assert result == {"x": [1, 2, 3, 4], "y": [5, 6, 7, 8], "time": [0, 1, 2, 3]}
+
+    def test_series_are_lists(self) -> None:
+        result = _make_result()
+        assert json.loads(json.dumps(result))["x"] == [1.0, 2.0, 3.0, 4.0]
+        assert result["x"] == [1.0, 2.0, 3.0, 4.0]
+        assert result["x"] + [9.0] == [1.0, 2.0, 3.0, 4.0, 9.0]
+        result["x"].append(5.0)
+        assert len(result["x"]) == 5
+        # the array behind to_numpy is not touched by edits to the lists
+        assert result.to_numpy().shape == (4, 2)
+        assert np.shares_memory(result.data, result.to_numpy())
+        assert result.data.shape == (3, 4)
+        assert dict(result)["y"] == [5.0, 6.0, 7.0, 8.0]
+
+    def test_exports_share_memory(self) -> None:
+        result = _make_result()
+        frame = result.to_pandas()
+        assert list(frame.columns) == ["x", "y", "time"]
+        assert np.shares_memory(frame["x"].to_numpy(), result.to_numpy())
+        assert result.to_numpy().shape == (4, 2)
+        with pytest.raises(ValueError):
+            result.to_numpy()[0, 0] = 0.0
+
+    def test_select_variables_and_time_window(self) -> None:
+        result = _make_result()
+        window = result.select(start=1, stop=3)
+        assert list(window["time"]) == [1.0, 2.0]
+        assert np.shares_memory(window.to_numpy(), result.to_numpy())
+
+        only_y = result.select(["y"], start=2)
+        assert list(only_y) == ["y", "time"]
+        assert list(only_y["y"]) == [7.0, 8.0]
+        with pytest.raises(KeyError, match="z"):
+            result.select(["z"])
+
+    def test_stride(self) -> None:
+        result = _make_result()
+        assert list(result.select(stride=2)["x"]) == [1.0, 3.0]
+        with pytest.raises(ValueError, match="stride"):
+            result.select(stride=0)
+
+    def test_downsample_keeps_peaks(self) -> None:
+        time = np.arange(1000.0)
+        signal = np.sin(time / 50)
+        signal[437] = 5.0
+        data = np.vstack([signal, -signal, time])
+        result = SimulationResult(data, ["a", "b", "time"])
+        for method in ("minmax", "lttb"):
+            reduced = result.downsample(50, method)
+            assert len(reduced.time) <= 100
+            assert 437.0 in reduced.time
+            assert reduced.time[0] == 0.0 and reduced.time[-1] == 999.0
+        assert len(result.select(["a"]).downsample(50, "lttb").time) == 50
+        assert result.downsample(5000) == result
+        with pytest.raises(ValueError, match="median"):
+            result.downsample(50, "median")
+
+    def test_pads_shorter_series(self) -> None:
+        result = SimulationResult.from_history({"aux": [1.0], "time": [0, 1]})
+        assert np.isnan(result["aux"][1])
+
+    def test_pickles(self) -> None:
+        result = _make_result()
+        assert pickle.loads(pickle.dumps(result)) == result
+
+
+def _make_ensemble() -> EnsembleResult:
+    histories = {
+        (growth, start): {
+            "x": [start + growth * (k + 1) for k in range(4)],
+            "time": [0, 1, 2, 3],
+        }
+        for growth in (1.0, 2.0)
+        for start in (0.0, 10.0)
+    }
+    return EnsembleResult.from_histories(histories, ["growth", "start"])
+
+
+class TestEnsembleResult:
+    def test_stacks_members(self) -> None:
+        ensemble = _make_ensemble()
+        assert ensemble.values.shape == (4, 4, 1)
+        assert ensemble.parameters.tolist()[1] == [1.0, 10.0]
+        member = ensemble[(2.0, 0.0)]
+        assert list(member["x"]) == [2.0, 4.0, 6.0, 8.0]
+        assert np.shares_memory(member.to_numpy(), ensemble.values)
+        assert len(ensemble) == 4 and (1.0, 0.0) in ensemble
+
+    def test_vectorized_reductions(self) -> None:
+        ensemble = _make_ensemble()
+        np.testing.assert_allclose(
+            ensemble.reduce("final", axis="time")[:, 0], [4, 14, 8, 18]
+        )
+        assert ensemble.reduce("mean", axis="members").shape == (4, 1)
+        with pytest.raises(ValueError, match="Axis"):
+            ensemble.reduce(axis="space")
+
+    def test_select_by_parameter_value(self) -> None:
+        ensemble = _make_ensemble()
+        fast = ensemble.select(growth=2.0)
+        assert list(fast) == [(2.0, 0.0), (2.0, 10.0)]
+        assert fast.variable("x").shape == (2, 4)
+        assert list(ensemble.select(growth=1.0, start=10.0)) == [(1.0, 10.0)]
+        with pytest.raises(KeyError, match="rate"):
+            ensemble.select(rate=1.0)
+
+    def test_rejects_mismatched_members(self) -> None:
+        with pytest.raises(ValueError, match="same series"):
+            EnsembleResult.from_histories(
+                {1: {"x": [1.0], "time": [0]}, 2: {"x": [1.0, 2.0], "time": [0, 1]}},
+                ["p"],
+            )
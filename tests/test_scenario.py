@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from models.core.auxiliary import Auxiliary
@@ -47,6 +48,9 @@ class TestScenario:
             dt=1,
         )
         assert len(results) == 2
+        assert results.parameter_names == ["susceptible"]
+        assert results.variable("susceptible").shape == (2, 10)
+        assert results[60]["susceptible"][0] > results[40]["susceptible"][0]
 
     def test_sensitivity_analysis_multivariate(self) -> None:
         auxiliaries = [
@@ -129,3 +133,54 @@ class TestScenario:
         }
         with pytest.raises(ValueError, match="end_time must be greater"):
             sir_scenario.apply_shock_over_period(components)
+
+    def test_calculate_elasticities_all_parameters(
+        self, sir_scenario: Scenario
+    ) -> None:
+        results = {
+            (1.0, 2.0): {"x": [10.0, 10.0]},
+            (2.0, 2.0): {"x": [20.0, 20.0]},
+            (1.0, 4.0): {"x": [5.0, 5.0]},
+        }
+        elasticities = sir_scenario.calculate_elasticities(
+            results, (1.0, 2.0), None, "x", parameter_names=["a", "b"]
+        )
+        assert set(elasticities) == {"a", "b"}
+        # output doubles when a doubles; halves when b doubles
+        assert elasticities["a"][1] == pytest.approx(1.0)
+        assert elasticities["b"][2] == pytest.approx(-0.5)
+        assert np.isnan(elasticities["a"][0])
+        assert np.isnan(elasticities["a"][2])
+
+    def test_calculate_elasticities_reductions(self, sir_scenario: Scenario) -> None:
+        results = {
+            1.0: {"x": [1.0, 4.0, 2.0]},
+            2.0: {"x": [1.0, 8.0, 3.0]},
+        }
+        final = sir_scenario.calculate_elasticities(
+            results, 1.0, [2.0], "x", reduction="final"
+        )
+        peak = sir_scenario.calculate_elasticities(
+            results, 1.0, [2.0], "x", reduction="peak"
+        )
+        assert final[0] == pytest.approx([0.5])
+        assert peak[0] == pytest.approx([1.0])
+
+    def test_calculate_elasticities_unknown_reduction(
+        self, sir_scenario: Scenario
+    ) -> None:
+        results = {1.0: {"x": [1.0]}, 2.0: {"x": [2.0]}}
+        with pytest.raises(ValueError, match="not supported"):
+            sir_scenario.calculate_elasticities(
+                results, 1.0, None, "x", reduction="median"
+            )
+
+    def test_calculate_elasticities_parameter_name_count(
+        self, sir_scenario: Scenario
+    ) -> None:
+        results = {(1.0, 2.0): {"x": [1.0]}, (2.0, 2.0): {"x": [2.0]}}
+        for names in (["a"], ["a", "b", "c"]):
+            with pytest.raises(ValueError, match="Expected 2 parameter names"):
+                sir_scenario.calculate_elasticities(
+                    results, (1.0, 2.0), None, "x", parameter_names=names
+                )
@@ -1,3 +1,8 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from models.core.auxiliary import Auxiliary
 from models.scenario.scenario import Scenario
 from models.scenario.scenario_manager import ScenarioManager
@@ -52,3 +57,132 @@ class TestScenarioManager:
     def test_get_results_unknown(self) -> None:
         mgr = ScenarioManager()
         assert mgr.get_results("unknown") is None
+
+    def test_get_results_after_direct_run(self) -> None:
+        mgr = ScenarioManager()
+        s = _make_scenario("s1")
+        mgr.add_scenario(s)
+        s.run(5, 1)
+        assert mgr.get_results("s1") is s.results
+
+    def test_get_results_prefers_a_later_direct_run(self) -> None:
+        mgr = ScenarioManager()
+        s = _make_scenario("s1")
+        mgr.add_scenario(s)
+        mgr.run_all(simulation_time=10, dt=1)
+        s.run(5, 1)
+        assert len(mgr.get_results("s1")["time"]) == 5
+
+    def test_run_all_in_parallel(self) -> None:
+        mgr = ScenarioManager()
+        for name in ("s1", "s2", "s3"):
+            mgr.add_scenario(_make_scenario(name))
+        expected = _make_scenario("reference").run(10, 1)
+
+        # lambda rate functions cannot be pickled, so threads are used
+        with pytest.warns(RuntimeWarning, match="threads"):
+            failures = mgr.run_all(simulation_time=10, dt=1, max_workers=2)
+        assert failures == {}
+        assert set(mgr.results) == {"s1", "s2", "s3"}
+        assert mgr.get_results("s2") == expected
+
+    def test_run_all_reports_scenarios_as_they_finish(self) -> None:
+        mgr = ScenarioManager()
+        fast_done = threading.Event()
+        slow = _make_scenario("slow")
+        slow.rates["recovery"]["rate_function"] = (
+            lambda infected, recovery_rate: fast_done.wait(1) and 0.0
+        )
+        mgr.add_scenario(slow)
+        mgr.add_scenario(_make_scenario("fast"))
+
+        completed: list[str] = []
+
+        def on_complete(name: str, error: BaseException | None) -> None:
+            completed.append(name)
+            if name == "fast":
+                fast_done.set()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            mgr.run_all(10, 1, executor=executor, on_complete=on_complete)
+        assert completed == ["fast", "slow"]
+
+    def test_run_all_reports_failures_per_scenario(self) -> None:
+        mgr = ScenarioManager()
+        broken = _make_scenario("broken")
+        broken.initial_values["infected"] = float("inf")
+        mgr.add_scenario(broken)
+        mgr.add_scenario(_make_scenario("ok"))
+
+        completed: list[tuple[str, bool]] = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            failures = mgr.run_all(
+                simulation_time=10,
+                dt=1,
+                executor=executor,
+                on_complete=lambda name, error: completed.append(
+                    (name, error is None)
+                ),
+            )
+        assert isinstance(failures["broken"], ValueError)
+        assert mgr.get_results("ok") is not None
+        assert "broken" not in mgr.results
+        assert sorted(completed) == [("broken", False), ("ok", True)]
+
+        failures = mgr.run_all(simulation_time=10, dt=1)
+        assert set(failures) == {"broken"}
+
+
+def _make_linear_scenario(name: str) -> Scenario:
+    rates = {"inflow": {"rate_function": lambda growth: growth, "destination": "x"}}
+    return Scenario(name, {"x": 0}, rates, [Auxiliary("growth", 1.0)])
+
+
+class TestScenarioBranches:
+    def test_branch_diverges_at_branch_time(self) -> None:
+        mgr = ScenarioManager()
+        mgr.add_scenario(_make_linear_scenario("base"))
+        mgr.add_branch("fast", "base", at=5, overrides={"auxiliaries": {"growth": 3.0}})
+        mgr.add_branch("reset", "base", at=8, overrides={"initial_values": {"x": 0}})
+        assert mgr.run_all(simulation_time=10, dt=1) == {}
+
+        assert mgr.get_results("base")["x"] == [float(k + 1) for k in range(10)]
+        fast = mgr.get_results("fast")
+        assert fast["time"] == list(range(10))
+        assert fast["x"] == [1, 2, 3, 4, 5, 8, 11, 14, 17, 20]
+        assert mgr.get_results("reset")["x"][7:] == [8, 1, 2]
+
+    def test_branch_stores_only_its_suffix(self) -> None:
+        mgr = ScenarioManager()
+        mgr.add_scenario(_make_linear_scenario("base"))
+        mgr.add_branch("late", "base", at=7, overrides={"auxiliaries": {"growth": 2}})
+        mgr.add_branch("never", "base", at=50, overrides={})
+        mgr.run_all(simulation_time=10, dt=1)
+
+        late = mgr.results["late"]
+        assert late.prefix is mgr.results["base"]
+        assert len(late.suffix["x"]) == 3
+        assert mgr.get_results("never")["x"] == mgr.get_results("base")["x"]
+
+    def test_branch_at_start_matches_full_run(self) -> None:
+        mgr = ScenarioManager()
+        mgr.add_scenario(_make_linear_scenario("base"))
+        mgr.add_branch("b", "base", at=0, overrides={"auxiliaries": {"growth": 2}})
+        mgr.run_all(simulation_time=5, dt=1)
+        assert mgr.get_results("b")["x"] == [2, 4, 6, 8, 10]
+
+    def test_failed_baseline_fails_its_branches(self) -> None:
+        mgr = ScenarioManager()
+        base = _make_linear_scenario("base")
+        base.initial_values["x"] = float("inf")
+        mgr.add_scenario(base)
+        mgr.add_branch("b", "base", at=2, overrides={})
+        assert set(mgr.run_all(simulation_time=5, dt=1)) == {"base", "b"}
+
+    def test_add_branch_validates_names(self) -> None:
+        mgr = ScenarioManager()
+        mgr.add_scenario(_make_linear_scenario("base"))
+        with pytest.raises(ValueError, match="Unknown baseline"):
+            mgr.add_branch("b", "missing", at=1, overrides={})
+        with pytest.raises(ValueError, match="already used"):
+            mgr.add_branch("base", "base", at=1, overrides={})
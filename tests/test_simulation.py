@@ -43,7 +43,8 @@ class TestSimulation:
         sim = _build_simple_sim()
         sim.run(until=3, dt=1)
         sim.continue_run({"pop": 200}, until=5, dt=1)
-        assert len(sim.history["time"]) > 3
+        assert sim.history["time"] == [0, 1, 2, 3, 4]
+        assert sim.history["pop"][3:] == [210, 220]
 
     def test_get_results_returns_history(self) -> None:
         sim = _build_simple_sim()
@@ -54,3 +55,35 @@ class TestSimulation:
         sim = Simulation()
         history = sim.run(until=3, dt=1)
         assert history["time"] == [0, 1, 2]
+
+    def test_run_records_selected_variables_and_steps(self) -> None:
+        sim = _build_simple_sim()
+        history = sim.run(until=5, dt=1, variables=["pop"], record_steps={1, 3})
+        assert set(history) == {"pop", "time"}
+        assert history["time"] == [1, 3]
+        assert history["pop"] == pytest.approx([120, 140])
+
+    def test_run_stops_when_condition_met(self) -> None:
+        sim = _build_simple_sim()
+        history = sim.run(
+            until=10, dt=1, stop_when=lambda history: history["pop"][-1] >= 130
+        )
+        assert history["time"] == [0, 1, 2]
+
+    def test_run_chunks_yields_history_in_pieces(self) -> None:
+        chunks = list(_build_simple_sim().run_chunks(until=5, dt=1, chunk_size=2))
+        assert [chunk["time"] for chunk in chunks] == [[0, 1], [2, 3], [4]]
+        assert chunks[-1]["pop"] == pytest.approx([150])
+
+        sim = _build_simple_sim()
+
+        def stop(history: dict[str, list[float]]) -> bool:
+            return history["pop"][-1] >= 140
+
+        chunks = list(
+            sim.run_chunks(10, 1, chunk_size=2, variables=["pop"], stop_when=stop)
+        )
+        assert [chunk["time"] for chunk in chunks] == [[0, 1], [2, 3]]
+        assert sim.history is chunks[-1]
+        with pytest.raises(ValueError, match="chunk_size"):
+            next(_build_simple_sim().run_chunks(chunk_size=0))
@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from models.engine.result import EnsembleResult, SimulationResult
+from models.engine.storage import (
+    EnsembleWriter,
+    ResultWriter,
+    load_result,
+    save_result,
+)
+from models.scenario.scenario import Scenario
+
+
+def _make_ensemble() -> EnsembleResult:
+    histories = {
+        (growth, start): {
+            "x": [start + growth * (k + 1) for k in range(4)],
+            "time": [0, 1, 2, 3],
+        }
+        for growth in (1.0, 2.0)
+        for start in (0.0, 10.0)
+    }
+    return EnsembleResult.from_histories(histories, ["growth", "start"])
+
+
+class TestSaveAndLoad:
+    def test_round_trips_memory_mapped_simulation(self, tmp_path: Path) -> None:
+        result = SimulationResult.from_history(
+            {"x": [1.0, 2.0, 3.0], "time": [0, 1, 2]}
+        )
+        save_result(result, tmp_path / "run")
+        loaded = load_result(tmp_path / "run")
+        assert isinstance(loaded, SimulationResult)
+        assert isinstance(loaded.to_numpy().base, np.memmap)
+        assert loaded == result
+
+    def test_round_trips_ensemble_keys(self, tmp_path: Path) -> None:
+        ensemble = _make_ensemble()
+        for path in (tmp_path / "sweep", tmp_path / "sweep.npz"):
+            save_result(ensemble, path)
+            loaded = load_result(path)
+            assert isinstance(loaded, EnsembleResult)
+            assert list(loaded) == list(ensemble)
+            assert loaded.parameter_names == ["growth", "start"]
+            np.testing.assert_array_equal(loaded.values, ensemble.values)
+            assert list(loaded.select(growth=2.0)[(2.0, 10.0)]["x"]) == [
+                12.0,
+                14.0,
+                16.0,
+                18.0,
+            ]
+
+    def test_round_trips_parquet(self, tmp_path: Path) -> None:
+        pytest.importorskip("pyarrow")
+        ensemble = _make_ensemble()
+        save_result(ensemble, tmp_path / "sweep.parquet")
+        loaded = load_result(tmp_path / "sweep.parquet")
+        np.testing.assert_array_equal(loaded.values, ensemble.values)
+
+    def test_incomplete_directory_is_rejected(self, tmp_path: Path) -> None:
+        ResultWriter(tmp_path / "run", ["x", "time"], 3)
+        with pytest.raises(FileNotFoundError, match="No complete result"):
+            load_result(tmp_path / "run")
+
+
+class TestWriters:
+    def test_result_writer_appends_chunks(self, tmp_path: Path) -> None:
+        with ResultWriter(tmp_path / "run", ["x", "time"], 5) as writer:
+            writer.write({"x": [1.0, 2.0], "time": [0, 1]})
+            writer.write({"x": [3.0], "time": [2]})
+            with pytest.raises(ValueError, match="columns"):
+                writer.write({"y": [1.0], "time": [3]})
+        loaded = load_result(tmp_path / "run")
+        assert list(loaded["x"]) == [1.0, 2.0, 3.0]
+
+    def test_ensemble_writer_checks_members(self, tmp_path: Path) -> None:
+        writer = EnsembleWriter(tmp_path / "sweep", 2, ["p"])
+        writer.add(1.0, {"x": [1.0, 2.0], "time": [0, 1]})
+        with pytest.raises(ValueError, match="same series"):
+            writer.add(2.0, {"x": [1.0], "time": [0]})
+        with pytest.raises(ValueError, match="Only 1 of 2"):
+            writer.close()
+
+
+class TestScenarioStorage:
+    def test_run_to_disk_matches_run(
+        self, sir_scenario: Scenario, tmp_path: Path
+    ) -> None:
+        expected = sir_scenario.run(50, 1)
+        streamed = sir_scenario.run_to_disk(tmp_path / "run", 50, 1, chunk_size=7)
+        assert streamed == expected
+        assert sir_scenario.results is streamed
+
+    def test_sweep_streams_to_store(
+        self, sir_scenario: Scenario, tmp_path: Path
+    ) -> None:
+        in_memory = sir_scenario.run_sensitivity_analysis_univariate(
+            "stocks", "infected", [5, 10, 20], until=10
+        )
+        stored = sir_scenario.run_sensitivity_analysis_univariate(
+            "stocks", "infected", [5, 10, 20], until=10, store=tmp_path / "sweep"
+        )
+        assert list(stored) == [5, 10, 20]
+        np.testing.assert_array_equal(stored.values, in_memory.values)
+        assert isinstance(stored.values.base, np.memmap)
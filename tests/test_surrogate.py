@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from models.core.auxiliary import Auxiliary
+from models.scenario.scenario import Scenario
+from models.scenario.surrogate import fit_surrogate
+
+
+def _make_scenario() -> Scenario:
+    rates = {
+        "inflow": {
+            "rate_function": lambda growth, boost: growth * boost,
+            "destination": "x",
+        }
+    }
+    auxiliaries = [
+        Auxiliary("growth", 1.0),
+        Auxiliary("boost", 1.0),
+        Auxiliary("unused", 5.0),
+    ]
+    return Scenario("linear", {"x": 0}, rates, auxiliaries)
+
+
+_PARAMETERS = [
+    {"component": "auxiliaries", "name": "growth"},
+    {"component": "auxiliaries", "name": "boost"},
+    {"component": "auxiliaries", "name": "unused"},
+]
+_BOUNDS = [(0.0, 2.0), (1.0, 3.0), (0.0, 10.0)]
+
+
+class TestSurrogate:
+    def test_reproduces_polynomial_outputs(self) -> None:
+        surrogate = _make_scenario().fit_surrogate(
+            _PARAMETERS, _BOUNDS, ["x"], reduction="final", until=10, seed=0
+        )
+        # final x = 10 * growth * boost is exactly quadratic
+        predicted = surrogate.predict([[1.5, 2.0, 3.0], [0.5, 1.0, 9.0]])
+        np.testing.assert_allclose(predicted[:, 0], [30.0, 5.0], atol=1e-8)
+        assert surrogate.validation["x"]["rmse"] < 1e-8
+        assert surrogate.validation["x"]["r2"] == pytest.approx(1.0)
+
+    def test_sobol_indices(self) -> None:
+        surrogate = fit_surrogate(
+            _make_scenario(), _PARAMETERS, _BOUNDS, ["x"], until=10, seed=1
+        )
+        indices = surrogate.sobol_indices()["x"]
+        assert indices["unused"]["total"] == pytest.approx(0.0, abs=1e-10)
+        assert indices["growth"]["first"] > indices["boost"]["first"] > 0
+        # the growth-boost interaction only appears in the total indices
+        assert indices["growth"]["total"] > indices["growth"]["first"]
+
+    def test_fit_targets(self) -> None:
+        parameters = _PARAMETERS[:1]
+        surrogate = fit_surrogate(
+            _make_scenario(),
+            parameters,
+            _BOUNDS[:1],
+            ["x"],
+            reduction="final",
+            until=10,
+            seed=2,
+        )
+        fitted = surrogate.fit_targets({"x": 12.0})
+        assert fitted["growth"] == pytest.approx(1.2)
+        with pytest.raises(ValueError, match="Unknown surrogate outputs"):
+            surrogate.fit_targets({"y": 1.0})
+
+    def test_requires_enough_samples(self) -> None:
+        with pytest.raises(ValueError, match="at least 10 samples"):
+            fit_surrogate(
+                _make_scenario(), _PARAMETERS, _BOUNDS, ["x"], num_samples=5
+            )
+
+    def test_unknown_parameter(self) -> None:
+        with pytest.raises(ValueError, match="gamma"):
+            fit_surrogate(
+                _make_scenario(),
+                [{"component": "auxiliaries", "name": "gamma"}],
+                [(0.0, 1.0)],
+                ["x"],
+            )
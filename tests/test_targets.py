@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.calibration.targets import CalibrationTargets
+
+
+class TestCalibrationTargets:
+    def test_rows_align_to_steps_without_time_column(self) -> None:
+        data = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+        targets = CalibrationTargets(data, ["a", "b"])
+        assert targets.stock_names == ["a"]
+        np.testing.assert_array_equal(targets.steps, [0, 1, 2])
+        assert targets.num_steps == 3
+
+    def test_time_column_maps_to_steps(self) -> None:
+        data = pd.DataFrame({"year": [1845, 1847, 1850], "a": [1.0, 2.0, 3.0]})
+        targets = CalibrationTargets(
+            data, ["a"], dt=0.5, time_column="year", time_origin=1845
+        )
+        np.testing.assert_array_equal(targets.steps, [0, 4, 10])
+        assert targets.observed_steps == {0, 4, 10}
+
+        recorded = np.array([[10.0, 20.0, 30.0]])
+        np.testing.assert_allclose(
+            targets.residuals(targets.align(recorded)), [[9.0, 18.0, 27.0]]
+        )
+
+    def test_missing_observations_and_weights(self) -> None:
+        data = pd.DataFrame({"a": [1.0, np.nan], "b": [2.0, 2.0]})
+        targets = CalibrationTargets(data, ["a", "b"], weights={"b": 4.0})
+        residuals = targets.residuals(np.array([[2.0, 100.0], [3.0, 3.0]]))
+        np.testing.assert_allclose(residuals, [[1.0, 0.0], [2.0, 2.0]])
+        assert targets.values.mask.tolist() == [[False, True], [False, False]]
+
+    def test_legacy_positional_columns(self) -> None:
+        data = pd.DataFrame({"Predator": [1.0], "Prey": [2.0]})
+        targets = CalibrationTargets(data, ["predator", "prey"])
+        assert targets.stock_names == ["predator", "prey"]
+
+    def test_unknown_stock_column(self) -> None:
+        data = pd.DataFrame({"a": [1.0], "z": [2.0]})
+        with pytest.raises(ValueError, match="Unknown stocks"):
+            CalibrationTargets(data, ["a", "b"])
+
+    def test_time_origin_defaults_to_simulation_start(self) -> None:
+        data = pd.DataFrame({"t": [5.0, 7.0], "a": [1.0, 2.0]})
+        targets = CalibrationTargets(data, ["a"], time_column="t")
+        np.testing.assert_array_equal(targets.steps, [5, 7])
+
+    def test_times_before_origin(self) -> None:
+        data = pd.DataFrame({"t": [1.0, 2.0], "a": [1.0, 2.0]})
+        with pytest.raises(ValueError, match="precede"):
+            CalibrationTargets(data, ["a"], time_column="t", time_origin=2.0)